@@ -5,32 +5,77 @@ MVP Version with basic dashboard, activity logging, and settings
 import customtkinter as ctk
 from tkinter import messagebox
 from datetime import datetime
-from typing import Dict, Any
-import pandas as pd
+from typing import Dict, Any, Callable, Optional, List, Tuple
+import pandas as pd
 
+from background import BackgroundTaskRunner
+from instrumentation import instrumented
+from virtual_list import VirtualCardList
 from data_handler import TrackerDataManager, UserDataManager
 from utils import DateTimeHelper, StatisticsCalculator
 from config import APP_NAME, GREETINGS, MOTIVATIONAL_MESSAGES
-from trackers.student_trackers import get_student_trackers
-from trackers.adult_trackers import get_adult_trackers
-from trackers.senior_trackers import get_senior_trackers
-
-
+from trackers.registry import get_role_trackers
+from storage import StorageBackend
+
+
+def summarize_range(tracker_manager: TrackerDataManager, start_date: str, end_date: str) -> Optional[Dict]:
+    """Completion summary of a date range, None if nothing was logged"""
+    activities = tracker_manager.get_activities_by_date_range(start_date, end_date)
+    if activities.empty:
+        return None
+    return StatisticsCalculator.summarize_activities(activities)
+
+
+def preload_session(user_data: Dict[str, Any], backend: Optional[StorageBackend] = None) -> Dict[str, Any]:
+    """
+    Load what the main window needs first, off the Tk thread
+
+    Called right after a successful login: parses the user's activity
+    history into the tracker manager's cache and computes the streak and
+    today's summary, so MainApplication(user_data, preload=...) can show
+    the dashboard without reading anything.
+    """
+    tracker_manager = TrackerDataManager(user_data['username'], backend)
+    today = datetime.now().strftime("%Y-%m-%d")
+    return {
+        "tracker_manager": tracker_manager,
+        "user_manager": UserDataManager(backend=backend),
+        "available_trackers": list(get_role_trackers(user_data['role'])),
+        "streak": tracker_manager.calculate_streak(),
+        "today_summary": (today, summarize_range(tracker_manager, today, today)),
+    }
+
+
+@instrumented(prefixes=("show_", "build_", "refresh_", "fill_"))
 class MainApplication:
     """Main application window with dashboard"""
     
-    def __init__(self, user_data: Dict[str, Any]):
-        """Initialize main application"""
+    TRACKER_CARD_HEIGHT = 150  # activity logger row height (card + gap)
+    
+    def __init__(self, user_data: Dict[str, Any], preload: Optional[Dict[str, Any]] = None):
+        """
+        Initialize main application
+        
+        Args:
+            preload: State from preload_session(user_data); without it the
+                managers are created here and the first page loads its data
+        """
         self.user_data = user_data
         self.username = user_data['username']
         self.role = user_data['role']
         
+        # Preloaded streak/summary are used once, by the first refresh
+        self.preloaded = dict(preload or {})
+        
         # Data managers
-        self.tracker_manager = TrackerDataManager(self.username)
-        self.user_manager = UserDataManager()
+        self.tracker_manager = self.preloaded.pop("tracker_manager", None) or TrackerDataManager(self.username)
+        self.user_manager = self.preloaded.pop("user_manager", None) or UserDataManager()
         
         # Load role-specific trackers
-        self.load_role_trackers()
+        if "available_trackers" in self.preloaded:
+            self.available_trackers = self.preloaded.pop("available_trackers")
+        else:
+            self.load_role_trackers()
         
         # Create main window
         self.root = ctk.CTk()
@@ -82,27 +127,31 @@ class MainApplication:
             self.current_theme = "light"
         self.palette = self.palettes[self.current_theme]
         ctk.set_appearance_mode(self.current_theme)
-        self.root.configure(fg_color=self.palette["bg"])
-        self.root.minsize(1100, 700)
+        self.root.configure(fg_color=self.palette["bg"])
+        self.root.minsize(1100, 700)
         
-        # Current page
-        self.current_content_frame = None
-        self.current_page = "dashboard"
+        # Widgets colored from the palette, restyled in place on theme change
+        self.themed_widgets: List[Tuple[Any, Dict[str, str]]] = []
+        
+        # Current page (built pages are cached and only hidden/shown)
+        self.current_content_frame = None
+        self.current_page = "dashboard"
+        self.pages: Dict[str, Any] = {}
+        self.page_data_keys: Dict[str, Any] = {}
+        self.data_version = 0
+        
+        # Background loading (page_token changes whenever the page is left)
+        self.tasks = BackgroundTaskRunner(self.root)
+        self.page_token = 0
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
         
         # Create UI
         self.create_main_layout()
         self.show_dashboard()
     
     def load_role_trackers(self):
-        """Load trackers based on user role"""
-        if self.role == "student":
-            self.available_trackers = get_student_trackers()
-        elif self.role == "adult":
-            self.available_trackers = get_adult_trackers()
-        elif self.role == "senior":
-            self.available_trackers = get_senior_trackers()
-        else:
-            self.available_trackers = []
+        """Load trackers based on user role (shared catalog definitions)"""
+        self.available_trackers = list(get_role_trackers(self.role))
     
     def create_main_layout(self):
         """Create main application layout"""
@@ -110,7 +159,7 @@ class MainApplication:
         self.create_top_bar()
         
         # Main content area
-        self.content_container = ctk.CTkFrame(self.root, fg_color=self.palette["bg"])
+        self.content_container = self.themed(ctk.CTkFrame(self.root), fg_color="bg")
         self.content_container.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
         # Bottom navigation
@@ -118,12 +167,11 @@ class MainApplication:
     
     def create_top_bar(self):
         """Create top navigation bar"""
-        top_bar = ctk.CTkFrame(
+        top_bar = self.themed(ctk.CTkFrame(
             self.root,
             height=80,
-            corner_radius=0,
-            fg_color=self.palette["accent"]
-        )
+            corner_radius=0
+        ), fg_color="accent")
         top_bar.pack(fill="x", padx=0, pady=0)
 
         left_frame = ctk.CTkFrame(top_bar, fg_color="transparent")
@@ -160,26 +208,37 @@ class MainApplication:
         )
         date_label.pack(anchor="e")
 
-        streak = self.tracker_manager.calculate_streak()
-        if streak > 0:
-            streak_label = ctk.CTkLabel(
-                right_frame,
-                text=f"{streak} Day Streak",
-                font=self.fonts["small"],
-                text_color="white"
-            )
-            streak_label.pack(anchor="e")
-
-    def create_bottom_nav(self):
-        """Create bottom navigation bar"""
-        nav_bar = ctk.CTkFrame(
-            self.root,
-            height=70,
-            corner_radius=0,
-            fg_color=self.palette["card"],
-            border_width=1,
-            border_color=self.palette["border"]
-        )
+        self.streak_label = ctk.CTkLabel(
+            right_frame,
+            text="",
+            font=self.fonts["small"],
+            text_color="white"
+        )
+        self.streak_label.pack(anchor="e")
+        self.refresh_streak()
+
+    def refresh_streak(self):
+        """Load the current streak in the background and show it in the top bar"""
+        def show_streak(streak: int):
+            self.streak_label.configure(text=f"{streak} Day Streak" if streak > 0 else "")
+
+        if "streak" in self.preloaded:
+            show_streak(self.preloaded.pop("streak"))
+            return
+        self.tasks.submit(
+            self.tracker_manager.calculate_streak,
+            on_done=show_streak,
+            is_current=self.streak_label.winfo_exists
+        )
+
+    def create_bottom_nav(self):
+        """Create bottom navigation bar"""
+        nav_bar = self.themed(ctk.CTkFrame(
+            self.root,
+            height=70,
+            corner_radius=0,
+            border_width=1
+        ), fg_color="card", border_color="border")
         nav_bar.pack(fill="x", side="bottom", padx=0, pady=0)
 
         # Navigation buttons
@@ -191,116 +250,208 @@ class MainApplication:
         ]
 
         for text, command in buttons:
-            btn = ctk.CTkButton(
+            btn = self.themed(ctk.CTkButton(
                 nav_bar,
                 text=text,
                 command=command,
                 width=220,
                 height=46,
                 font=self.fonts["nav"],
-                fg_color=self.palette["card"],
-                text_color=self.palette["text"],
-                hover_color=self.palette["input_bg"],
-                border_width=1,
-                border_color=self.palette["border"]
-            )
-            btn.pack(side="left", expand=True, padx=8, pady=10)
-
-    def apply_theme(self, mode: str, refresh: bool = True):
-        """Apply theme colors and optionally rebuild the UI."""
-        if mode not in self.palettes:
-            mode = "light"
-        self.current_theme = mode
-        self.palette = self.palettes[mode]
-        ctk.set_appearance_mode(mode)
-        self.root.configure(fg_color=self.palette["bg"])
-        if refresh:
-            self.rebuild_layout()
-
-    def rebuild_layout(self):
-        """Rebuild layout after theme changes."""
-        for child in self.root.winfo_children():
-            child.destroy()
-        self.current_content_frame = None
-        self.create_main_layout()
-        self.show_current_page()
-
-    def show_current_page(self):
-        """Restore the currently active page after a rebuild."""
-        if self.current_page == "activity":
-            self.show_activity_logger()
-        elif self.current_page == "statistics":
-            self.show_statistics()
-        elif self.current_page == "settings":
-            self.show_settings()
-        else:
-            self.show_dashboard()
-
-    def handle_theme_change(self, mode: str):
-        """Persist and apply a theme change."""
-        if mode == self.current_theme:
-            return
-        self.user_data["theme"] = mode
-        self.user_manager.update_user_profile(self.username, {"theme": mode})
-        self.apply_theme(mode, refresh=True)
-
-    def make_card(self, parent, corner_radius: int = 16):
-        """Create a styled card frame"""
-        return ctk.CTkFrame(
-            parent,
-            fg_color=self.palette["card"],
+                border_width=1
+            ), fg_color="card", text_color="text", hover_color="input_bg", border_color="border")
+            btn.pack(side="left", expand=True, padx=8, pady=10)
+
+    def themed(self, widget, **roles):
+        """
+        Color widget options from the palette and remember them for theme changes
+        
+        Args:
+            widget: Any CTk widget
+            roles: Widget option -> palette key (e.g. text_color="muted")
+        """
+        widget.configure(**{option: self.palette[key] for option, key in roles.items()})
+        self.themed_widgets.append((widget, roles))
+        return widget
+
+    def apply_theme(self, mode: str, refresh: bool = True):
+        """Apply theme colors and optionally restyle the existing widgets in place."""
+        if mode not in self.palettes:
+            mode = "light"
+        self.current_theme = mode
+        self.palette = self.palettes[mode]
+        ctk.set_appearance_mode(mode)
+        self.root.configure(fg_color=self.palette["bg"])
+        if refresh:
+            self.restyle_widgets()
+
+    def restyle_widgets(self):
+        """Recolor every registered widget with the current palette."""
+        alive = []
+        for widget, roles in self.themed_widgets:
+            if widget.winfo_exists():
+                widget.configure(**{option: self.palette[key] for option, key in roles.items()})
+                alive.append((widget, roles))
+        self.themed_widgets = alive
+
+    def handle_theme_change(self, mode: str):
+        """Persist and apply a theme change."""
+        if mode == self.current_theme:
+            return
+        self.user_data["theme"] = mode
+        self.user_manager.update_user_profile(self.username, {"theme": mode})
+        self.apply_theme(mode, refresh=True)
+
+    def invalidate_page_tasks(self):
+        """Mark background results requested by the current page as stale"""
+        self.page_token += 1
+        self.tasks.cancel_stale()
+
+    def load_for_page(self, func: Callable, *args, on_done: Callable[[Any], None]):
+        """Run func(*args) off the Tk thread; on_done only runs if the page is still shown"""
+        token = self.page_token
+        self.tasks.submit(func, *args, on_done=on_done, is_current=lambda: token == self.page_token)
+
+    def make_skeleton(self, parent, text: str = "Loading..."):
+        """Placeholder shown in a card until its data arrives"""
+        skeleton = ctk.CTkFrame(parent, fg_color="transparent")
+        skeleton.pack(fill="x", padx=20, pady=10)
+
+        self.themed(ctk.CTkLabel(
+            skeleton,
+            text=text,
+            font=self.fonts["body"]
+        ), text_color="muted").pack(pady=(0, 8))
+
+        bar = self.themed(ctk.CTkProgressBar(
+            skeleton,
+            width=600,
+            height=10,
+            mode="indeterminate"
+        ), fg_color="border", progress_color="accent")
+        bar.pack()
+        bar.start()
+        return skeleton
+
+    def make_card(self, parent, corner_radius: int = 16):
+        """Create a styled card frame"""
+        return self.themed(ctk.CTkFrame(
+            parent,
             corner_radius=corner_radius,
-            border_width=1,
-            border_color=self.palette["border"]
-        )
+            border_width=1
+        ), fg_color="card", border_color="border")
+    
+    def make_label(self, parent, text: str, font: str, color: str = "text", **kwargs):
+        """Create a themed label (color is a palette key)"""
+        return self.themed(ctk.CTkLabel(parent, text=text, font=self.fonts[font], **kwargs), text_color=color)
     
-    def clear_content(self):
-        """Clear current content frame"""
-        for child in self.content_container.winfo_children():
+    def clear_area(self, frame):
+        """Destroy the widgets inside a page area that gets refilled"""
+        for child in frame.winfo_children():
             child.destroy()
-        self.current_content_frame = None
+        self.themed_widgets = [(widget, roles) for widget, roles in self.themed_widgets if widget.winfo_exists()]
     
-    def show_dashboard(self):
-        """Display main dashboard"""
-        self.current_page = "dashboard"
-        self.clear_content()
-
-        self.current_content_frame = ctk.CTkScrollableFrame(self.content_container, fg_color="transparent")
-        self.current_content_frame.pack(fill="both", expand=True)
+    def data_key(self):
+        """Identifies the data a page was filled with (changes on save and at midnight)"""
+        return (self.data_version, datetime.now().strftime("%Y-%m-%d"))
+    
+    def show_page(self, name: str, build: Callable[[Any], None], refresh: Optional[Callable[[], None]] = None,
+                  scrollable: bool = True):
+        """
+        Show a page from the page cache
+        
+        The page is built once into its own frame; later visits only hide the
+        current frame and pack the cached one. refresh (if given) reloads the
+        page's data areas when the data changed since they were filled.
+        Pages that scroll on their own pass scrollable=False.
+        """
+        self.invalidate_page_tasks()
+        if self.current_content_frame is not None:
+            self.current_content_frame.pack_forget()
+        self.current_page = name
+
+        page = self.pages.get(name)
+        if page is None:
+            frame_type = ctk.CTkScrollableFrame if scrollable else ctk.CTkFrame
+            page = frame_type(self.content_container, fg_color="transparent")
+            build(page)
+            self.pages[name] = page
+        page.pack(fill="both", expand=True)
+        self.current_content_frame = page
+
+        if refresh is not None and self.page_data_keys.get(name) != self.data_key():
+            refresh()
+    
+    def show_dashboard(self):
+        """Display main dashboard"""
+        self.show_page("dashboard", self.build_dashboard, self.refresh_dashboard)
 
+    def build_dashboard(self, page):
+        """Build the dashboard page (data areas are filled by refresh_dashboard)"""
         # Overall Progress Section
-        progress_frame = self.make_card(self.current_content_frame)
+        progress_frame = self.make_card(page)
         progress_frame.pack(fill="x", padx=20, pady=10)
 
-        ctk.CTkLabel(
-            progress_frame,
-            text="Today's Progress",
-            font=self.fonts["section"],
-            text_color=self.palette["text"]
-        ).pack(pady=10)
+        self.make_label(progress_frame, "Today's Progress", "section").pack(pady=10)
+        self.dashboard_progress_area = ctk.CTkFrame(progress_frame, fg_color="transparent")
+        self.dashboard_progress_area.pack(fill="x")
 
-        # Get today's data
-        today_str = datetime.now().strftime("%Y-%m-%d")
-        activities = self.tracker_manager.get_activities_by_date(today_str)
+        # Quick Stats
+        stats_frame = self.make_card(page)
+        stats_frame.pack(fill="x", padx=20, pady=10)
+
+        self.make_label(stats_frame, "Quick Stats", "section").pack(pady=10)
+        self.dashboard_stats_area = ctk.CTkFrame(stats_frame, fg_color="transparent")
+        self.dashboard_stats_area.pack(fill="x")
+
+        # Available Trackers Section
+        trackers_frame = self.make_card(page)
+        trackers_frame.pack(fill="x", padx=20, pady=10)
+
+        self.make_label(trackers_frame, "Your Trackers", "section").pack(pady=10)
+
+        for tracker in self.available_trackers[:6]:  # Show first 6
+            tracker_card = self.make_card(trackers_frame, corner_radius=12)
+            tracker_card.pack(fill="x", padx=10, pady=5)
+
+            self.make_label(tracker_card, tracker.name, "body_bold").pack(side="left", padx=10, pady=8)
+            self.make_label(tracker_card, tracker.description, "small", "muted").pack(side="left", padx=10, pady=8)
+
+    def refresh_dashboard(self):
+        """Reload today's progress off the Tk thread, showing skeletons meanwhile"""
+        key = self.data_key()
+        preloaded_day, summary = self.preloaded.pop("today_summary", (None, None))
+        if preloaded_day == key[1]:
+            self.fill_dashboard(key, summary)
+            return
+
+        for area in (self.dashboard_progress_area, self.dashboard_stats_area):
+            self.clear_area(area)
+        self.make_skeleton(self.dashboard_progress_area, "Loading today's progress...")
+        self.make_skeleton(self.dashboard_stats_area, "Loading today's activities...")
+
+        today_str = key[1]
+        self.load_for_page(
+            self.load_range_summary, today_str, today_str,
+            on_done=lambda summary: self.fill_dashboard(key, summary)
+        )
 
-        if not activities.empty:
-            # Calculate completion
-            total_completion = 0
-            for _, activity in activities.iterrows():
-                if activity['goal'] > 0:
-                    completion = min(100, (float(activity['value']) / float(activity['goal'])) * 100)
-                    total_completion += completion
+    def fill_dashboard(self, key, summary: Optional[Dict]):
+        """Replace the dashboard skeletons with today's progress"""
+        progress_area = self.dashboard_progress_area
+        stats_area = self.dashboard_stats_area
+        for area in (progress_area, stats_area):
+            self.clear_area(area)
+        self.page_data_keys["dashboard"] = key
 
-            avg_completion = total_completion / len(activities) if len(activities) > 0 else 0
+        if summary is not None:
+            avg_completion = summary["avg_completion"]
 
             # Progress bar
-            progress_bar = ctk.CTkProgressBar(
-                progress_frame,
+            progress_bar = self.themed(ctk.CTkProgressBar(
+                progress_area,
                 width=600,
-                height=26,
-                fg_color=self.palette["border"],
-                progress_color=self.palette["accent"]
-            )
+                height=26
+            ), fg_color="border", progress_color="accent")
             progress_bar.pack(pady=10)
             progress_bar.set(avg_completion / 100)
 
@@ -309,225 +460,203 @@ class MainApplication:
             messages = MOTIVATIONAL_MESSAGES.get(category, ["Keep going!"])
             message = messages[0]
 
-            ctk.CTkLabel(
-                progress_frame,
-                text=f"{avg_completion:.1f}% Complete - {message}",
-                font=self.fonts["body"],
-                text_color=self.palette["text"]
-            ).pack(pady=10)
+            self.make_label(progress_area, f"{avg_completion:.1f}% Complete - {message}", "body").pack(pady=10)
         else:
-            ctk.CTkLabel(
-                progress_frame,
-                text="No activities logged today. Start tracking your habits!",
-                font=self.fonts["body"],
-                text_color=self.palette["muted"]
+            self.make_label(
+                progress_area, "No activities logged today. Start tracking your habits!", "body", "muted"
             ).pack(pady=20)
 
-        # Quick Stats
-        stats_frame = self.make_card(self.current_content_frame)
-        stats_frame.pack(fill="x", padx=20, pady=10)
-
-        ctk.CTkLabel(
-            stats_frame,
-            text="Quick Stats",
-            font=self.fonts["section"],
-            text_color=self.palette["text"]
-        ).pack(pady=10)
-
         # Display tracker summary
-        if not activities.empty:
-            for _, activity in activities.head(5).iterrows():
-                tracker_frame = self.make_card(stats_frame, corner_radius=12)
+        if summary is not None:
+            for tracker_name, activity in summary["by_tracker"].head(5).iterrows():
+                tracker_frame = self.make_card(stats_area, corner_radius=12)
                 tracker_frame.pack(fill="x", padx=10, pady=5)
 
-                name_label = ctk.CTkLabel(
-                    tracker_frame,
-                    text=f"{activity['tracker_name']}",
-                    font=self.fonts["body_bold"],
-                    text_color=self.palette["text"]
-                )
-                name_label.pack(side="left", padx=10, pady=8)
+                self.make_label(tracker_frame, f"{tracker_name}", "body_bold").pack(side="left", padx=10, pady=8)
 
                 value_text = f"{activity['value']} / {activity['goal']} {activity['unit']}"
-                value_label = ctk.CTkLabel(
-                    tracker_frame,
-                    text=value_text,
-                    font=self.fonts["body"],
-                    text_color=self.palette["muted"]
-                )
-                value_label.pack(side="right", padx=10, pady=8)
-
-        # Available Trackers Section
-        trackers_frame = self.make_card(self.current_content_frame)
-        trackers_frame.pack(fill="x", padx=20, pady=10)
-
-        ctk.CTkLabel(
-            trackers_frame,
-            text="Your Trackers",
-            font=self.fonts["section"],
-            text_color=self.palette["text"]
-        ).pack(pady=10)
-
-        for tracker in self.available_trackers[:6]:  # Show first 6
-            tracker_card = self.make_card(trackers_frame, corner_radius=12)
-            tracker_card.pack(fill="x", padx=10, pady=5)
-
-            ctk.CTkLabel(
-                tracker_card,
-                text=tracker.name,
-                font=self.fonts["body_bold"],
-                text_color=self.palette["text"]
-            ).pack(side="left", padx=10, pady=8)
+                self.make_label(tracker_frame, value_text, "body", "muted").pack(side="right", padx=10, pady=8)
 
-            ctk.CTkLabel(
-                tracker_card,
-                text=tracker.description,
-                font=self.fonts["small"],
-                text_color=self.palette["muted"]
-            ).pack(side="left", padx=10, pady=8)
-
-    def show_activity_logger(self):
-        """Display activity logging page"""
-        self.current_page = "activity"
-        self.clear_content()
-
-        self.current_content_frame = ctk.CTkScrollableFrame(self.content_container, fg_color="transparent")
-        self.current_content_frame.pack(fill="both", expand=True)
+    def show_activity_logger(self):
+        """Display activity logging page"""
+        self.show_page("activity", self.build_activity_logger, self.reset_activity_inputs, scrollable=False)
 
+    def build_activity_logger(self, page):
+        """Build the activity logging page"""
         # Header
-        header = ctk.CTkLabel(
-            self.current_content_frame,
-            text=f"Log Today's Activities - {datetime.now().strftime('%B %d, %Y')}",
-            font=self.fonts["title"],
-            text_color=self.palette["text"]
-        )
-        header.pack(pady=20)
-
-        # Create input forms for each tracker
-        self.tracker_inputs = {}
-
-        for tracker in self.available_trackers:
-            tracker_frame = self.make_card(self.current_content_frame)
-            tracker_frame.pack(fill="x", padx=20, pady=10)
+        self.activity_header = self.make_label(page, "", "title")
+        self.activity_header.pack(pady=20)
 
-            # Tracker title
-            title_label = ctk.CTkLabel(
-                tracker_frame,
-                text=tracker.name,
-                font=self.fonts["section"],
-                text_color=self.palette["text"]
-            )
-            title_label.pack(anchor="w", padx=15, pady=10)
-
-            # Description
-            desc_label = ctk.CTkLabel(
-                tracker_frame,
-                text=tracker.description,
-                font=self.fonts["small"],
-                text_color=self.palette["muted"]
-            )
-            desc_label.pack(anchor="w", padx=15, pady=(0, 5))
-
-            # Input based on tracker type
-            if tracker.tracker_type == "duration" or tracker.tracker_type == "counter" or tracker.tracker_type == "numeric":
-                input_frame = ctk.CTkFrame(tracker_frame, fg_color="transparent")
-                input_frame.pack(anchor="w", padx=15, pady=10)
-
-                entry = ctk.CTkEntry(
-                    input_frame,
-                    placeholder_text="Enter value",
-                    placeholder_text_color=self.palette["muted"],
-                    fg_color=self.palette["input_bg"],
-                    border_color=self.palette["border"],
-                    text_color=self.palette["text"],
-                    width=200,
-                    height=35,
-                    font=self.fonts["body"]
-                )
-                entry.pack(side="left", padx=5)
-
-                ctk.CTkLabel(
-                    input_frame,
-                    text=tracker.unit,
-                    font=self.fonts["body"],
-                    text_color=self.palette["text"]
-                ).pack(side="left", padx=5)
-
-                ctk.CTkLabel(
-                    input_frame,
-                    text=f"Goal: {tracker.goal} {tracker.unit}",
-                    font=self.fonts["small"],
-                    text_color=self.palette["muted"]
-                ).pack(side="left", padx=15)
-
-                self.tracker_inputs[tracker.name] = {"widget": entry, "type": tracker.tracker_type, "tracker": tracker}
-
-            elif tracker.tracker_type == "checkbox":
-                var = ctk.BooleanVar()
-                checkbox = ctk.CTkCheckBox(
-                    tracker_frame,
-                    text="Completed",
-                    variable=var,
-                    font=self.fonts["body_bold"],
-                    text_color=self.palette["text"]
-                )
-                checkbox.pack(anchor="w", padx=15, pady=10)
-
-                self.tracker_inputs[tracker.name] = {"widget": checkbox, "var": var, "type": "checkbox", "tracker": tracker}
-
-            elif tracker.tracker_type == "rating":
-                input_frame = ctk.CTkFrame(tracker_frame, fg_color="transparent")
-                input_frame.pack(anchor="w", padx=15, pady=10)
-
-                var = ctk.IntVar(value=3)
-
-                ctk.CTkLabel(
-                    input_frame,
-                    text="Rating:",
-                    font=self.fonts["body"],
-                    text_color=self.palette["text"]
-                ).pack(side="left", padx=5)
-
-                for i in range(1, int(tracker.max_value) + 1):
-                    ctk.CTkRadioButton(
-                        input_frame,
-                        text=str(i),
-                        variable=var,
-                        value=i,
-                        font=self.fonts["body"],
-                        text_color=self.palette["text"]
-                    ).pack(side="left", padx=3)
-
-                self.tracker_inputs[tracker.name] = {"var": var, "type": "rating", "tracker": tracker}
-
-        # Save button
-        save_btn = ctk.CTkButton(
-            self.current_content_frame,
+        # Save button (packed first so the tracker list fills the space above it)
+        save_btn = self.themed(ctk.CTkButton(
+            page,
             text="Save All Activities",
             command=self.save_activities,
             width=300,
             height=50,
             font=self.fonts["section"],
-            fg_color=self.palette["success"],
-            hover_color=self.palette["success_dark"],
             text_color="white"
+        ), fg_color="success", hover_color="success_dark")
+        save_btn.pack(side="bottom", pady=30)
+
+        # Input state per tracker lives in Tk variables, cards only display it
+        self.logged_trackers = [tracker for tracker in self.available_trackers if self.tracker_card_kind(tracker)]
+        self.tracker_inputs = {}
+        for tracker in self.logged_trackers:
+            if tracker.tracker_type == "checkbox":
+                var = ctk.BooleanVar(value=False)
+            elif tracker.tracker_type == "rating":
+                var = ctk.IntVar(value=3)
+            else:
+                var = ctk.StringVar()
+            self.tracker_inputs[tracker.name] = {"var": var, "type": tracker.tracker_type, "tracker": tracker}
+
+        # Only cards in or near the viewport exist, reused while scrolling
+        self.tracker_list = VirtualCardList(
+            page,
+            row_height=self.TRACKER_CARD_HEIGHT,
+            create_card=self.create_tracker_card,
+            bind_card=self.bind_tracker_card,
+            kind_of=lambda index: self.tracker_card_kind(self.logged_trackers[index])
         )
-        save_btn.pack(pady=30)
+        self.themed(self.tracker_list.canvas, bg="bg")
+        self.tracker_list.pack(fill="both", expand=True)
+        self.tracker_list.set_count(len(self.logged_trackers))
+
+    @staticmethod
+    def tracker_card_kind(tracker) -> Optional[str]:
+        """Card layout used for a tracker (None if it has no input form)"""
+        if tracker.tracker_type in ("duration", "counter", "numeric"):
+            return "entry"
+        if tracker.tracker_type in ("checkbox", "rating"):
+            return tracker.tracker_type
+        return None
+
+    def create_tracker_card(self, parent, kind: str):
+        """Build an empty tracker card of a kind (filled by bind_tracker_card)"""
+        tracker_frame = self.themed(self.make_card(parent), bg_color="bg")
+
+        # Tracker title
+        tracker_frame.title_label = self.make_label(tracker_frame, "", "section")
+        tracker_frame.title_label.pack(anchor="w", padx=15, pady=10)
+
+        # Description
+        tracker_frame.desc_label = self.make_label(tracker_frame, "", "small", "muted", wraplength=900, justify="left")
+        tracker_frame.desc_label.pack(anchor="w", padx=15, pady=(0, 5))
+
+        # Input based on tracker type
+        if kind == "entry":
+            input_frame = ctk.CTkFrame(tracker_frame, fg_color="transparent")
+            input_frame.pack(anchor="w", padx=15, pady=10)
+
+            # No textvariable: CTkEntry only shows its placeholder without one,
+            # so edits are copied into the bound tracker's variable instead
+            # (after_idle: the Entry class bindings insert pasted text after ours)
+            tracker_frame.entry = self.themed(ctk.CTkEntry(
+                input_frame,
+                placeholder_text="Enter value",
+                width=200,
+                height=35,
+                font=self.fonts["body"]
+            ), placeholder_text_color="muted", fg_color="input_bg", border_color="border", text_color="text")
+            tracker_frame.entry.pack(side="left", padx=5)
+            for sequence in ("<KeyRelease>", "<FocusOut>", "<<Paste>>", "<<PasteSelection>>", "<<Cut>>"):
+                tracker_frame.entry.bind(
+                    sequence, lambda event: tracker_frame.after_idle(self.sync_tracker_entry, tracker_frame))
+
+            tracker_frame.unit_label = self.make_label(input_frame, "", "body")
+            tracker_frame.unit_label.pack(side="left", padx=5)
+            tracker_frame.goal_label = self.make_label(input_frame, "", "small", "muted")
+            tracker_frame.goal_label.pack(side="left", padx=15)
+
+        elif kind == "checkbox":
+            tracker_frame.checkbox = self.themed(ctk.CTkCheckBox(
+                tracker_frame,
+                text="Completed",
+                font=self.fonts["body_bold"]
+            ), text_color="text")
+            tracker_frame.checkbox.pack(anchor="w", padx=15, pady=10)
+
+        elif kind == "rating":
+            tracker_frame.input_frame = ctk.CTkFrame(tracker_frame, fg_color="transparent")
+            tracker_frame.input_frame.pack(anchor="w", padx=15, pady=10)
+            self.make_label(tracker_frame.input_frame, "Rating:", "body").pack(side="left", padx=5)
+            tracker_frame.radios = []
+
+        return tracker_frame
+
+    @staticmethod
+    def sync_tracker_entry(tracker_frame):
+        """Copy an entry card's text into the tracker variable it shows"""
+        if hasattr(tracker_frame, "var"):
+            tracker_frame.var.set(tracker_frame.entry.get())
+
+    def bind_tracker_card(self, tracker_frame, index: int):
+        """Show a tracker in a pooled card and point its inputs at the tracker's variable"""
+        tracker = self.logged_trackers[index]
+        var = self.tracker_inputs[tracker.name]["var"]
+        tracker_frame.title_label.configure(text=tracker.name)
+        tracker_frame.desc_label.configure(text=tracker.description)
+
+        if hasattr(tracker_frame, "entry"):
+            tracker_frame.var = var
+            tracker_frame.entry.delete(0, "end")  # shows the placeholder when unfocused
+            if var.get():
+                tracker_frame.entry.insert(0, var.get())
+            tracker_frame.unit_label.configure(text=tracker.unit)
+            tracker_frame.goal_label.configure(text=f"Goal: {tracker.goal} {tracker.unit}")
+
+        elif hasattr(tracker_frame, "checkbox"):
+            tracker_frame.checkbox.configure(variable=var)
+
+        elif hasattr(tracker_frame, "radios"):
+            # Scales differ in length, radios are added on demand and hidden when unused
+            max_rating = int(tracker.max_value)
+            while len(tracker_frame.radios) < max_rating:
+                tracker_frame.radios.append(self.themed(ctk.CTkRadioButton(
+                    tracker_frame.input_frame,
+                    text=str(len(tracker_frame.radios) + 1),
+                    value=len(tracker_frame.radios) + 1,
+                    font=self.fonts["body"]
+                ), text_color="text"))
+            for i, radio in enumerate(tracker_frame.radios):
+                radio.pack_forget()
+                if i < max_rating:
+                    radio.configure(variable=var)
+                    radio.pack(side="left", padx=3)
+
+    def reset_activity_inputs(self):
+        """Start a fresh form (after a save, and when the day changes)"""
+        self.activity_header.configure(text=f"Log Today's Activities - {datetime.now().strftime('%B %d, %Y')}")
+        for input_data in self.tracker_inputs.values():
+            if input_data['type'] == 'checkbox':
+                input_data['var'].set(False)
+            elif input_data['type'] == 'rating':
+                input_data['var'].set(3)
+            else:
+                input_data['var'].set("")
+        self.tracker_list.refresh()
+        self.page_data_keys["activity"] = self.data_key()
 
     def save_activities(self):
         """Save all logged activities"""
         today_str = datetime.now().strftime("%Y-%m-%d")
-        saved_count = 0
+        pending = []
+        
+        # Edits an entry hasn't reported yet still count
+        for card in self.tracker_list.visible_cards():
+            if hasattr(card, "entry"):
+                self.sync_tracker_entry(card)
         
         for tracker_name, input_data in self.tracker_inputs.items():
             tracker = input_data['tracker']
             
             try:
                 if input_data['type'] in ['duration', 'counter', 'numeric']:
-                    value = input_data['widget'].get()
+                    value = input_data['var'].get()
                     if value and value.strip():
                         value = float(value)
-                        activity_data = {
+                        pending.append({
                             'date': today_str,
                             'tracker_type': tracker.tracker_type,
                             'tracker_name': tracker.name,
@@ -535,13 +664,11 @@ class MainApplication:
                             'goal': tracker.goal,
                             'unit': tracker.unit,
                             'completed': 'yes' if value >= tracker.goal else 'no'
-                        }
-                        self.tracker_manager.log_activity(activity_data)
-                        saved_count += 1
+                        })
                 
                 elif input_data['type'] == 'checkbox':
                     value = 1 if input_data['var'].get() else 0
-                    activity_data = {
+                    pending.append({
                         'date': today_str,
                         'tracker_type': 'checkbox',
                         'tracker_name': tracker.name,
@@ -549,13 +676,11 @@ class MainApplication:
                         'goal': 1,
                         'unit': 'boolean',
                         'completed': 'yes' if value == 1 else 'no'
-                    }
-                    self.tracker_manager.log_activity(activity_data)
-                    saved_count += 1
+                    })
                 
                 elif input_data['type'] == 'rating':
                     value = input_data['var'].get()
-                    activity_data = {
+                    pending.append({
                         'date': today_str,
                         'tracker_type': 'rating',
                         'tracker_name': tracker.name,
@@ -563,188 +688,171 @@ class MainApplication:
                         'goal': tracker.goal,
                         'unit': 'stars',
                         'completed': 'yes' if value >= tracker.goal else 'no'
-                    }
-                    self.tracker_manager.log_activity(activity_data)
-                    saved_count += 1
+                    })
             
             except Exception as e:
                 print(f"Error saving {tracker_name}: {e}")
         
+        # Persist everything in one write
+        results = self.tracker_manager.log_activities(pending)
+        saved_count = sum(results)
+        
         if saved_count > 0:
-            messagebox.showinfo("Success", f"Saved {saved_count} activities!")
+            message = f"Saved {saved_count} activities!"
+            unlocked = self.tracker_manager.achievements.last_unlocked
+            if unlocked:
+                names = ", ".join(f"{a['icon']} {a['name']}" for a in unlocked)
+                message += f"\n\nAchievement unlocked: {names}"
+            messagebox.showinfo("Success", message)
+            # Pages filled with older data reload on their next visit
+            self.data_version += 1
+            self.refresh_streak()
             self.show_dashboard()
         else:
             messagebox.showwarning("No Data", "No activities were logged. Please enter some values.")
     
-    def show_statistics(self):
-        """Display statistics page"""
-        self.current_page = "statistics"
-        self.clear_content()
-
-        self.current_content_frame = ctk.CTkScrollableFrame(self.content_container, fg_color="transparent")
-        self.current_content_frame.pack(fill="both", expand=True)
+    def show_statistics(self):
+        """Display statistics page"""
+        self.show_page("statistics", self.build_statistics, self.refresh_statistics)
 
+    def build_statistics(self, page):
+        """Build the statistics page (data area is filled by refresh_statistics)"""
         # Header
-        header = ctk.CTkLabel(
-            self.current_content_frame,
-            text="Your Statistics",
-            font=self.fonts["title"],
-            text_color=self.palette["text"]
-        )
+        header = self.make_label(page, "Your Statistics", "title")
         header.pack(pady=20)
 
+        self.statistics_area = ctk.CTkFrame(page, fg_color="transparent")
+        self.statistics_area.pack(fill="x")
+
+    def refresh_statistics(self):
+        """Reload the last 7 days off the Tk thread, showing a skeleton meanwhile"""
+        self.clear_area(self.statistics_area)
+        self.make_skeleton(self.statistics_area, "Loading your statistics...")
+
         # Get data for last 7 days
+        key = self.data_key()
         end_date = datetime.now()
         start_date = end_date - pd.Timedelta(days=6)
-
-        activities = self.tracker_manager.get_activities_by_date_range(
+        self.load_for_page(
+            self.load_range_summary,
             start_date.strftime("%Y-%m-%d"),
-            end_date.strftime("%Y-%m-%d")
+            end_date.strftime("%Y-%m-%d"),
+            on_done=lambda summary: self.fill_statistics(key, summary)
         )
 
-        if activities.empty:
-            ctk.CTkLabel(
-                self.current_content_frame,
-                text="No data available yet. Start logging your activities!",
-                font=self.fonts["body"],
-                text_color=self.palette["muted"]
+    def load_range_summary(self, start_date: str, end_date: str) -> Optional[Dict]:
+        """Completion summary of a date range (runs in the background)"""
+        return summarize_range(self.tracker_manager, start_date, end_date)
+
+    def fill_statistics(self, key, summary: Optional[Dict]):
+        """Replace the statistics skeleton with the 7-day summary"""
+        area = self.statistics_area
+        self.clear_area(area)
+        self.page_data_keys["statistics"] = key
+
+        if summary is None:
+            self.make_label(
+                area, "No data available yet. Start logging your activities!", "body", "muted"
             ).pack(pady=50)
             return
 
         # Summary statistics
-        summary_frame = self.make_card(self.current_content_frame)
+        summary_frame = self.make_card(area)
         summary_frame.pack(fill="x", padx=20, pady=10)
 
-        ctk.CTkLabel(
-            summary_frame,
-            text="7-Day Summary",
-            font=self.fonts["section"],
-            text_color=self.palette["text"]
-        ).pack(pady=10)
-
-        # Calculate stats
-        total_entries = len(activities)
-        completed = len(activities[activities['completed'] == 'yes'])
-        completion_rate = (completed / total_entries * 100) if total_entries > 0 else 0
-
-        stats_text = f"Total Activities: {total_entries}\n"
-        stats_text += f"Completed Goals: {completed}\n"
-        stats_text += f"Completion Rate: {completion_rate:.1f}%"
-
-        ctk.CTkLabel(
-            summary_frame,
-            text=stats_text,
-            font=self.fonts["body"],
-            text_color=self.palette["text"],
-            justify="left"
-        ).pack(pady=10, padx=20)
-
-    def show_settings(self):
-        """Display settings page"""
-        self.current_page = "settings"
-        self.clear_content()
-
-        self.current_content_frame = ctk.CTkScrollableFrame(self.content_container, fg_color="transparent")
-        self.current_content_frame.pack(fill="both", expand=True)
+        self.make_label(summary_frame, "7-Day Summary", "section").pack(pady=10)
+
+        stats_text = f"Total Activities: {summary['total']}\n"
+        stats_text += f"Completed Goals: {summary['completed']}\n"
+        stats_text += f"Completion Rate: {summary['completion_rate']:.1f}%"
+
+        self.make_label(summary_frame, stats_text, "body", justify="left").pack(pady=10, padx=20)
+
+    def show_settings(self):
+        """Display settings page"""
+        self.show_page("settings", self.build_settings)
 
+    def build_settings(self, page):
+        """Build the settings page"""
         # Header
-        header = ctk.CTkLabel(
-            self.current_content_frame,
-            text="Settings",
-            font=self.fonts["title"],
-            text_color=self.palette["text"]
-        )
+        header = self.make_label(page, "Settings", "title")
         header.pack(pady=20)
 
         # Profile section
-        profile_frame = self.make_card(self.current_content_frame)
+        profile_frame = self.make_card(page)
         profile_frame.pack(fill="x", padx=20, pady=10)
 
-        ctk.CTkLabel(
-            profile_frame,
-            text="Profile Information",
-            font=self.fonts["section"],
-            text_color=self.palette["text"]
-        ).pack(pady=10)
-
-        profile_text = f"Name: {self.user_data['first_name']} {self.user_data['last_name']}\n"
-        profile_text += f"Username: @{self.username}\n"
-        profile_text += f"Email: {self.user_data['email']}\n"
-        profile_text += f"Role: {self.role.title()}\n"
-
-        ctk.CTkLabel(
-            profile_frame,
-            text=profile_text,
-            font=self.fonts["body"],
-            text_color=self.palette["text"],
-            justify="left"
-        ).pack(pady=10, padx=20, anchor="w")
+        self.make_label(profile_frame, "Profile Information", "section").pack(pady=10)
+
+        profile_text = f"Name: {self.user_data['first_name']} {self.user_data['last_name']}\n"
+        profile_text += f"Username: @{self.username}\n"
+        profile_text += f"Email: {self.user_data['email']}\n"
+        profile_text += f"Role: {self.role.title()}\n"
+
+        self.make_label(profile_frame, profile_text, "body", justify="left").pack(pady=10, padx=20, anchor="w")
 
         # Theme selection
-        theme_frame = self.make_card(self.current_content_frame)
+        theme_frame = self.make_card(page)
         theme_frame.pack(fill="x", padx=20, pady=10)
 
-        ctk.CTkLabel(
-            theme_frame,
-            text="Appearance",
-            font=self.fonts["section"],
-            text_color=self.palette["text"]
-        ).pack(pady=10)
+        self.make_label(theme_frame, "Appearance", "section").pack(pady=10)
 
-        theme_var = ctk.StringVar(value=self.current_theme)
+        theme_var = ctk.StringVar(value=self.current_theme)
 
-        ctk.CTkLabel(
-            theme_frame,
-            text="Theme:",
-            font=self.fonts["body"],
-            text_color=self.palette["text"]
-        ).pack(pady=5)
+        self.make_label(theme_frame, "Theme:", "body").pack(pady=5)
 
         theme_options = ctk.CTkFrame(theme_frame, fg_color="transparent")
         theme_options.pack(pady=10)
 
-        ctk.CTkRadioButton(
-            theme_options,
-            text="Light",
-            variable=theme_var,
-            value="light",
-            command=lambda: self.handle_theme_change("light"),
-            font=self.fonts["body"],
-            text_color=self.palette["text"]
-        ).pack(side="left", padx=10)
-
-        ctk.CTkRadioButton(
-            theme_options,
-            text="Dark",
-            variable=theme_var,
-            value="dark",
-            command=lambda: self.handle_theme_change("dark"),
-            font=self.fonts["body"],
-            text_color=self.palette["text"]
-        ).pack(side="left", padx=10)
+        self.themed(ctk.CTkRadioButton(
+            theme_options,
+            text="Light",
+            variable=theme_var,
+            value="light",
+            command=lambda: self.handle_theme_change("light"),
+            font=self.fonts["body"]
+        ), text_color="text").pack(side="left", padx=10)
+
+        self.themed(ctk.CTkRadioButton(
+            theme_options,
+            text="Dark",
+            variable=theme_var,
+            value="dark",
+            command=lambda: self.handle_theme_change("dark"),
+            font=self.fonts["body"]
+        ), text_color="text").pack(side="left", padx=10)
 
         # Logout button
-        logout_btn = ctk.CTkButton(
-            self.current_content_frame,
+        logout_btn = self.themed(ctk.CTkButton(
+            page,
             text="Logout",
             command=self.logout,
             width=300,
             height=45,
             font=self.fonts["nav"],
-            fg_color=self.palette["error"],
-            hover_color=self.palette["error_dark"],
             text_color="white"
-        )
+        ), fg_color="error", hover_color="error_dark")
         logout_btn.pack(pady=30)
 
     def logout(self):
         """Logout and return to login screen"""
         if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+            self.tasks.shutdown()
+            # The login window reads the files, so coalesced saves must be on disk first
+            self.user_manager.backend.flush()
+            self.tracker_manager.backend.flush()
             self.root.destroy()
             from auth import AuthenticationApp
             auth_app = AuthenticationApp()
             auth_app.run()
     
+    def close(self):
+        """Close the window, dropping any background work and writing out coalesced saves"""
+        self.tasks.shutdown()
+        self.user_manager.backend.flush()
+        self.tracker_manager.backend.flush()
+        self.root.destroy()
+
     def run(self):
         """Run the main application"""
         self.root.mainloop()
@@ -8,14 +8,35 @@ import customtkinter as ctk
 from tkinter import messagebox
 from datetime import datetime
 
-from data_handler import UserDataManager
-from utils import Validators, suggest_alternative_usernames
+from background import BackgroundTaskRunner
 from config import APP_NAME, APP_TAGLINE
 
 
+def load_data_layer():
+    """
+    Import the data layer and open the user store
+
+    Runs on a worker thread while the login window is first drawn, so
+    pandas, bcrypt and the tracker modules aren't on the path to the first
+    window. The main window's module is imported too, so opening it after
+    login doesn't stall either.
+    """
+    import app_core  # noqa: F401  (data_handler, utils, trackers)
+    from data_handler import UserDataManager
+    return UserDataManager()
+
+
+def load_session(user_data):
+    """Preload the main window's first page for a logged-in user (runs on a worker thread)"""
+    from app_core import preload_session
+    return preload_session(user_data)
+
+
 class AuthenticationApp:
     """Main authentication window manager"""
     
+    LOGIN_MESSAGE_MS = 1000  # "Login successful!" is shown this long before the main window opens
+    
     def __init__(self):
         """Initialize the authentication app"""
         self.root = ctk.CTk()
@@ -53,23 +74,83 @@ class AuthenticationApp:
         self.root.configure(fg_color=self.palette["bg"])
         self.root.minsize(520, 620)
         
-        # Data managers
-        self.user_manager = UserDataManager()
-        
         # Current user data (for sign up process)
         self.current_signup_data = {}
         
         # Current page
         self.current_frame = None
         
+        # Password hashing runs off the Tk thread (see run_auth_task)
+        self.tasks = BackgroundTaskRunner(self.root, max_workers=1)
+        self.auth_in_progress = False
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
         # Show login page
         self.show_login_page()
+        
+        # Data managers (imported in the background, see load_data_layer)
+        self.data_layer = self.tasks.executor.submit(load_data_layer)
+    
+    @property
+    def user_manager(self):
+        """User store (check data_layer_ready first, this blocks until the import is done)"""
+        return self.data_layer.result()
+    
+    def data_layer_ready(self, status_label) -> bool:
+        """
+        Check that the background import finished, without blocking the Tk thread
+        
+        Shows why not on status_label: still loading, or the import failed
+        (the error is shown instead of re-raised on every access).
+        """
+        if not self.data_layer.done():
+            status_label.configure(text="Still loading, please try again in a moment...")
+            return False
+        error = self.data_layer.exception()
+        if error is not None:
+            print(f"Loading the data layer failed: {error}")
+            status_label.configure(text=f"Couldn't load user data: {error}",
+                                   text_color=self.palette["error"])
+            return False
+        return True
     
     def clear_frame(self):
         """Clear current frame"""
         for child in self.root.winfo_children():
             child.destroy()
         self.current_frame = None
+        self.auth_in_progress = False
+    
+    def run_auth_task(self, func, *args, on_done, status_label) -> bool:
+        """
+        Run an auth step that hashes or verifies a password on the
+        PasswordHasher pool, then call on_done(result) on the Tk thread
+        
+        Returns:
+            False if another auth step is still running
+        """
+        if self.auth_in_progress:
+            return False
+        self.auth_in_progress = True
+        from utils import PasswordHasher
+        
+        def finish(result):
+            self.auth_in_progress = False
+            on_done(result)
+        
+        def fail(error):
+            self.auth_in_progress = False
+            print(f"Authentication task failed: {error}")
+            status_label.configure(text="Something went wrong. Please try again.",
+                                   text_color=self.palette["error"])
+        
+        self.tasks.watch(
+            PasswordHasher.run_async(func, *args),
+            on_done=finish,
+            on_error=fail,
+            is_current=status_label.winfo_exists
+        )
+        return True
     
     def show_login_page(self):
         """Display login page"""
@@ -225,9 +306,19 @@ class AuthenticationApp:
             )
             return
         
-        # Authenticate
-        user_data = self.user_manager.authenticate_user(username, password)
+        if not self.data_layer_ready(self.login_error_label):
+            return
         
+        # Authenticate (bcrypt runs in the background; the window keeps repainting)
+        if self.run_auth_task(self.user_manager.authenticate_user, username, password,
+                              on_done=self.finish_login, status_label=self.login_error_label):
+            self.login_error_label.configure(
+                text="Signing in...",
+                text_color=self.palette["muted"]
+            )
+    
+    def finish_login(self, user_data):
+        """Show the login result once the password check is done"""
         if user_data is None:
             self.login_error_label.configure(
                 text="Invalid username or password",
@@ -242,19 +333,32 @@ class AuthenticationApp:
             )
             return
         
-        # Success - close auth window and open main app
-        self.login_error_label.configure(
-            text="Login successful!",
-            text_color=self.palette["success"]
-        )
-        self.root.after(1000, lambda: self.open_main_app(user_data))
+        # Success - close auth window and open main app (no second login meanwhile)
+        self.auth_in_progress = True
+        self.login_error_label.configure(
+            text="Login successful!",
+            text_color=self.palette["success"]
+        )
+        # The session loads while the message is shown; the main window opens when both are done
+        session = self.tasks.executor.submit(load_session, user_data)
+        
+        def preload_failed(error):
+            print(f"Session preload failed: {error}")
+            self.open_main_app(user_data)
+        
+        self.root.after(self.LOGIN_MESSAGE_MS, lambda: self.tasks.watch(
+            session,
+            on_done=lambda preload: self.open_main_app(user_data, preload),
+            on_error=preload_failed
+        ))
     
-    def open_main_app(self, user_data):
-        """Open main application dashboard"""
+    def open_main_app(self, user_data, preload=None):
+        """Open main application dashboard (with the state from load_session, if it loaded)"""
+        self.tasks.shutdown()
         self.root.destroy()
         # Import here to avoid circular imports
         from app_core import MainApplication
-        app = MainApplication(user_data)
+        app = MainApplication(user_data, preload=preload)
         app.run()
     
     def show_signup_personal_info(self):
@@ -485,6 +589,7 @@ class AuthenticationApp:
 
     def update_password_strength(self, event=None):
         """Update password strength indicator"""
+        from utils import Validators
         password = self.password.get()
 
         if not password:
@@ -502,6 +607,7 @@ class AuthenticationApp:
 
     def validate_and_go_to_username(self):
         """Validate personal info and proceed to username creation"""
+        from utils import Validators
         # Get values
         first_name = self.first_name.get().strip()
         last_name = self.last_name.get().strip()
@@ -546,6 +652,8 @@ class AuthenticationApp:
             return
         
         # Check if phone exists
+        if not self.data_layer_ready(self.signup_error_label):
+            return
         if self.user_manager.phone_exists(phone):
             self.signup_error_label.configure(text="Phone number already registered")
             return
@@ -725,6 +833,7 @@ class AuthenticationApp:
 
     def check_username_availability(self):
         """Check if username is available"""
+        from utils import Validators, suggest_alternative_usernames
         username = self.username.get().strip()
 
         if not username:
@@ -738,6 +847,8 @@ class AuthenticationApp:
             return
 
         # Check availability
+        if not self.data_layer_ready(self.username_status):
+            return
         if self.user_manager.username_exists(username):
             self.username_status.configure(text="Username taken", text_color=self.palette["error"])
 
@@ -784,6 +895,7 @@ class AuthenticationApp:
     
     def validate_and_go_to_role(self):
         """Validate username and proceed to role selection"""
+        from utils import Validators
         username = self.username.get().strip()
         
         if not username:
@@ -797,6 +909,8 @@ class AuthenticationApp:
             return
         
         # Check availability
+        if not self.data_layer_ready(self.username_error_label):
+            return
         if self.user_manager.username_exists(username):
             self.username_error_label.configure(text="Username is already taken")
             return
@@ -904,6 +1018,15 @@ class AuthenticationApp:
                 font=self.fonts["body"]
             ).pack(side="left", padx=10)
 
+        # Status label
+        self.signup_status_label = ctk.CTkLabel(
+            self.current_frame,
+            text="",
+            font=self.fonts["small"],
+            text_color=self.palette["muted"]
+        )
+        self.signup_status_label.pack(pady=(15, 0))
+
         # Buttons
         button_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
         button_frame.pack(pady=30)
@@ -947,9 +1070,15 @@ class AuthenticationApp:
         self.current_signup_data['timezone'] = 'UTC-5'
         self.current_signup_data['preferred_units'] = 'metric'
         
-        # Create user
-        success = self.user_manager.create_user(self.current_signup_data)
-        
+        # Create user (password is hashed in the background)
+        if not self.data_layer_ready(self.signup_status_label):
+            return
+        if self.run_auth_task(self.user_manager.create_user, dict(self.current_signup_data),
+                              on_done=self.finish_signup, status_label=self.signup_status_label):
+            self.signup_status_label.configure(text="Creating your account...")
+    
+    def finish_signup(self, success: bool):
+        """Show the signup result once the account is stored"""
         if success:
             messagebox.showinfo(
                 "Success",
@@ -957,6 +1086,7 @@ class AuthenticationApp:
             )
             self.show_login_page()
         else:
+            self.signup_status_label.configure(text="")
             messagebox.showerror("Error", "Failed to create account. Please try again.")
     
     def show_password_recovery(self):
@@ -1108,6 +1238,7 @@ class AuthenticationApp:
 
     def handle_password_reset(self):
         """Handle password reset"""
+        from utils import Validators
         username = self.recovery_username.get().strip()
         phone = self.recovery_phone.get().strip()
         new_password = self.recovery_new_password.get()
@@ -1118,6 +1249,8 @@ class AuthenticationApp:
             return
         
         # Verify user exists and phone matches
+        if not self.data_layer_ready(self.recovery_error_label):
+            return
         user_data = self.user_manager.get_user_data(username)
         if not user_data:
             self.recovery_error_label.configure(text="Username not found")
@@ -1138,15 +1271,26 @@ class AuthenticationApp:
             self.recovery_error_label.configure(text="Passwords do not match")
             return
         
-        # Update password
-        success = self.user_manager.update_password(username, new_password)
-        
+        # Update password (hashed in the background)
+        if self.run_auth_task(self.user_manager.update_password, username, new_password,
+                              on_done=self.finish_password_reset, status_label=self.recovery_error_label):
+            self.recovery_error_label.configure(text="Resetting password...")
+    
+    def finish_password_reset(self, success: bool):
+        """Show the password reset result"""
         if success:
             messagebox.showinfo("Success", "Password reset successfully!")
             self.show_login_page()
         else:
             self.recovery_error_label.configure(text="Failed to reset password")
     
+    def close(self):
+        """Close the window, dropping any background work and writing out coalesced saves"""
+        self.tasks.shutdown()
+        if self.data_layer.done() and self.data_layer.exception() is None:
+            self.user_manager.backend.flush()
+        self.root.destroy()
+    
     def run(self):
         """Run the authentication app"""
         self.root.mainloop()
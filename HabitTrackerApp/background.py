@@ -0,0 +1,93 @@
+"""
+Background Work for the Tk windows
+- Thread pool runner with a root.after bridge back to the Tk thread
+- Stale-result dropping/cancellation
+"""
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class BackgroundTaskRunner:
+    """
+    Run blocking work on a thread pool and deliver results on the Tk thread
+
+    Tk widgets may only be touched from the main thread, so finished futures
+    are collected by a root.after poll and their callbacks run from there.
+    A task whose is_current check fails by then (e.g. the user left the
+    page that asked for it) is dropped, or cancelled if it hasn't started.
+    """
+
+    POLL_INTERVAL_MS = 40
+
+    def __init__(self, root, max_workers: int = 2):
+        """Initialize runner for a Tk root"""
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="habit-tracker-bg")
+        self._pending: List[Tuple[Future, Callable, Optional[Callable], Optional[Callable]]] = []
+        self._polling = False
+        self._closed = False
+
+    def submit(self, func: Callable, *args, on_done: Callable[[Any], None],
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               is_current: Optional[Callable[[], bool]] = None) -> Future:
+        """
+        Run func(*args) in the background (call from the Tk thread only)
+
+        Args:
+            on_done: Called on the Tk thread with the result
+            on_error: Called on the Tk thread with the exception (default: print)
+            is_current: Checked before delivering; False drops the result
+        """
+        return self.watch(self.executor.submit(func, *args), on_done=on_done,
+                          on_error=on_error, is_current=is_current)
+
+    def watch(self, future: Future, on_done: Callable[[Any], None],
+              on_error: Optional[Callable[[BaseException], None]] = None,
+              is_current: Optional[Callable[[], bool]] = None) -> Future:
+        """Deliver a future created elsewhere (e.g. on the bcrypt pool) like submit() does"""
+        self._pending.append((future, on_done, on_error, is_current))
+        self._schedule_poll()
+        return future
+
+    def cancel_stale(self):
+        """Cancel queued tasks whose results are no longer wanted"""
+        for future, _, _, is_current in self._pending:
+            if is_current is not None and not is_current():
+                future.cancel()
+
+    def _schedule_poll(self):
+        """Make sure a poll is scheduled"""
+        if not self._polling and not self._closed:
+            self._polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def _poll(self):
+        """Deliver finished tasks and reschedule while any are pending"""
+        self._polling = False
+        if self._closed:
+            return
+
+        waiting = []
+        for task in self._pending:
+            future, on_done, on_error, is_current = task
+            if not future.done():
+                waiting.append(task)
+            elif future.cancelled() or (is_current is not None and not is_current()):
+                continue
+            elif future.exception() is not None:
+                if on_error:
+                    on_error(future.exception())
+                else:
+                    print(f"Background task failed: {future.exception()}")
+            else:
+                on_done(future.result())
+
+        self._pending = waiting
+        if self._pending:
+            self._schedule_poll()
+
+    def shutdown(self):
+        """Stop delivering results and drop queued work"""
+        self._closed = True
+        self._pending = []
+        self.executor.shutdown(wait=False, cancel_futures=True)
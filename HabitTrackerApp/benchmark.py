@@ -0,0 +1,266 @@
+"""
+Benchmarks for the data_handler hot paths
+- Latency percentiles and throughput per operation and dataset size
+- JSON results that a later run can be compared against
+
+    python benchmark.py run --sizes 10,100,1000 --output before.json
+    python benchmark.py compare before.json after.json --threshold 0.1
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+import utils
+from config import APP_VERSION, LOGS_DIR, STORAGE_BACKEND
+from data_handler import TrackerDataManager, UserDataManager
+from seed_data import GENERATED_PASSWORD, generate_dataset, make_backend
+from storage import DATE_FORMAT, StorageBackend
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_ITERATIONS = 200
+DEFAULT_AUTH_ITERATIONS = 20  # every login is a full bcrypt verify
+SAMPLE_USERS = 50             # users the per-user operations cycle through
+RESULT_METRICS = ("mean_ms", "p50_ms", "p95_ms", "p99_ms", "min_ms", "max_ms", "ops_per_sec")
+
+
+def measure(operation: Callable[[int], object], iterations: int, warmup: int = 3) -> Dict[str, float]:
+    """
+    Time operation(i) for i in range(iterations)
+
+    Returns:
+        Latency statistics in milliseconds and throughput in operations/second
+    """
+    for i in range(min(warmup, iterations)):
+        operation(i)
+
+    latencies = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        operation(i)
+        latencies[i] = time.perf_counter() - start
+
+    latencies *= 1000
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        "iterations": iterations,
+        "mean_ms": round(float(latencies.mean()), 4),
+        "p50_ms": round(float(p50), 4),
+        "p95_ms": round(float(p95), 4),
+        "p99_ms": round(float(p99), 4),
+        "min_ms": round(float(latencies.min()), 4),
+        "max_ms": round(float(latencies.max()), 4),
+        "ops_per_sec": round(iterations / (latencies.sum() / 1000), 2),
+    }
+
+
+def build_operations(backend: StorageBackend, usernames: Sequence[str],
+                     auth_iterations: int) -> Dict[str, tuple]:
+    """
+    Benchmarked operations against a populated backend
+
+    "(cold)" variants open a new TrackerDataManager for every call, like the
+    first read after login; the others reuse one manager per user, like a
+    running session. log_activity writes, so it is listed (and run) last.
+
+    Returns:
+        Operation name -> (callable taking the iteration index, iteration cap)
+    """
+    user_manager = UserDataManager(backend=backend)
+    sessions = {username: TrackerDataManager(username, backend) for username in usernames}
+    today = datetime.now().date()
+    day = today.strftime(DATE_FORMAT)
+    month_ago = (today - timedelta(days=29)).strftime(DATE_FORMAT)
+
+    def user(i: int) -> str:
+        return usernames[i % len(usernames)]
+
+    def log_activity(i: int):
+        sessions[user(i)].log_activity({
+            "date": day,
+            "tracker_type": "numeric",
+            "tracker_name": "Benchmark Tracker",
+            "value": i % 10,
+            "goal": 5,
+            "unit": "units",
+        })
+
+    return {
+        "username_exists": (lambda i: user_manager.username_exists(user(i) if i % 2 else f"missing{i}"), None),
+        "authenticate_user": (lambda i: user_manager.authenticate_user(user(i), GENERATED_PASSWORD),
+                              auth_iterations),
+        "get_activities_by_date": (lambda i: sessions[user(i)].get_activities_by_date(day), None),
+        "get_activities_by_date (cold)": (
+            lambda i: TrackerDataManager(user(i), backend).get_activities_by_date(day), None),
+        "get_activities_by_date_range": (
+            lambda i: sessions[user(i)].get_activities_by_date_range(month_ago, day), None),
+        "get_activities_by_date_range (cold)": (
+            lambda i: TrackerDataManager(user(i), backend).get_activities_by_date_range(month_ago, day), None),
+        "calculate_streak": (lambda i: sessions[user(i)].calculate_streak(), None),
+        "calculate_streak (cold)": (lambda i: TrackerDataManager(user(i), backend).calculate_streak(), None),
+        "log_activity": (log_activity, None),
+    }
+
+
+def run_benchmarks(sizes: Sequence[int] = DEFAULT_SIZES, days: int = 365, trackers_per_day: int = 5,
+                   iterations: int = DEFAULT_ITERATIONS, auth_iterations: int = DEFAULT_AUTH_ITERATIONS,
+                   backend_kind: str = STORAGE_BACKEND, seed: int = 42,
+                   operations: Optional[Sequence[str]] = None) -> Dict:
+    """
+    Benchmark every operation at each dataset size (number of users)
+
+    Each size gets a fresh synthetic dataset in a temporary directory, so
+    runs never touch the app's own data.
+
+    Returns:
+        {"meta": run settings and environment, "results": one entry per operation and size}
+    """
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            backend = make_backend(backend_kind, Path(tmp_dir))
+            print(f"\nDataset: {size} users x {days} days ({backend_kind})")
+            counts = generate_dataset(size, days, trackers_per_day, seed, backend=backend)
+            usernames = backend.load_users()['username'].head(SAMPLE_USERS).tolist()
+
+            for name, (operation, cap) in build_operations(backend, usernames, auth_iterations).items():
+                if operations and name.split(" (")[0] not in operations:
+                    continue
+                # Warm every sampled user's session (one call for the capped, bcrypt-bound login)
+                stats = measure(operation, min(iterations, cap or iterations), warmup=1 if cap else len(usernames))
+                results.append({"operation": name, "users": size, "rows": counts["activities"], **stats})
+                print(f"  {name:<38} p50 {stats['p50_ms']:>9.3f} ms  p99 {stats['p99_ms']:>9.3f} ms  "
+                      f"{stats['ops_per_sec']:>10.1f} ops/s")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "app_version": APP_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": backend_kind,
+            "days": days,
+            "trackers_per_day": trackers_per_day,
+            "iterations": iterations,
+            "auth_iterations": auth_iterations,
+            "seed": seed,
+            "bcrypt_rounds": utils.BCRYPT_ROUNDS,
+        },
+        "results": results,
+    }
+
+
+def save_results(report: Dict, output_path: Optional[Path] = None) -> Path:
+    """Write a report as JSON (default: a timestamped file in LOGS_DIR)"""
+    if output_path is None:
+        output_path = LOGS_DIR / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return output_path
+
+
+def compare_results(baseline: Dict, current: Dict, metric: str = "p50_ms",
+                    threshold: float = 0.10) -> List[Dict]:
+    """
+    Compare two reports on one metric
+
+    Latency metrics regress when they grow by more than threshold (a
+    fraction), ops_per_sec when it drops by more than threshold. Entries
+    only present in one report are skipped.
+
+    Returns:
+        One row per (operation, users) present in both reports, with the
+        relative change and a regressed flag
+    """
+    before = {(entry["operation"], entry["users"]): entry for entry in baseline["results"]}
+    higher_is_better = metric == "ops_per_sec"
+    rows = []
+    for entry in current["results"]:
+        key = (entry["operation"], entry["users"])
+        if key not in before:
+            continue
+        old, new = before[key][metric], entry[metric]
+        change = (new - old) / old if old else 0.0
+        regressed = -change > threshold if higher_is_better else change > threshold
+        rows.append({"operation": key[0], "users": key[1], "baseline": old, "current": new,
+                     "change": change, "regressed": regressed})
+    return rows
+
+
+def print_comparison(rows: List[Dict], metric: str):
+    """Print a comparison table"""
+    print(f"\n{'Operation':<38} {'Users':>6} {'Baseline':>12} {'Current':>12} {'Change':>9}")
+    print("-" * 81)
+    for row in rows:
+        flag = "  ❌" if row["regressed"] else ""
+        print(f"{row['operation']:<38} {row['users']:>6} {row['baseline']:>12.3f} {row['current']:>12.3f} "
+              f"{row['change']:>+8.1%}{flag}")
+    regressions = sum(row["regressed"] for row in rows)
+    print("-" * 81)
+    print(f"{metric}: {regressions} regression(s) in {len(rows)} comparison(s)")
+
+
+def load_results(path: Path) -> Dict:
+    """Read a JSON report"""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run benchmarks or compare two result files; returns the exit code"""
+    parser = argparse.ArgumentParser(description="Benchmark the habit tracker data layer")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks and save JSON results")
+    run.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                     help="comma-separated user counts (default: %(default)s)")
+    run.add_argument("--days", type=int, default=365, help="days of history per user (default: 365)")
+    run.add_argument("--trackers-per-day", type=int, default=5,
+                     help="trackers logged per active day (default: 5)")
+    run.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS,
+                     help="timed calls per operation (default: %(default)s)")
+    run.add_argument("--auth-iterations", type=int, default=DEFAULT_AUTH_ITERATIONS,
+                     help="timed calls for authenticate_user (default: %(default)s)")
+    run.add_argument("--backend", choices=["csv", "sqlite"], default=STORAGE_BACKEND,
+                     help="storage backend (default: config.STORAGE_BACKEND)")
+    run.add_argument("--seed", type=int, default=42, help="dataset seed (default: 42)")
+    run.add_argument("--only", help="comma-separated operation names to run")
+    run.add_argument("--output", type=Path, help="JSON output file (default: logs/benchmark_<time>.json)")
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--metric", choices=RESULT_METRICS, default="p50_ms",
+                         help="metric to compare (default: p50_ms)")
+    compare.add_argument("--threshold", type=float, default=0.10,
+                         help="allowed relative slowdown before flagging (default: 0.10)")
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        rows = compare_results(load_results(args.baseline), load_results(args.current),
+                               args.metric, args.threshold)
+        print_comparison(rows, args.metric)
+        return 1 if any(row["regressed"] for row in rows) else 0
+
+    report = run_benchmarks(
+        sizes=[int(size) for size in args.sizes.split(",")],
+        days=args.days,
+        trackers_per_day=args.trackers_per_day,
+        iterations=args.iterations,
+        auth_iterations=args.auth_iterations,
+        backend_kind=args.backend,
+        seed=args.seed,
+        operations=args.only.split(",") if args.only else None,
+    )
+    print(f"\nResults saved to {save_results(report, args.output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,9 +16,12 @@ USERS_DIR = DATA_DIR / "users"
 ASSETS_DIR = BASE_DIR / "assets"
 LOGS_DIR = BASE_DIR / "logs"
 
-# Ensure directories exist
-for directory in [DATA_DIR, USERS_DIR, ASSETS_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+
+def ensure_directories():
+    """Create the app directories (called once at startup; importing config has no side effects)"""
+    for directory in [DATA_DIR, USERS_DIR, ASSETS_DIR, LOGS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+
 
 # Database Files
 USERS_DATA_FILE = DATA_DIR / "users_data.csv"
@@ -26,6 +29,26 @@ ACHIEVEMENTS_FILE = DATA_DIR / "achievements.csv"
 QUOTES_FILE = DATA_DIR / "motivational_quotes.csv"
 SYSTEM_CONFIG_FILE = DATA_DIR / "system_config.csv"
 
+# Storage Backend ("csv" = per-user CSV files, "sqlite" = single database file)
+STORAGE_BACKEND = "csv"
+SQLITE_DB_FILE = DATA_DIR / "habit_tracker.db"
+
+# Columnar activity snapshots for the CSV backend (opt-in, needs pyarrow: requirements-optional.txt)
+COLUMNAR_SNAPSHOTS = False
+SNAPSHOT_ROW_GROUP_SIZE = 4096        # rows per Parquet row group (date-sorted)
+SNAPSHOT_COMPACT_BYTES = 256 * 1024   # fold the CSV tail once it grows past this
+
+# Full-file CSV rewrites (users table, reminders, achievements, streaks) are atomic and
+# coalesced: updates within this window are written once (0 = write every update through).
+# Passwords and the failed-login counter are always written through.
+CSV_WRITE_COALESCE_MS = 250
+
+# Seconds to wait for another process's lock on a CSV data file before giving up
+FILE_LOCK_TIMEOUT = 10.0
+
+# Instrumentation (opt-in: HABIT_TRACKER_PROFILE=1), metrics are dumped to LOGS_DIR as JSON on exit
+INSTRUMENTATION_ENABLED = os.environ.get("HABIT_TRACKER_PROFILE", "") not in ("", "0")
+
 # User Roles
 ROLES = {
     "student": "Student",
@@ -109,6 +132,14 @@ MIN_WINDOW_SIZE = (1000, 600)
 SESSION_TIMEOUT = 3600  # 1 hour in seconds
 MAX_LOGIN_ATTEMPTS = 5
 
+# Password Hashing (bcrypt work factor: each +1 doubles the hashing time)
+# Stored hashes with a different cost are rehashed on the next successful login.
+# Use PasswordHasher.benchmark_cost() to pick a cost for BCRYPT_TARGET_LATENCY_MS.
+BCRYPT_ROUNDS = 12
+BCRYPT_TARGET_LATENCY_MS = 250
+PASSWORD_HASH_WORKERS = 2
+PASSWORD_HASH_PROCESSES = None  # bulk hashing (create_users) process pool size; None = CPU count
+
 # Chart Settings
 CHART_COLORS = [
     "#2196F3", "#4CAF50", "#FF9800", "#9C27B0",
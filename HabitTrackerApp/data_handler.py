@@ -1,44 +1,187 @@
 """
 Data Handler Module for Habit Tracker Application
-- CSV operations for user data
+- Storage-backed operations for user data (see storage.py)
 - User management
 - Tracker data management
 - Data import/export
 """
+import numpy as np
 import pandas as pd
 import csv
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Hashable, Iterable, Set
 from config import (
-    USERS_DATA_FILE, USERS_DIR, ACHIEVEMENTS_FILE,
-    QUOTES_FILE, ACHIEVEMENT_DEFINITIONS
+    ACHIEVEMENTS_FILE, QUOTES_FILE, ACHIEVEMENT_DEFINITIONS, MAX_LOGIN_ATTEMPTS
 )
-from utils import PasswordHasher
+from storage import (
+    StorageBackend, get_storage_backend, normalize_activity_frame,
+    USER_COLUMNS, ACTIVITY_COLUMNS, STREAK_COLUMNS, USER_ACHIEVEMENT_COLUMNS, DATE_FORMAT
+)
+from utils import PasswordHasher, StreakState, StatisticsCalculator
+from instrumentation import instrumented
 
 
+class UserRegistry:
+    """
+    Resident, indexed view of the users table
+    
+    The table is loaded once and kept in memory together with hash indexes
+    on the lowercased username, email and phone columns. It is only loaded
+    again when the backend's users signature changes (for CSV storage: the
+    file's mtime or size).
+    """
+    
+    INDEXED_COLUMNS = ("username", "email", "phone")
+    
+    _shared: Dict[int, "UserRegistry"] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, backend: StorageBackend):
+        """Initialize registry for a storage backend (loaded lazily)"""
+        self.backend = backend
+        self._df: Optional[pd.DataFrame] = None
+        self._signature: Optional[Hashable] = None
+        self._indexes: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.RLock()
+    
+    @classmethod
+    def for_backend(cls, backend: StorageBackend) -> "UserRegistry":
+        """Get the registry shared by every manager using this backend"""
+        with cls._shared_lock:
+            registry = cls._shared.get(id(backend))
+            if registry is None or registry.backend is not backend:
+                registry = cls(backend)
+                cls._shared[id(backend)] = registry
+            return registry
+    
+    @staticmethod
+    def normalize_key(value: Any) -> str:
+        """Normalize a lookup value the same way for indexing and querying"""
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return ""
+        return str(value).strip().lower()
+    
+    def _load(self, signature: Optional[Hashable]):
+        """Load the users table and rebuild indexes"""
+        self._set_frame(self.backend.load_users())
+        self._signature = signature
+    
+    def _set_frame(self, df: pd.DataFrame):
+        """Install a new frame and rebuild the hash indexes"""
+        df = df.reset_index(drop=True)
+        indexes = {}
+        for column in self.INDEXED_COLUMNS:
+            index = {}
+            if column in df.columns:
+                for position, value in enumerate(df[column].tolist()):
+                    key = self.normalize_key(value)
+                    if key:
+                        # First occurrence wins, like iloc[0] on a filter
+                        index.setdefault(key, position)
+            indexes[column] = index
+        self._df = df
+        self._indexes = indexes
+    
+    def refresh(self):
+        """Reload the table only if it changed since the last load"""
+        with self._lock:
+            signature = self.backend.users_signature()
+            if self._df is None or signature != self._signature:
+                self._load(signature)
+    
+    def frame(self) -> pd.DataFrame:
+        """Get a copy of the current users table (changing it doesn't touch the registry)"""
+        with self._lock:
+            self.refresh()
+            return self._df.copy()
+    
+    def find(self, column: str, value: Any) -> Optional[int]:
+        """Get the row position of a user by an indexed column"""
+        with self._lock:
+            self.refresh()
+            return self._indexes[column].get(self.normalize_key(value))
+    
+    def contains(self, column: str, value: Any) -> bool:
+        """Check if a value exists in an indexed column"""
+        return self.find(column, value) is not None
+    
+    def get(self, column: str, value: Any) -> Optional[Dict]:
+        """Get a user's row as a dict by an indexed column"""
+        with self._lock:
+            position = self.find(column, value)
+            if position is None:
+                return None
+            return self._df.iloc[position].to_dict()
+    
+    def taken_keys(self) -> Dict[str, Set[str]]:
+        """Copy of the normalized keys in use, per indexed column"""
+        with self._lock:
+            self.refresh()
+            return {column: set(index) for column, index in self._indexes.items()}
+    
+    def usernames(self) -> List[str]:
+        """Get list of all usernames"""
+        return self.frame()['username'].tolist()
+    
+    def update(self, username: str, updates: Dict[str, Any]) -> bool:
+        """Update columns of a single user and persist the table"""
+        with self._lock:
+            position = self.find("username", username)
+            if position is None:
+                return False
+            for key, value in updates.items():
+                if key not in self._df.columns:
+                    continue
+                column = self._df.columns.get_loc(key)
+                try:
+                    self._df.iat[position, column] = value
+                except (TypeError, ValueError):
+                    # Value doesn't fit the inferred dtype (e.g. text into int)
+                    self._df[key] = self._df[key].astype(object)
+                    self._df.iat[position, column] = value
+            if any(key in self.INDEXED_COLUMNS for key in updates):
+                self._set_frame(self._df)
+            username = self._df.iat[position, self._df.columns.get_loc('username')]
+            self.backend.update_users({username: updates}, self._df)
+            self._signature = self.backend.users_signature()
+            return True
+    
+    def update_row(self, username: str, compute) -> Optional[Dict]:
+        """Atomic read-modify-write of one user's stored row (see StorageBackend.update_user_row)"""
+        with self._lock:
+            row = self.backend.update_user_row(username, compute)
+            # The stored table may hold other processes' changes too: reload on next lookup
+            self._signature = None
+            return row
+    
+    def append(self, rows: List[Dict[str, Any]]):
+        """Append new user rows and persist the table"""
+        with self._lock:
+            self.refresh()
+            new_df = pd.DataFrame(rows)
+            if self._df.empty:
+                df = new_df.reindex(columns=list(self._df.columns) or USER_COLUMNS)
+            else:
+                df = pd.concat([self._df, new_df], ignore_index=True)
+            self._set_frame(df)
+            self.backend.insert_users(rows, self._df)
+            self._signature = self.backend.users_signature()
+
+
+@instrumented
 class UserDataManager:
-    """Manage user data in CSV files"""
+    """Manage user accounts through the configured storage backend"""
     
-    def __init__(self):
-        """Initialize UserDataManager and create users file if not exists"""
-        self._initialize_users_file()
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        """Initialize UserDataManager and create users storage if not exists"""
+        self.backend = backend or get_storage_backend()
+        self.backend.initialize()
+        self.registry = UserRegistry.for_backend(self.backend)
         self._initialize_achievements_file()
         self._initialize_quotes_file()
     
-    def _initialize_users_file(self):
-        """Create users_data.csv if it doesn't exist"""
-        if not USERS_DATA_FILE.exists():
-            columns = [
-                "username", "password_hash", "first_name", "last_name",
-                "email", "phone", "date_of_birth", "role", "gender",
-                "created_date", "last_login", "timezone", "preferred_units",
-                "notification_enabled", "notification_sound", "quiet_hours_start",
-                "quiet_hours_end", "theme", "failed_login_attempts"
-            ]
-            df = pd.DataFrame(columns=columns)
-            df.to_csv(USERS_DATA_FILE, index=False)
-    
     def _initialize_achievements_file(self):
         """Create achievements.csv if it doesn't exist"""
         if not ACHIEVEMENTS_FILE.exists():
@@ -76,35 +219,56 @@ class UserDataManager:
     def username_exists(self, username: str) -> bool:
         """Check if username already exists"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
-            return username.lower() in df['username'].str.lower().values
+            return self.registry.contains("username", username)
         except Exception:
             return False
     
     def email_exists(self, email: str) -> bool:
         """Check if email already exists"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
-            return email.lower() in df['email'].str.lower().values
+            return self.registry.contains("email", email)
         except Exception:
             return False
     
     def phone_exists(self, phone: str) -> bool:
         """Check if phone number already exists"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
-            return phone in df['phone'].values
+            return self.registry.contains("phone", phone)
         except Exception:
             return False
     
     def get_all_usernames(self) -> List[str]:
         """Get list of all usernames"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
-            return df['username'].tolist()
+            return self.registry.usernames()
         except Exception:
             return []
     
+    @staticmethod
+    def build_user_row(user_data: Dict[str, Any], password_hash: str, timestamp: str) -> Dict[str, Any]:
+        """Users table row for a new account"""
+        return {
+            "username": user_data['username'].lower(),
+            "password_hash": password_hash,
+            "first_name": user_data['first_name'],
+            "last_name": user_data['last_name'],
+            "email": user_data['email'],
+            "phone": user_data['phone'],
+            "date_of_birth": user_data['date_of_birth'],
+            "role": user_data['role'],
+            "gender": user_data.get('gender', ''),
+            "created_date": timestamp,
+            "last_login": timestamp,
+            "timezone": user_data.get('timezone', 'UTC'),
+            "preferred_units": user_data.get('preferred_units', 'metric'),
+            "notification_enabled": True,
+            "notification_sound": True,
+            "quiet_hours_start": "22:00",
+            "quiet_hours_end": "07:00",
+            "theme": "light",
+            "failed_login_attempts": 0
+        }
+    
     def create_user(self, user_data: Dict[str, Any]) -> bool:
         """Create a new user account"""
         try:
@@ -112,297 +276,494 @@ class UserDataManager:
             password_hash = PasswordHasher.hash_password(user_data['password'])
             
             # Prepare user data
-            new_user = {
-                "username": user_data['username'].lower(),
-                "password_hash": password_hash,
-                "first_name": user_data['first_name'],
-                "last_name": user_data['last_name'],
-                "email": user_data['email'],
-                "phone": user_data['phone'],
-                "date_of_birth": user_data['date_of_birth'],
-                "role": user_data['role'],
-                "gender": user_data.get('gender', ''),
-                "created_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "last_login": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "timezone": user_data.get('timezone', 'UTC'),
-                "preferred_units": user_data.get('preferred_units', 'metric'),
-                "notification_enabled": True,
-                "notification_sound": True,
-                "quiet_hours_start": "22:00",
-                "quiet_hours_end": "07:00",
-                "theme": "light",
-                "failed_login_attempts": 0
-            }
+            new_user = self.build_user_row(user_data, password_hash, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
             
             # Add to CSV
-            df = pd.read_csv(USERS_DATA_FILE)
-            new_df = pd.DataFrame([new_user])
-            if df.empty:
-                df = new_df
-            else:
-                df = pd.concat([df, new_df], ignore_index=True)
-            df.to_csv(USERS_DATA_FILE, index=False)
+            self.registry.append([new_user])
             
-            # Create user-specific data file
-            self._create_user_data_file(user_data['username'].lower())
-            self._create_user_reminders_file(user_data['username'].lower())
-            self._create_user_achievements_file(user_data['username'].lower())
+            # Create user-specific activity/reminder/achievement storage
+            self.backend.create_user_storage(new_user['username'])
             
             return True
         except Exception as e:
             print(f"Error creating user: {e}")
             return False
     
-    def _create_user_data_file(self, username: str):
-        """Create individual user data CSV file"""
-        user_file = USERS_DIR / f"{username}_data.csv"
-        columns = [
-            "date", "tracker_type", "tracker_name", "value",
-            "goal", "unit", "notes", "completed"
-        ]
-        df = pd.DataFrame(columns=columns)
-        df.to_csv(user_file, index=False)
-    
-    def _create_user_reminders_file(self, username: str):
-        """Create individual user reminders CSV file"""
-        reminders_file = USERS_DIR / f"{username}_reminders.csv"
-        columns = [
-            "reminder_id", "title", "description", "date", "time",
-            "recurrence", "category", "priority", "tracker_link", "status"
-        ]
-        df = pd.DataFrame(columns=columns)
-        df.to_csv(reminders_file, index=False)
-    
-    def _create_user_achievements_file(self, username: str):
-        """Create individual user achievements CSV file"""
-        achievements_file = USERS_DIR / f"{username}_achievements.csv"
-        columns = ["achievement_id", "unlocked_date", "progress", "completed"]
+    def create_users(self, users: Iterable[Dict[str, Any]]) -> List[bool]:
+        """
+        Create many user accounts with a single users table write
         
-        # Initialize with all achievements as not completed
-        data = []
-        for achievement in ACHIEVEMENT_DEFINITIONS:
-            data.append({
-                "achievement_id": achievement["id"],
-                "unlocked_date": "",
-                "progress": 0,
-                "completed": "no"
-            })
+        Usernames, emails and phones are checked against the in-memory
+        registry indexes and the batch itself; duplicates and incomplete
+        entries are skipped. Passwords of the accepted users are hashed on a
+        process pool and their per-user storage is created in one bulk call.
+        
+        Returns:
+            List of per-user success flags, in input order
+        """
+        users = list(users)
+        results = [False] * len(users)
+        taken = self.registry.taken_keys()
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        accepted = []
+        passwords = []
+        
+        for index, user_data in enumerate(users):
+            try:
+                row = self.build_user_row(user_data, "", timestamp)
+                password = user_data['password']
+            except (KeyError, AttributeError) as e:
+                print(f"Error creating user #{index}: missing or invalid {e}")
+                continue
+            
+            keys = {column: UserRegistry.normalize_key(row[column]) for column in UserRegistry.INDEXED_COLUMNS}
+            duplicate = next((column for column, key in keys.items() if key and key in taken[column]), None)
+            if duplicate:
+                print(f"Error creating user #{index}: {duplicate} '{row[duplicate]}' already exists")
+                continue
+            for column, key in keys.items():
+                if key:
+                    taken[column].add(key)
+            accepted.append((index, row))
+            passwords.append(password)
+        
+        if not accepted:
+            return results
         
-        df = pd.DataFrame(data)
-        df.to_csv(achievements_file, index=False)
+        try:
+            for (_, row), password_hash in zip(accepted, PasswordHasher.hash_passwords(passwords)):
+                row["password_hash"] = password_hash
+            rows = [row for _, row in accepted]
+            self.registry.append(rows)
+            self.backend.create_users_storage([row['username'] for row in rows])
+        except Exception as e:
+            print(f"Error creating users: {e}")
+            return results
+        
+        for index, _ in accepted:
+            results[index] = True
+        return results
     
     def authenticate_user(self, username: str, password: str) -> Optional[Dict]:
         """Authenticate user and return user data if successful"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
-            user_row = df[df['username'].str.lower() == username.lower()]
+            user_data = self.registry.get("username", username)
             
-            if user_row.empty:
+            if user_data is None:
                 return None
             
-            user_data = user_row.iloc[0].to_dict()
-            
             # Check if account is locked
-            if user_data.get('failed_login_attempts', 0) >= 5:
+            if self.failed_attempts(user_data) >= MAX_LOGIN_ATTEMPTS:
                 return {'error': 'Account locked due to too many failed attempts'}
             
             # Verify password
             if PasswordHasher.verify_password(password, user_data['password_hash']):
                 # Reset failed attempts and update last login
-                df.loc[df['username'].str.lower() == username.lower(), 'failed_login_attempts'] = 0
-                df.loc[df['username'].str.lower() == username.lower(), 'last_login'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                df.to_csv(USERS_DATA_FILE, index=False)
+                updates = {
+                    'failed_login_attempts': 0,
+                    'last_login': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                }
+                # Move the stored hash to the configured cost (same single write)
+                if PasswordHasher.needs_rehash(user_data['password_hash']):
+                    updates['password_hash'] = PasswordHasher.hash_password(password)
+                
+                def log_in(row: Dict) -> Dict:
+                    # Another process may have locked the account while the password was checked
+                    return {} if self.failed_attempts(row) >= MAX_LOGIN_ATTEMPTS else updates
+                
+                row = self.registry.update_row(username, log_in)
+                if row is None:
+                    return None
+                if self.failed_attempts(row) >= MAX_LOGIN_ATTEMPTS:
+                    return {'error': 'Account locked due to too many failed attempts'}
+                user_data.update(updates)
                 
                 return user_data
             else:
-                # Increment failed attempts
-                current_attempts = user_data.get('failed_login_attempts', 0)
-                df.loc[df['username'].str.lower() == username.lower(), 'failed_login_attempts'] = current_attempts + 1
-                df.to_csv(USERS_DATA_FILE, index=False)
+                # Increment failed attempts (the stored count: other processes may have added to it)
+                self.registry.update_row(username, lambda row: {
+                    'failed_login_attempts': self.failed_attempts(row) + 1
+                })
                 return None
         except Exception as e:
             print(f"Authentication error: {e}")
             return None
     
+    @staticmethod
+    def failed_attempts(user_data: Dict) -> int:
+        """Failed login count of a user row (missing counts as 0)"""
+        value = user_data.get('failed_login_attempts')
+        return 0 if value is None or pd.isna(value) else int(value)
+    
     def get_user_by_phone(self, phone: str) -> Optional[Dict]:
         """Get user data by phone number"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
-            user_row = df[df['phone'] == phone]
-            
-            if not user_row.empty:
-                return user_row.iloc[0].to_dict()
-            return None
+            return self.registry.get("phone", phone)
         except Exception:
             return None
     
     def update_password(self, username: str, new_password: str) -> bool:
-        """Update user password"""
+        """Update user password (written through, not coalesced: it must be on disk when this returns)"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
             password_hash = PasswordHasher.hash_password(new_password)
-            
-            df.loc[df['username'].str.lower() == username.lower(), 'password_hash'] = password_hash
-            df.to_csv(USERS_DATA_FILE, index=False)
-            return True
+            return self.registry.update_row(username, lambda row: {'password_hash': password_hash}) is not None
         except Exception:
             return False
     
     def update_user_profile(self, username: str, updates: Dict) -> bool:
         """Update user profile information"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
-            
-            for key, value in updates.items():
-                if key in df.columns and key != 'password_hash':
-                    df.loc[df['username'].str.lower() == username.lower(), key] = value
-            
-            df.to_csv(USERS_DATA_FILE, index=False)
-            return True
+            updates = {key: value for key, value in updates.items() if key != 'password_hash'}
+            return self.registry.update(username, updates)
         except Exception:
             return False
     
     def get_user_data(self, username: str) -> Optional[Dict]:
         """Get complete user data"""
         try:
-            df = pd.read_csv(USERS_DATA_FILE)
-            user_row = df[df['username'].str.lower() == username.lower()]
-            
-            if not user_row.empty:
-                return user_row.iloc[0].to_dict()
-            return None
+            return self.registry.get("username", username)
         except Exception:
             return None
 
 
+@instrumented
 class TrackerDataManager:
-    """Manage tracker data for users"""
+    """
+    Manage tracker data for users
+    
+    Activity reads are served from a parsed, date-sorted frame that is kept
+    in memory. Writes made through this manager patch the frame in place;
+    changes made by anyone else are detected through the backend's
+    activities signature and trigger a reload.
+    
+    Streaks are kept as persisted per-tracker state (current, longest, last
+    active date) that log_activities advances row by row, so reading a
+    streak never touches the history. The state is only rebuilt from the
+    full history when it is missing or a row is logged for a day older
+    than the tracker's last active date.
+    """
     
-    def __init__(self, username: str):
+    OVERALL_STREAK = "__overall__"
+    
+    def __init__(self, username: str, backend: Optional[StorageBackend] = None):
         """Initialize TrackerDataManager for specific user"""
         self.username = username.lower()
-        self.data_file = USERS_DIR / f"{self.username}_data.csv"
-        self.reminders_file = USERS_DIR / f"{self.username}_reminders.csv"
+        self.backend = backend or get_storage_backend()
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_signature: Optional[Hashable] = None
+        self._frame_lock = threading.RLock()
+        self._streaks: Optional[Dict[str, StreakState]] = None
+        self._streaks_signature: Optional[Hashable] = None
+        self.achievements = AchievementEngine(self)
+    
+    def _activities(self) -> pd.DataFrame:
+        """Get the cached activity history (date as datetime64, sorted by date)"""
+        with self._frame_lock:
+            signature = self.backend.activities_signature(self.username)
+            if self._frame is None or signature != self._frame_signature:
+                df = self.backend.read_activities(self.username)
+                self._frame = self._sorted(df.dropna(subset=['date']))
+                self._frame_signature = signature
+            return self._frame
+    
+    @staticmethod
+    def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+        """Sort by date, keeping insertion order within a day"""
+        return df.sort_values('date', kind='stable').reset_index(drop=True)
+    
+    def _patch_frame(self, new_entries: List[Dict[str, Any]], signature_before: Hashable):
+        """Fold rows this manager just wrote into the cached frame"""
+        with self._frame_lock:
+            if self._frame is None or signature_before != self._frame_signature:
+                # Cache was already stale (or never loaded); next read reloads
+                self._frame = None
+                return
+            new_df = normalize_activity_frame(pd.DataFrame(new_entries, columns=ACTIVITY_COLUMNS))
+            frame = pd.concat([self._frame, new_df], ignore_index=True)
+            if not self._frame.empty and new_df['date'].min() < self._frame['date'].iloc[-1]:
+                frame = self._sorted(frame)
+            self._frame = frame
+            self._frame_signature = self.backend.activities_signature(self.username)
+    
+    def _date_slice(self, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        """Rows between two dates (inclusive) via binary search on the sorted frame"""
+        df = self._activities()
+        dates = df['date']
+        start = 0 if start_date is None else dates.searchsorted(pd.Timestamp(start_date), side='left')
+        end = len(df) if end_date is None else dates.searchsorted(pd.Timestamp(end_date), side='right')
+        return df.iloc[start:end].copy()
+    
+    def _streak_states(self) -> Dict[str, StreakState]:
+        """Get the streak state, loading it again if activities changed elsewhere"""
+        with self._frame_lock:
+            signature = self.backend.activities_signature(self.username)
+            if self._streaks is None or signature != self._streaks_signature:
+                stored = self.backend.load_streaks(self.username)
+                if self._stored_streaks_current(stored, signature):
+                    states = self._parse_streaks(stored)
+                else:
+                    # Missing, or computed from another history (e.g. rows written by an import):
+                    # rebuilt in memory only, reads don't write; the next log stores it
+                    states = self._rebuild_streaks()
+                self._streaks = states
+                self._streaks_signature = signature
+            return self._streaks
+    
+    @staticmethod
+    def compute_streaks(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Streak state of every tracker in one groupby/diff pass
+        
+        Args:
+            df: Activity rows with datetime64 'date' and 'tracker_name' columns
+        
+        Returns:
+            DataFrame indexed by tracker_name with current_streak (run ending
+            at last_active_date), longest_streak and last_active_date
+        """
+        days = pd.DataFrame({
+            'tracker_name': df['tracker_name'].astype(str),
+            'date': df['date'].dt.normalize()
+        }).dropna().drop_duplicates().sort_values(['tracker_name', 'date'])
+        
+        # A new run starts at each tracker's first day and after every gap
+        run_start = days.groupby('tracker_name')['date'].diff() != pd.Timedelta(days=1)
+        days['run_length'] = days.groupby(run_start.cumsum()).cumcount() + 1
+        
+        by_tracker = days.groupby('tracker_name', sort=False)
+        last = by_tracker.tail(1).set_index('tracker_name')
+        return pd.DataFrame({
+            'current_streak': last['run_length'],
+            'longest_streak': by_tracker['run_length'].max(),
+            'last_active_date': last['date'],
+        })
+    
+    def _rebuild_streaks(self) -> Dict[str, StreakState]:
+        """Compute streak state for every tracker from the full history"""
+        df = self._activities()
+        overall = df[['date']].assign(tracker_name=self.OVERALL_STREAK)
+        table = self.compute_streaks(pd.concat([df[['date', 'tracker_name']], overall], ignore_index=True))
+        return {
+            name: StreakState(int(row.current_streak), int(row.longest_streak), row.last_active_date.date())
+            for name, row in table.iterrows()
+        }
+    
+    @staticmethod
+    def _stored_streaks_current(stored: Optional[pd.DataFrame], signature: Hashable) -> bool:
+        """Whether stored streak rows were computed from the history with this signature"""
+        return (stored is not None and not stored.empty and 'history_signature' in stored.columns
+                and (stored['history_signature'].astype(str) == repr(signature)).all())
+    
+    @staticmethod
+    def _parse_streaks(df: pd.DataFrame) -> Dict[str, StreakState]:
+        """Turn stored streak rows into StreakState objects"""
+        states = {}
+        for row in df.to_dict('records'):
+            last_active = row['last_active_date']
+            states[str(row['tracker_name'])] = StreakState(
+                current=int(row['current_streak']),
+                longest=int(row['longest_streak']),
+                last_active=datetime.strptime(last_active, DATE_FORMAT).date() if pd.notna(last_active) else None
+            )
+        return states
+    
+    def _store_streaks(self, states: Dict[str, StreakState], signature: Hashable):
+        """Persist streak state through the backend, tagged with the history it reflects"""
+        rows = [
+            {
+                "tracker_name": name,
+                "current_streak": state.current,
+                "longest_streak": state.longest,
+                "last_active_date": state.last_active.strftime(DATE_FORMAT) if state.last_active else None,
+                "history_signature": repr(signature)
+            }
+            for name, state in states.items()
+        ]
+        self.backend.save_streaks(self.username, pd.DataFrame(rows, columns=STREAK_COLUMNS))
+    
+    def _advance_streaks(self, new_entries: List[Dict[str, Any]], signature_before: Hashable):
+        """Fold rows this manager just wrote into the streak state"""
+        with self._frame_lock:
+            if self._streaks is not None and signature_before == self._streaks_signature:
+                states = self._streaks
+            else:
+                # Someone else may have logged since we last looked
+                stored = self.backend.load_streaks(self.username)
+                states = self._parse_streaks(stored) if self._stored_streaks_current(stored, signature_before) else None
+            
+            if states is not None:
+                for entry in sorted(new_entries, key=lambda e: str(e['date'])):
+                    day = datetime.strptime(str(entry['date']), DATE_FORMAT).date()
+                    in_order = all(
+                        states.setdefault(key, StreakState()).advance(day)
+                        for key in (str(entry['tracker_name']), self.OVERALL_STREAK)
+                    )
+                    if not in_order:
+                        # Back-dated entry: runs may have merged, recompute
+                        states = None
+                        break
+            
+            if states is None:
+                states = self._rebuild_streaks()
+            signature = self.backend.activities_signature(self.username)
+            self._store_streaks(states, signature)
+            self._streaks = states
+            self._streaks_signature = signature
+    
+    @staticmethod
+    def _build_activity_entry(activity_data: Dict) -> Dict[str, Any]:
+        """Validate an activity dict and return the row to persist (raises ValueError/KeyError)"""
+        new_entry = {
+            "date": activity_data.get('date', datetime.now().strftime("%Y-%m-%d")),
+            "tracker_type": activity_data['tracker_type'],
+            "tracker_name": activity_data['tracker_name'],
+            "value": activity_data['value'],
+            "goal": activity_data.get('goal', 0),
+            "unit": activity_data.get('unit', ''),
+            "notes": activity_data.get('notes', ''),
+            "completed": activity_data.get('completed', 'no')
+        }
+        
+        datetime.strptime(str(new_entry['date']), "%Y-%m-%d")
+        if not new_entry['tracker_name']:
+            raise ValueError("tracker_name cannot be empty")
+        if new_entry['tracker_type'] == "time":
+            datetime.strptime(str(new_entry['value']), "%H:%M")
+        else:
+            float(new_entry['value'])
+        float(new_entry['goal'])
+        return new_entry
     
     def log_activity(self, activity_data: Dict) -> bool:
         """Log a new activity/tracker entry"""
+        return self.log_activities([activity_data])[0]
+    
+    def log_activities(self, activities: List[Dict]) -> List[bool]:
+        """
+        Log many activity entries with a single write
+        
+        Every entry is validated first; valid rows are then appended to the
+        data file in one operation.
+        
+        Returns:
+            List of per-entry success flags, in input order
+        """
+        results = []
+        new_entries = []
+        for index, activity_data in enumerate(activities):
+            try:
+                new_entries.append(self._build_activity_entry(activity_data))
+                results.append(True)
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Error logging activity #{index}: {e}")
+                results.append(False)
+        
+        if not new_entries:
+            return results
+        
         try:
-            df = pd.read_csv(self.data_file)
-            
-            new_entry = {
-                "date": activity_data.get('date', datetime.now().strftime("%Y-%m-%d")),
-                "tracker_type": activity_data['tracker_type'],
-                "tracker_name": activity_data['tracker_name'],
-                "value": activity_data['value'],
-                "goal": activity_data.get('goal', 0),
-                "unit": activity_data.get('unit', ''),
-                "notes": activity_data.get('notes', ''),
-                "completed": activity_data.get('completed', 'no')
-            }
-            
-            new_df = pd.DataFrame([new_entry])
-            if df.empty:
-                df = new_df
-            else:
-                df = pd.concat([df, new_df], ignore_index=True)
-            df.to_csv(self.data_file, index=False)
-            return True
+            # Other processes logging for this user wait until the streaks and achievements are updated
+            # too (frame lock first: readers hold it while they take the file lock)
+            with self._frame_lock, self.backend.lock_activities(self.username):
+                self._log_entries(new_entries)
         except Exception as e:
-            print(f"Error logging activity: {e}")
-            return False
+            print(f"Error logging activities: {e}")
+            return [False] * len(results)
+        return results
+    
+    def _log_entries(self, new_entries: List[Dict[str, Any]]):
+        """Append validated rows, then fold them into the streaks and achievements"""
+        signature_before = self.backend.activities_signature(self.username)
+        # Append only the new rows; existing history is never re-read
+        self.backend.append_activities(self.username, new_entries)
+        self._patch_frame(new_entries, signature_before)
+        
+        try:
+            self._advance_streaks(new_entries, signature_before)
+        except Exception as e:
+            # Rows are saved; the next streak read rebuilds from history
+            print(f"Error updating streaks: {e}")
+            self._streaks = None
+        
+        try:
+            self.achievements.record_activities(new_entries)
+        except Exception as e:
+            print(f"Error updating achievements: {e}")
     
     def get_activities_by_date(self, date: str) -> pd.DataFrame:
         """Get all activities for a specific date"""
         try:
-            df = pd.read_csv(self.data_file)
-            return df[df['date'] == date]
+            df = self._date_slice(date, date)
+            df['date'] = df['date'].dt.strftime(DATE_FORMAT)
+            return df
         except Exception:
             return pd.DataFrame()
     
     def get_activities_by_date_range(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get activities within date range"""
         try:
-            df = pd.read_csv(self.data_file)
-            df['date'] = pd.to_datetime(df['date'])
-            start_dt = pd.to_datetime(start_date)
-            end_dt = pd.to_datetime(end_date)
-            mask = (df['date'] >= start_dt) & (df['date'] <= end_dt)
-            return df[mask]
+            return self._date_slice(
+                pd.to_datetime(start_date).strftime(DATE_FORMAT),
+                pd.to_datetime(end_date).strftime(DATE_FORMAT)
+            )
         except Exception:
             return pd.DataFrame()
     
     def get_tracker_history(self, tracker_name: str, days: int = 30) -> pd.DataFrame:
         """Get history of a specific tracker"""
         try:
-            df = pd.read_csv(self.data_file)
-            df['date'] = pd.to_datetime(df['date'])
-            
-            # Get last N days
-            end_date = datetime.now()
-            start_date = end_date - pd.Timedelta(days=days)
+            # Get last N days (rows are whole dates, so the day N days ago is excluded)
+            start_date = datetime.now() - pd.Timedelta(days=days - 1)
             
-            mask = (df['tracker_name'] == tracker_name) & (df['date'] >= start_date)
-            return df[mask].sort_values('date')
+            df = self._date_slice(start_date.strftime(DATE_FORMAT), None)
+            return df[df['tracker_name'] == tracker_name]
         except Exception:
             return pd.DataFrame()
     
     def get_all_tracker_names(self) -> List[str]:
         """Get list of all unique tracker names for user"""
         try:
-            df = pd.read_csv(self.data_file)
-            return df['tracker_name'].unique().tolist()
+            return self._activities()['tracker_name'].unique().tolist()
         except Exception:
             return []
     
     def calculate_streak(self, tracker_name: Optional[str] = None) -> int:
         """Calculate current streak (overall or for specific tracker)"""
         try:
-            df = pd.read_csv(self.data_file)
-            df['date'] = pd.to_datetime(df['date'])
-            
-            if tracker_name:
-                df = df[df['tracker_name'] == tracker_name]
-            
-            # Get unique dates with logged activities
-            unique_dates = df['date'].dt.date.unique()
-            unique_dates = sorted(unique_dates, reverse=True)
-            
-            if not len(unique_dates):
-                return 0
-            
-            # Check if today or yesterday is in the list
+            state = self._streak_states().get(tracker_name or self.OVERALL_STREAK)
+            return state.current_as_of(datetime.now().date()) if state else 0
+        except Exception:
+            return 0
+    
+    def calculate_all_streaks(self) -> Dict[str, Dict[str, int]]:
+        """
+        Current and longest streak of every logged tracker
+        
+        Returns:
+            {tracker_name: {"current": int, "longest": int}}
+        """
+        try:
             today = datetime.now().date()
-            yesterday = today - pd.Timedelta(days=1).to_pytimedelta()
-            
-            if unique_dates[0] != today and unique_dates[0] != yesterday:
-                return 0
-            
-            # Count consecutive days
-            streak = 1
-            for i in range(1, len(unique_dates)):
-                expected_date = unique_dates[i-1] - pd.Timedelta(days=1).to_pytimedelta()
-                if unique_dates[i] == expected_date:
-                    streak += 1
-                else:
-                    break
-            
-            return streak
+            return {
+                name: {"current": state.current_as_of(today), "longest": state.longest}
+                for name, state in self._streak_states().items()
+                if name != self.OVERALL_STREAK
+            }
+        except Exception:
+            return {}
+    
+    def get_longest_streak(self, tracker_name: Optional[str] = None) -> int:
+        """Longest streak ever reached (overall or for specific tracker)"""
+        try:
+            state = self._streak_states().get(tracker_name or self.OVERALL_STREAK)
+            return state.longest if state else 0
         except Exception:
             return 0
     
     def add_reminder(self, reminder_data: Dict) -> bool:
         """Add a new reminder"""
         try:
-            df = pd.read_csv(self.reminders_file)
-            
-            # Generate reminder ID
-            if df.empty:
-                reminder_id = 1
-            else:
-                reminder_id = df['reminder_id'].max() + 1
-            
             new_reminder = {
-                "reminder_id": reminder_id,
                 "title": reminder_data['title'],
                 "description": reminder_data.get('description', ''),
                 "date": reminder_data['date'],
@@ -414,12 +775,8 @@ class TrackerDataManager:
                 "status": "pending"
             }
             
-            new_df = pd.DataFrame([new_reminder])
-            if df.empty:
-                df = new_df
-            else:
-                df = pd.concat([df, new_df], ignore_index=True)
-            df.to_csv(self.reminders_file, index=False)
+            # Backend generates the reminder ID
+            self.backend.add_reminder(self.username, new_reminder)
             return True
         except Exception as e:
             print(f"Error adding reminder: {e}")
@@ -428,44 +785,230 @@ class TrackerDataManager:
     def get_reminders_for_date(self, date: str) -> pd.DataFrame:
         """Get all reminders for a specific date"""
         try:
-            df = pd.read_csv(self.reminders_file)
-            return df[df['date'] == date]
+            return self.backend.read_reminders(self.username, date=date)
         except Exception:
             return pd.DataFrame()
     
     def update_reminder_status(self, reminder_id: int, status: str) -> bool:
         """Update reminder status (pending, completed, dismissed)"""
         try:
-            df = pd.read_csv(self.reminders_file)
-            df.loc[df['reminder_id'] == reminder_id, 'status'] = status
-            df.to_csv(self.reminders_file, index=False)
-            return True
+            return self.backend.update_reminder_status(self.username, reminder_id, status)
         except Exception:
             return False
 
 
+class AchievementEngine:
+    """
+    Evaluate ACHIEVEMENT_DEFINITIONS for one user
+    
+    Each achievement's progress column holds the running counter for its
+    criteria type (logged entries, longest streak, best daily completion %,
+    cumulative hours, distinct active days). Logging folds only the new rows
+    into those counters; the day's own rows come from the manager's cached,
+    date-sorted frame. History is only evaluated in full the first time
+    (all counters still zero) or through evaluate_all_users.
+    """
+    
+    def __init__(self, tracker_manager: "TrackerDataManager"):
+        """Initialize engine for a tracker manager's user"""
+        self.tracker_manager = tracker_manager
+        self.last_unlocked: List[Dict] = []
+    
+    @staticmethod
+    def logged_hours(df: pd.DataFrame) -> pd.Series:
+        """Hours logged per row (duration trackers only)"""
+        values = pd.to_numeric(df['value'], errors='coerce')
+        return values.where(df['tracker_type'] == 'duration', 0).fillna(0)
+    
+    @classmethod
+    def counters_from_history(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Achievement counters for every user in one vectorized pass
+        
+        Args:
+            df: Activity rows with a username column (see read_all_activities)
+        
+        Returns:
+            DataFrame indexed by username with one column per criteria type
+        """
+        df = df.dropna(subset=['date'])
+        by_user = df.groupby('username', sort=False)
+        streaks = TrackerDataManager.compute_streaks(df.assign(tracker_name=df['username']))
+        daily = StatisticsCalculator.completion_percentages(df).groupby([df['username'], df['date']]).mean()
+        counters = pd.DataFrame({
+            "first_log": by_user.size(),
+            "streak": streaks['longest_streak'],
+            "daily_completion": daily.groupby(level=0).max(),
+            "cumulative_hours": cls.logged_hours(df).groupby(df['username']).sum(),
+            "days_active": by_user['date'].nunique(),
+        })
+        return counters.fillna(0)
+    
+    @staticmethod
+    def _stored_counters(achievements: pd.DataFrame) -> Dict[str, float]:
+        """Running counters as last saved in the progress column"""
+        criteria = {definition["id"]: definition["criteria"] for definition in ACHIEVEMENT_DEFINITIONS}
+        counters = {criteria_type: 0.0 for criteria_type in criteria.values()}
+        for row in achievements.to_dict('records'):
+            criteria_type = criteria.get(int(row['achievement_id']))
+            if criteria_type and pd.notna(row['progress']):
+                counters[criteria_type] = max(counters[criteria_type], float(row['progress']))
+        return counters
+    
+    @staticmethod
+    def apply_counters(achievements: pd.DataFrame, counters: Dict[str, float]) -> tuple:
+        """
+        Write counters into the progress column and unlock reached achievements
+        
+        Returns:
+            (updated achievements DataFrame, list of newly unlocked definitions)
+        """
+        stored = {int(row['achievement_id']): row for row in achievements.to_dict('records')}
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = []
+        unlocked = []
+        for definition in ACHIEVEMENT_DEFINITIONS:
+            row = stored.get(definition["id"], {})
+            completed = row.get('completed') == 'yes'
+            unlocked_date = row.get('unlocked_date') if completed else ''
+            progress = round(float(counters.get(definition["criteria"], 0)), 2)
+            if not completed and progress >= definition["value"]:
+                completed = True
+                unlocked_date = now
+                unlocked.append(definition)
+            rows.append({
+                "achievement_id": definition["id"],
+                "unlocked_date": unlocked_date,
+                "progress": progress,
+                "completed": "yes" if completed else "no"
+            })
+        return pd.DataFrame(rows, columns=USER_ACHIEVEMENT_COLUMNS), unlocked
+    
+    @staticmethod
+    def rows_from_counters(counters: pd.DataFrame) -> pd.DataFrame:
+        """
+        Achievement rows of users with nothing unlocked yet, vectorized apply_counters
+        
+        Args:
+            counters: Output of counters_from_history (indexed by username)
+        
+        Returns:
+            Rows with a leading username column, ordered by user then achievement
+        """
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        frames = []
+        for definition in ACHIEVEMENT_DEFINITIONS:
+            if definition["criteria"] in counters.columns:
+                progress = counters[definition["criteria"]].astype(float).round(2)
+            else:
+                progress = pd.Series(0.0, index=counters.index)
+            completed = progress >= definition["value"]
+            frames.append(pd.DataFrame({
+                "username": counters.index.to_numpy(),
+                "achievement_id": definition["id"],
+                "unlocked_date": np.where(completed, now, ""),
+                "progress": progress.to_numpy(),
+                "completed": np.where(completed, "yes", "no"),
+                "order": np.arange(len(counters))
+            }))
+        rows = pd.concat(frames, ignore_index=True).sort_values(["order", "achievement_id"], kind="stable")
+        return rows.drop(columns="order").reset_index(drop=True)
+    
+    @staticmethod
+    def _load(backend: StorageBackend, username: str) -> pd.DataFrame:
+        """Stored achievement rows (empty if the user has none yet)"""
+        try:
+            return backend.load_achievements(username)
+        except FileNotFoundError:
+            return pd.DataFrame(columns=USER_ACHIEVEMENT_COLUMNS)
+    
+    def record_activities(self, new_entries: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        Fold newly logged rows into the counters and unlock achievements
+        
+        Returns:
+            Definitions of the achievements unlocked by these rows
+        """
+        # A failed call must not leave the previous call's unlocks behind
+        self.last_unlocked = []
+        manager = self.tracker_manager
+        achievements = self._load(manager.backend, manager.username)
+        counters = self._stored_counters(achievements)
+        
+        if counters["first_log"] == 0:
+            # Counters never initialized: evaluate this user's history once
+            history = manager._activities().assign(username=manager.username)
+            if not history.empty:
+                counters.update(self.counters_from_history(history).iloc[0].to_dict())
+        else:
+            new_df = pd.DataFrame(new_entries, columns=ACTIVITY_COLUMNS)
+            counters["first_log"] += len(new_df)
+            counters["cumulative_hours"] += float(self.logged_hours(new_df).sum())
+            for day, count in new_df['date'].astype(str).value_counts().items():
+                day_rows = manager._date_slice(day, day)
+                if len(day_rows) == count:
+                    counters["days_active"] += 1
+                counters["daily_completion"] = max(counters["daily_completion"],
+                                                   float(StatisticsCalculator.completion_percentages(day_rows).mean()))
+            counters["streak"] = max(counters["streak"], manager.get_longest_streak())
+        
+        updated, self.last_unlocked = self.apply_counters(achievements, counters)
+        manager.backend.save_achievements(manager.username, updated)
+        return self.last_unlocked
+    
+    def get_achievements(self) -> pd.DataFrame:
+        """The user's achievements joined with their definitions"""
+        definitions = pd.DataFrame(ACHIEVEMENT_DEFINITIONS).rename(columns={"id": "achievement_id"})
+        achievements = self._load(self.tracker_manager.backend, self.tracker_manager.username)
+        achievements = achievements.astype({"achievement_id": int})
+        return definitions.merge(achievements, on="achievement_id", how="left")
+    
+    @classmethod
+    def evaluate_all_users(cls, backend: Optional[StorageBackend] = None) -> Dict[str, List[int]]:
+        """
+        Recompute every user's achievements from their full history
+        
+        All activity rows are read and aggregated in one pass; existing
+        unlock timestamps are kept.
+        
+        Returns:
+            IDs of newly unlocked achievements per username
+        """
+        backend = backend or get_storage_backend()
+        history = backend.read_all_activities(columns=['date', 'tracker_type', 'tracker_name', 'value', 'goal'])
+        counters = cls.counters_from_history(history)
+        
+        results = {}
+        for username in backend.load_users()['username'].astype(str).str.lower():
+            user_counters = counters.loc[username].to_dict() if username in counters.index else {}
+            updated, unlocked = cls.apply_counters(cls._load(backend, username), user_counters)
+            backend.save_achievements(username, updated)
+            results[username] = [definition["id"] for definition in unlocked]
+        return results
+
+
 class DataExporter:
     """Export data in various formats"""
     
     @staticmethod
-    def export_to_csv(username: str, output_path: Path) -> bool:
+    def export_to_csv(username: str, output_path: Path, backend: Optional[StorageBackend] = None) -> bool:
         """Export all user data to CSV"""
         try:
-            data_file = USERS_DIR / f"{username}_data.csv"
-            df = pd.read_csv(data_file)
-            df.to_csv(output_path, index=False)
+            backend = backend or get_storage_backend()
+            df = backend.read_activities(username.lower())
+            df.to_csv(output_path, index=False, date_format=DATE_FORMAT)
             return True
         except Exception:
             return False
     
     @staticmethod
-    def export_tracker_summary(username: str, tracker_name: str, output_path: Path) -> bool:
+    def export_tracker_summary(username: str, tracker_name: str, output_path: Path,
+                               backend: Optional[StorageBackend] = None) -> bool:
         """Export summary of specific tracker"""
         try:
-            data_file = USERS_DIR / f"{username}_data.csv"
-            df = pd.read_csv(data_file)
-            tracker_data = df[df['tracker_name'] == tracker_name]
-            tracker_data.to_csv(output_path, index=False)
+            backend = backend or get_storage_backend()
+            tracker_data = backend.read_activities(username.lower(), tracker_name=tracker_name)
+            tracker_data.to_csv(output_path, index=False, date_format=DATE_FORMAT)
             return True
         except Exception:
             return False
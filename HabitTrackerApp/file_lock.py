@@ -0,0 +1,133 @@
+"""
+Advisory File Locks for data files shared between processes
+- Reader/writer (shared/exclusive) locks with a bounded wait
+- fcntl.flock on Linux/macOS, msvcrt (exclusive only) on Windows
+- Re-entrant per thread
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config import FILE_LOCK_TIMEOUT
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class LockTimeout(TimeoutError):
+    """A file lock wasn't granted within the timeout"""
+
+
+# Per thread: lock file path -> (exclusive, depth, fd) for locks it holds
+_held = threading.local()
+
+
+def _held_locks() -> Dict[str, Tuple[bool, int, int]]:
+    """Locks held by the current thread"""
+    locks = getattr(_held, "locks", None)
+    if locks is None:
+        locks = _held.locks = {}
+    return locks
+
+
+class FileLock:
+    """
+    Reader/writer lock guarding one data file across processes
+
+    The lock is taken on a hidden sidecar file (.<name>.lock) rather than
+    the data file itself, because atomic rewrites replace the data file's
+    inode. Locks are advisory: they only exclude code that locks too.
+
+    Every acquisition opens its own descriptor, so threads of one process
+    exclude each other like separate processes do; a thread that already
+    holds the lock gets it again without blocking (an exclusive hold also
+    covers shared requests). Upgrading a shared hold to exclusive isn't
+    supported and raises RuntimeError.
+    """
+
+    POLL_INTERVAL = 0.005   # first retry delay, doubled up to MAX_POLL_INTERVAL
+    MAX_POLL_INTERVAL = 0.05
+
+    def __init__(self, path: Path, timeout: Optional[float] = None):
+        """Initialize lock for a data file (timeout defaults to config.FILE_LOCK_TIMEOUT)"""
+        path = Path(path)
+        self.lock_path = str(path.with_name(f".{path.name}.lock"))
+        self.timeout = FILE_LOCK_TIMEOUT if timeout is None else timeout
+
+    def shared(self):
+        """Context manager holding the lock for reading"""
+        return self._hold(exclusive=False)
+
+    def exclusive(self):
+        """Context manager holding the lock for writing"""
+        return self._hold(exclusive=True)
+
+    @contextmanager
+    def _hold(self, exclusive: bool):
+        """Acquire (or re-enter) the lock for the duration of the block"""
+        locks = _held_locks()
+        held = locks.get(self.lock_path)
+        if held is not None:
+            held_exclusive, depth, fd = held
+            if exclusive and not held_exclusive:
+                raise RuntimeError(f"{self.lock_path} is held shared; release it before locking exclusively")
+            locks[self.lock_path] = (held_exclusive, depth + 1, fd)
+            try:
+                yield
+            finally:
+                locks[self.lock_path] = (held_exclusive, depth, fd)
+            return
+
+        fd = self._acquire(exclusive)
+        locks[self.lock_path] = (exclusive, 1, fd)
+        try:
+            yield
+        finally:
+            del locks[self.lock_path]
+            self._release(fd)
+
+    def _acquire(self, exclusive: bool) -> int:
+        """Open the lock file and wait (bounded) for the lock"""
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + self.timeout
+        delay = self.POLL_INTERVAL
+        while True:
+            try:
+                self._try_lock(fd, exclusive)
+                return fd
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    mode = "exclusive" if exclusive else "shared"
+                    raise LockTimeout(f"Timed out after {self.timeout:.1f}s waiting for a {mode} lock on "
+                                      f"{self.lock_path}") from None
+                time.sleep(delay)
+                delay = min(delay * 2, self.MAX_POLL_INTERVAL)
+
+    @staticmethod
+    def _try_lock(fd: int, exclusive: bool):
+        """Take the lock without blocking (OSError if it's held elsewhere)"""
+        if fcntl is not None:
+            fcntl.flock(fd, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+        else:
+            # msvcrt has no shared mode: readers exclude each other too
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    @staticmethod
+    def _release(fd: int):
+        """Unlock and close the lock file"""
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
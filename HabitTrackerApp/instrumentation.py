@@ -0,0 +1,238 @@
+"""
+Opt-in Instrumentation
+- Call counts and wall time per method in an in-process metrics registry
+- Rows/bytes read and written, attributed to the calls that caused them
+- JSON dumps to LOGS_DIR
+
+Enable with HABIT_TRACKER_PROFILE=1 (see config.INSTRUMENTATION_ENABLED) or
+instrumentation.enable(). While disabled, @instrumented classes keep their
+original methods (the timing wrappers are only swapped in by enable()), and
+the record_* hooks return after one flag check.
+"""
+import atexit
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from config import INSTRUMENTATION_ENABLED, LOGS_DIR
+
+COUNTERS = ("rows_read", "bytes_read", "bytes_written")
+
+
+class MetricsRegistry:
+    """
+    Thread-safe metrics for named spans
+
+    Each thread keeps a stack of the spans it is inside; rows and bytes
+    recorded by storage code are added to every span on the stack, so a
+    method's counters (like its wall time) include its nested calls.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self.enabled = False
+        self._metrics: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.started = datetime.now()
+
+    def _stack(self) -> list:
+        """Span names active on this thread (outermost first)"""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _entry(self, name: str) -> Dict[str, float]:
+        """Metrics of a span, created on first use (call with the lock held)"""
+        entry = self._metrics.get(name)
+        if entry is None:
+            entry = self._metrics[name] = {
+                "calls": 0, "errors": 0, "total_s": 0.0, "max_s": 0.0,
+                **{counter: 0 for counter in COUNTERS}
+            }
+        return entry
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the body as one call of span name"""
+        stack = self._stack()
+        stack.append(name)
+        failed = False
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                entry = self._entry(name)
+                entry["calls"] += 1
+                entry["errors"] += failed
+                entry["total_s"] += elapsed
+                entry["max_s"] = max(entry["max_s"], elapsed)
+
+    def add(self, **counts: int):
+        """Add rows/bytes counts to every span active on this thread"""
+        names = set(self._stack()) or {"(untracked)"}
+        with self._lock:
+            for name in names:
+                entry = self._entry(name)
+                for counter, amount in counts.items():
+                    entry[counter] += amount
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Copy of all metrics, with mean_ms/total_ms derived per span"""
+        with self._lock:
+            metrics = {name: dict(entry) for name, entry in self._metrics.items()}
+        for entry in metrics.values():
+            entry["total_ms"] = round(entry["total_s"] * 1000, 3)
+            entry["mean_ms"] = round(entry["total_ms"] / entry["calls"], 3) if entry["calls"] else 0.0
+            entry["max_ms"] = round(entry.pop("max_s") * 1000, 3)
+            del entry["total_s"]
+        return metrics
+
+    def reset(self):
+        """Drop all recorded metrics"""
+        with self._lock:
+            self._metrics.clear()
+            self.started = datetime.now()
+
+
+registry = MetricsRegistry()
+
+# (class, attribute, original, timed wrapper) for every @instrumented method
+_methods: List[Tuple[type, str, Any, Any]] = []
+
+
+def enable(enabled: bool = True):
+    """Turn recording on or off at runtime (swaps the instrumented methods in or out)"""
+    registry.enabled = enabled
+    for cls, attr, original, wrapper in _methods:
+        setattr(cls, attr, wrapper if enabled else original)
+
+
+def is_enabled() -> bool:
+    """Whether calls are being recorded"""
+    return registry.enabled
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """Decorator recording calls of a function under name (default: its qualified name)"""
+    def decorate(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            with registry.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def instrumented(cls: Optional[type] = None, *, prefixes: Optional[Iterable[str]] = None):
+    """
+    Class decorator applying timed() to the public methods of a class
+
+    Plain, static and class methods are wrapped; with prefixes only methods
+    whose names start with one of them (e.g. "show_"). The wrappers are
+    installed while recording is enabled and removed again by enable(False).
+    Usable bare (@instrumented) or with arguments (@instrumented(prefixes=...)).
+    """
+    def decorate(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or (prefixes and not attr.startswith(tuple(prefixes))):
+                continue
+            name = f"{cls.__name__}.{attr}"
+            if isinstance(value, (staticmethod, classmethod)):
+                wrapper = type(value)(timed(name)(value.__func__))
+            elif callable(value):
+                wrapper = timed(name)(value)
+            else:
+                continue
+            _methods.append((cls, attr, value, wrapper))
+            if registry.enabled:
+                setattr(cls, attr, wrapper)
+        return cls
+    return decorate if cls is None else decorate(cls)
+
+
+def span(name: str):
+    """Context manager timing a block as one call of name (no-op while disabled)"""
+    if not registry.enabled:
+        return _NULL_SPAN
+    return registry.span(name)
+
+
+class _NullSpan:
+    """Reusable do-nothing context manager"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def _size(path: Union[str, Path]) -> int:
+    """File size in bytes (0 if missing)"""
+    try:
+        return Path(path).stat().st_size
+    except OSError:
+        return 0
+
+
+def record_read(rows: int = 0, path: Optional[Union[str, Path]] = None, nbytes: int = 0):
+    """Count rows read and bytes read (nbytes, or the size of the file at path)"""
+    if registry.enabled:
+        registry.add(rows_read=rows, bytes_read=nbytes + (_size(path) if path is not None else 0))
+
+
+def record_write(nbytes: int = 0, path: Optional[Union[str, Path]] = None):
+    """Count bytes written (nbytes, or the size of the file at path after a full rewrite)"""
+    if registry.enabled:
+        registry.add(bytes_written=nbytes + (_size(path) if path is not None else 0))
+
+
+def snapshot() -> Dict[str, Any]:
+    """Current metrics with the recording window"""
+    return {
+        "started": registry.started.isoformat(timespec="seconds"),
+        "captured": datetime.now().isoformat(timespec="seconds"),
+        "metrics": registry.snapshot(),
+    }
+
+
+def dump(output_path: Optional[Path] = None) -> Optional[Path]:
+    """
+    Write the metrics as JSON (default: a timestamped file in LOGS_DIR)
+
+    Returns:
+        The file written, or None if nothing was recorded
+    """
+    report = snapshot()
+    if not report["metrics"]:
+        return None
+    if output_path is None:
+        output_path = LOGS_DIR / f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return output_path
+
+
+if INSTRUMENTATION_ENABLED:
+    enable()
+    atexit.register(dump)
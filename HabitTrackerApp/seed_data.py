@@ -2,19 +2,28 @@
 Seed Script: Create test users with random activities
 Run this script to populate the database with sample data for testing
 """
+import argparse
 import sys
+import time
 from pathlib import Path
 import random
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from itertools import compress
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from data_handler import UserDataManager, TrackerDataManager
-from trackers.student_trackers import get_student_trackers
-from trackers.adult_trackers import get_adult_trackers
-from trackers.senior_trackers import get_senior_trackers
+from config import STORAGE_BACKEND, ensure_directories
+from data_handler import UserDataManager, TrackerDataManager, UserRegistry, AchievementEngine
+from storage import (
+    StorageBackend, CSVBackend, SQLiteBackend, get_storage_backend, normalize_activity_frame, ACTIVITY_COLUMNS
+)
+from trackers.registry import get_role_trackers, validate_activities
+from utils import PasswordHasher
 
 
 # Test user templates
@@ -119,15 +128,23 @@ TEST_USERS = [
 ]
 
 
+# Reminder templates for seeded users
+REMINDER_TEMPLATES = [
+    {"title": "Morning Exercise", "description": "Do 30 minutes of exercise", "time": "07:00", "category": "health"},
+    {"title": "Take Vitamins", "description": "Don't forget daily vitamins", "time": "08:00", "category": "health"},
+    {"title": "Study Session", "description": "Complete study goals", "time": "10:00", "category": "academic"},
+    {"title": "Drink Water", "description": "Stay hydrated!", "time": "12:00", "category": "health"},
+    {"title": "Lunch Break", "description": "Eat a healthy meal", "time": "12:30", "category": "health"},
+    {"title": "Afternoon Review", "description": "Review progress", "time": "16:00", "category": "general"},
+    {"title": "Evening Walk", "description": "30 minute evening walk", "time": "18:00", "category": "health"},
+    {"title": "Read a Book", "description": "Read for 20 minutes", "time": "20:00", "category": "learning"},
+    {"title": "Sleep Reminder", "description": "Prepare for bed", "time": "22:00", "category": "health"},
+]
+
+
 def get_trackers_for_role(role: str):
     """Get trackers based on user role"""
-    if role == "student":
-        return get_student_trackers()
-    elif role == "adult":
-        return get_adult_trackers()
-    elif role == "senior":
-        return get_senior_trackers()
-    return []
+    return get_role_trackers(role)
 
 
 def generate_random_value(tracker):
@@ -159,6 +176,7 @@ def create_test_users():
     print("  Creating Test Users")
     print("=" * 60)
 
+    new_users = []
     for user_data in TEST_USERS:
         username = user_data['username']
 
@@ -168,8 +186,11 @@ def create_test_users():
             created_users.append(user_data)
             continue
 
-        # Create user
-        success = user_manager.create_user(user_data)
+        new_users.append(user_data)
+
+    # Create all new users with one users table write
+    for user_data, success in zip(new_users, user_manager.create_users(new_users)):
+        username = user_data['username']
         if success:
             print(f"  [ok] Created user: {user_data['first_name']} {user_data['last_name']} (@{username})")
             created_users.append(user_data)
@@ -212,7 +233,7 @@ def add_random_activities(users):
             print("     No trackers available for activity generation")
             continue
 
-        activity_count = 0
+        pending = []
 
         # Generate activities for the past N days
         for days_ago in range(activity_days):
@@ -225,7 +246,7 @@ def add_random_activities(users):
             for tracker in daily_trackers:
                 value = generate_random_value(tracker)
 
-                activity_data = {
+                pending.append({
                     'date': date_str,
                     'tracker_type': tracker.tracker_type,
                     'tracker_name': tracker.name,
@@ -233,10 +254,16 @@ def add_random_activities(users):
                     'goal': tracker.goal,
                     'unit': tracker.unit,
                     'completed': 'yes' if value >= tracker.goal else 'no'
-                }
+                })
+
+        # Check the whole batch against the tracker bounds in one pass
+        valid = validate_activities(role, pd.DataFrame(pending, columns=['tracker_name', 'value']))
+        if not valid.all():
+            print(f"     Skipping {int((~valid).sum())} out-of-range values")
+            pending = list(compress(pending, valid))
 
-                if tracker_manager.log_activity(activity_data):
-                    activity_count += 1
+        # One write for the whole history instead of one per row
+        activity_count = sum(tracker_manager.log_activities(pending))
 
         print(f"     Added {activity_count} activities over {activity_days} days")
 
@@ -247,18 +274,6 @@ def add_random_reminders(users):
     print("  Adding Random Reminders")
     print("=" * 60)
 
-    reminder_templates = [
-        {"title": "Morning Exercise", "description": "Do 30 minutes of exercise", "time": "07:00", "category": "health"},
-        {"title": "Take Vitamins", "description": "Don't forget daily vitamins", "time": "08:00", "category": "health"},
-        {"title": "Study Session", "description": "Complete study goals", "time": "10:00", "category": "academic"},
-        {"title": "Drink Water", "description": "Stay hydrated!", "time": "12:00", "category": "health"},
-        {"title": "Lunch Break", "description": "Eat a healthy meal", "time": "12:30", "category": "health"},
-        {"title": "Afternoon Review", "description": "Review progress", "time": "16:00", "category": "general"},
-        {"title": "Evening Walk", "description": "30 minute evening walk", "time": "18:00", "category": "health"},
-        {"title": "Read a Book", "description": "Read for 20 minutes", "time": "20:00", "category": "learning"},
-        {"title": "Sleep Reminder", "description": "Prepare for bed", "time": "22:00", "category": "health"},
-    ]
-
     today = datetime.now()
 
     for user_data in users:
@@ -267,7 +282,7 @@ def add_random_reminders(users):
 
         # Add 2-4 random reminders
         num_reminders = random.randint(2, 4)
-        selected_reminders = random.sample(reminder_templates, num_reminders)
+        selected_reminders = random.sample(REMINDER_TEMPLATES, num_reminders)
 
         reminder_count = 0
         for reminder in selected_reminders:
@@ -288,6 +303,206 @@ def add_random_reminders(users):
 
         print(f"  Added {reminder_count} reminders for @{username}")
 
+# Synthetic load-test data (see generate_dataset and the "generate" command)
+GENERATED_PASSWORD = "LoadTest123!"   # every generated account shares it (hashed once)
+GENERATED_ACTIVE_DAY_RATE = 0.9       # share of days a generated user logs anything
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Riya", "Omar", "Mina", "Lucas", "Sara", "Noah"]
+LAST_NAMES = ["Smith", "Khan", "Garcia", "Chen", "Rahman", "Silva", "Okafor", "Miller", "Haque", "Brown"]
+
+
+def generate_random_values(tracker_types, goals, min_values, max_values, rng) -> np.ndarray:
+    """
+    NumPy version of generate_random_value for many rows at once
+
+    Args:
+        tracker_types, goals, min_values, max_values: Per-row tracker fields
+        rng: numpy.random.Generator
+
+    Returns:
+        One value per row, drawn like generate_random_value would
+    """
+    tracker_types = np.asarray(tracker_types)
+    goals = np.asarray(goals, dtype=float)
+    min_values = np.asarray(min_values, dtype=float)
+    max_values = np.asarray(max_values, dtype=float)
+    draws = rng.random(len(goals))
+
+    numeric_high = np.minimum(goals * 1.5, max_values)
+    return np.select(
+        [
+            tracker_types == "duration",
+            tracker_types == "counter",
+            tracker_types == "rating",
+            tracker_types == "checkbox",
+            tracker_types == "numeric"
+        ],
+        [
+            np.round(draws * goals * 1.5, 1),                               # 0 .. goal * 1.5 hours
+            np.floor(draws * (np.floor(goals * 1.5) + 1)),                  # 0 .. int(goal * 1.5)
+            1 + np.floor(draws * max_values),                               # 1 .. max
+            (draws > 0.3).astype(float),                                    # 70% completion
+            np.round(min_values + draws * (numeric_high - min_values), 2)   # min .. min(goal * 1.5, max)
+        ],
+        default=0.0
+    )
+
+
+def generate_users(num_users: int, rng, password_hash: str, prefix: str = "loaduser") -> List[Dict]:
+    """Users table rows for a synthetic cohort (usernames <prefix>000000, ...)"""
+    usernames = [f"{prefix}{i:06d}" for i in range(num_users)]
+    birth_dates = pd.Timestamp("1945-01-01") + pd.to_timedelta(rng.integers(0, 63 * 365, num_users), unit="D")
+    users = pd.DataFrame({
+        "username": usernames,
+        "first_name": rng.choice(FIRST_NAMES, num_users),
+        "last_name": rng.choice(LAST_NAMES, num_users),
+        "email": [f"{username}@example.com" for username in usernames],
+        "phone": [f"01{i:09d}" for i in range(num_users)],
+        "date_of_birth": birth_dates.strftime("%m/%d/%Y"),
+        "role": rng.choice(["student", "adult", "senior"], num_users),
+        "gender": rng.choice(["male", "female"], num_users)
+    })
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return [UserDataManager.build_user_row(user, password_hash, timestamp) for user in users.to_dict('records')]
+
+
+def generate_activities(usernames: np.ndarray, roles: np.ndarray, days: int, trackers_per_day: int,
+                        rng, end_date: date) -> pd.DataFrame:
+    """
+    Activity history for many users at once
+
+    Each user logs on about GENERATED_ACTIVE_DAY_RATE of the days up to
+    end_date, picking trackers_per_day distinct trackers of their role.
+
+    Returns:
+        Rows with a leading username column, date-ascending per user
+    """
+    dates = np.datetime_as_string(np.datetime64(end_date, "D") - np.arange(days - 1, -1, -1))
+    frames = []
+    for role in np.unique(roles):
+        trackers = get_trackers_for_role(role)
+        picks_per_day = min(trackers_per_day, len(trackers))
+        if picks_per_day <= 0:
+            continue
+        catalog = {
+            field: np.array([getattr(tracker, field) for tracker in trackers])
+            for field in ("name", "tracker_type", "unit", "goal", "min_value", "max_value")
+        }
+        role_users = usernames[roles == role]
+
+        # (user, day) pairs that were logged, then distinct trackers per pair
+        user_index = np.repeat(np.arange(len(role_users)), days)
+        day_index = np.tile(np.arange(days), len(role_users))
+        active = rng.random(len(user_index)) < GENERATED_ACTIVE_DAY_RATE
+        user_index, day_index = user_index[active], day_index[active]
+        picks = np.argsort(rng.random((len(user_index), len(trackers))), axis=1)[:, :picks_per_day].ravel()
+        user_index = np.repeat(user_index, picks_per_day)
+        day_index = np.repeat(day_index, picks_per_day)
+
+        goals = catalog["goal"][picks].astype(float)
+        values = generate_random_values(
+            catalog["tracker_type"][picks], goals, catalog["min_value"][picks], catalog["max_value"][picks], rng
+        )
+        frames.append(pd.DataFrame({
+            "username": role_users[user_index],
+            "date": dates[day_index],
+            "tracker_type": catalog["tracker_type"][picks],
+            "tracker_name": catalog["name"][picks],
+            "value": values,
+            "goal": goals,
+            "unit": catalog["unit"][picks],
+            "notes": "",
+            "completed": np.where(values >= goals, "yes", "no")
+        }))
+
+    if not frames:
+        return pd.DataFrame(columns=["username"] + ACTIVITY_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def generate_reminders(usernames: np.ndarray, rng, start_date: date) -> pd.DataFrame:
+    """2-4 reminders per user from REMINDER_TEMPLATES, due within a week of start_date"""
+    templates = pd.DataFrame(REMINDER_TEMPLATES)
+    counts = rng.integers(2, 5, len(usernames))
+    picks = np.argsort(rng.random((len(usernames), len(templates))), axis=1)[:, :4]
+    keep = np.arange(4) < counts[:, None]
+    chosen = templates.iloc[picks[keep]].reset_index(drop=True)
+    dates = np.datetime64(start_date, "D") + rng.integers(0, 8, len(chosen))
+
+    return pd.DataFrame({
+        "username": np.repeat(usernames, counts),
+        "reminder_id": np.cumsum(keep, axis=1)[keep],
+        "title": chosen["title"],
+        "description": chosen["description"],
+        "date": np.datetime_as_string(dates),
+        "time": chosen["time"],
+        "recurrence": rng.choice(["once", "daily", "weekly"], len(chosen)),
+        "category": chosen["category"],
+        "priority": rng.choice(["low", "medium", "high"], len(chosen)),
+        "tracker_link": "",
+        "status": "pending"
+    })
+
+
+def generate_dataset(num_users: int, days: int = 365, trackers_per_day: int = 5, seed: int = 42,
+                     backend: Optional[StorageBackend] = None, chunk_size: int = 500,
+                     prefix: str = "loaduser") -> Dict[str, int]:
+    """
+    Write a synthetic dataset for load testing straight through the bulk storage APIs
+
+    Users are appended to the users table in one write; activities,
+    reminders and achievements are generated and imported chunk_size users
+    at a time, so memory stays flat for large cohorts. The same seed and chunk_size
+    give the same dataset. Users that already exist are left untouched.
+
+    Returns:
+        Counts of users, activities, reminders and achievement rows written
+    """
+    backend = backend or get_storage_backend()
+    backend.initialize()
+    rng = np.random.default_rng(seed)
+    today = datetime.now().date()
+    counts = {"users": 0, "activities": 0, "reminders": 0, "achievements": 0}
+
+    # Hashing is the slow part of account creation: all accounts share one hash
+    rows = generate_users(num_users, rng, PasswordHasher.hash_password(GENERATED_PASSWORD), prefix)
+    taken = UserRegistry.for_backend(backend).taken_keys()
+    rows = [row for row in rows if UserRegistry.normalize_key(row['username']) not in taken['username']]
+    if not rows:
+        print("  All generated users already exist")
+        return counts
+    UserRegistry.for_backend(backend).append(rows)
+    counts["users"] = len(rows)
+
+    usernames = np.array([row['username'] for row in rows], dtype=object)
+    roles = np.array([row['role'] for row in rows], dtype=object)
+    for start in range(0, len(rows), chunk_size):
+        chunk_users = usernames[start:start + chunk_size]
+        activities = generate_activities(chunk_users, roles[start:start + chunk_size], days,
+                                         trackers_per_day, rng, today)
+        reminders = generate_reminders(chunk_users, rng, today)
+
+        counters = AchievementEngine.counters_from_history(normalize_activity_frame(activities.copy()))
+        achievements = AchievementEngine.rows_from_counters(counters.reindex(chunk_users, fill_value=0))
+
+        backend.import_user_data(activities, reminders, achievements)
+        counts["activities"] += len(activities)
+        counts["reminders"] += len(reminders)
+        counts["achievements"] += len(achievements)
+        print(f"  Generated users {start + 1}-{start + len(chunk_users)} of {len(rows)} "
+              f"({counts['activities']:,} activities so far)")
+
+    return counts
+
+
+def make_backend(kind: str, data_dir: Optional[Path]) -> StorageBackend:
+    """Storage backend of a kind rooted at data_dir (default: the app's configured storage)"""
+    if data_dir is None:
+        return get_storage_backend()
+    if kind == "sqlite":
+        return SQLiteBackend(data_dir / "habit_tracker.db")
+    return CSVBackend(data_dir / "users_data.csv", data_dir / "users")
+
+
 def run_seed():
     """Main function to run the seeding process"""
     print()
@@ -322,3 +537,48 @@ def run_seed():
             print(f"  Activity days: {user['activity_days']}")
         print()
 
+
+def main(argv: Optional[List[str]] = None):
+    """Seed the sample accounts, or generate a load-test dataset (generate command)"""
+    parser = argparse.ArgumentParser(description="Populate the habit tracker with test data")
+    commands = parser.add_subparsers(dest="command")
+
+    generate = commands.add_parser("generate", help="generate a synthetic dataset for load testing")
+    generate.add_argument("--users", type=int, default=1000, help="number of users (default: 1000)")
+    generate.add_argument("--days", type=int, default=365, help="days of history per user (default: 365)")
+    generate.add_argument("--trackers-per-day", type=int, default=5,
+                          help="trackers logged per active day (default: 5)")
+    generate.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+    generate.add_argument("--data-dir", type=Path,
+                          help="write to this directory instead of the app's data directory")
+    generate.add_argument("--backend", choices=["csv", "sqlite"], default=STORAGE_BACKEND,
+                          help="storage layout for --data-dir (default: config.STORAGE_BACKEND)")
+    generate.add_argument("--chunk-size", type=int, default=500, help="users generated per batch (default: 500)")
+    generate.add_argument("--prefix", default="loaduser", help="username prefix (default: loaduser)")
+
+    args = parser.parse_args(argv)
+    ensure_directories()
+    if args.command != "generate":
+        run_seed()
+        return
+
+    print()
+    print(f"Generating {args.users} users x {args.days} days (seed {args.seed})...")
+    print()
+    start = time.perf_counter()
+    counts = generate_dataset(
+        args.users, args.days, args.trackers_per_day, args.seed,
+        backend=make_backend(args.backend, args.data_dir),
+        chunk_size=args.chunk_size, prefix=args.prefix
+    )
+    print()
+    print("=" * 60)
+    print(f"  Done in {time.perf_counter() - start:.1f}s")
+    print("=" * 60)
+    for name, count in counts.items():
+        print(f"  {name.title()}: {count:,}")
+    print(f"  Password for every generated user: {GENERATED_PASSWORD}")
+
+
+if __name__ == "__main__":
+    main()
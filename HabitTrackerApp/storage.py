@@ -0,0 +1,1358 @@
+"""
+Storage Backends for Habit Tracker Application
+- Backend interface used by the data managers
+- CSV backend (users_data.csv + per-user CSV files, optional Parquet snapshots)
+- SQLite backend (single indexed database file)
+- One-shot CSV to SQLite migration
+"""
+import atexit
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Hashable, Callable, Tuple
+from file_lock import FileLock
+from instrumentation import is_enabled, record_read, record_write
+from config import (
+    USERS_DATA_FILE, USERS_DIR, SQLITE_DB_FILE, STORAGE_BACKEND,
+    ACHIEVEMENT_DEFINITIONS, COLUMNAR_SNAPSHOTS, SNAPSHOT_ROW_GROUP_SIZE,
+    SNAPSHOT_COMPACT_BYTES, CSV_WRITE_COALESCE_MS
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional dependency: snapshots are simply disabled
+    pa = None
+    pq = None
+
+
+USER_COLUMNS = [
+    "username", "password_hash", "first_name", "last_name",
+    "email", "phone", "date_of_birth", "role", "gender",
+    "created_date", "last_login", "timezone", "preferred_units",
+    "notification_enabled", "notification_sound", "quiet_hours_start",
+    "quiet_hours_end", "theme", "failed_login_attempts"
+]
+
+ACTIVITY_COLUMNS = [
+    "date", "tracker_type", "tracker_name", "value",
+    "goal", "unit", "notes", "completed"
+]
+
+REMINDER_COLUMNS = [
+    "reminder_id", "title", "description", "date", "time",
+    "recurrence", "category", "priority", "tracker_link", "status"
+]
+
+USER_ACHIEVEMENT_COLUMNS = ["achievement_id", "unlocked_date", "progress", "completed"]
+
+# history_signature: activities_signature of the history the state was computed from
+STREAK_COLUMNS = ["tracker_name", "current_streak", "longest_streak", "last_active_date", "history_signature"]
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Threads writing per-user files when many users are created at once
+CSV_WRITE_WORKERS = 8
+
+
+def append_csv_rows(file_path: Path, rows: List[Dict[str, Any]], columns: List[str]):
+    """
+    Append rows to the end of a CSV file without reading existing content
+
+    The header is written only when the file is missing or empty. Rows are
+    serialized in the given column order.
+    """
+    write_header = True
+    needs_newline = False
+    size = 0
+    if file_path.exists():
+        size = file_path.stat().st_size
+        if size > 0:
+            write_header = False
+            # Guard against a hand-edited file without a trailing newline
+            with open(file_path, 'rb') as f:
+                f.seek(-1, 2)
+                needs_newline = f.read(1) not in (b"\n", b"\r")
+
+    df = pd.DataFrame(rows, columns=columns)
+    with open(file_path, 'a', newline='', encoding='utf-8') as f:
+        if needs_newline:
+            f.write("\n")
+        df.to_csv(f, header=write_header, index=False)
+    if is_enabled():
+        record_write(nbytes=file_path.stat().st_size - size)
+
+
+def write_synced(file_path: Path, write: Callable[[Any], None], binary: bool = False):
+    """Fill a file with write(f) and flush it to disk"""
+    with (open(file_path, 'wb') if binary else open(file_path, 'w', newline='', encoding='utf-8')) as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def replace_atomic(file_path: Path, write: Callable[[Any], None], binary: bool = False):
+    """
+    Replace a file so that readers (and a crash) see either the old or the new content
+
+    write(f) fills a temp file next to the target, which is then synced to
+    disk and swapped in with os.replace.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write_synced(Path(tmp_name), write, binary)
+        if file_path.exists():
+            os.chmod(tmp_name, stat.S_IMODE(file_path.stat().st_mode))
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    record_write(path=file_path)
+
+
+def write_csv_atomic(file_path: Path, df: pd.DataFrame):
+    """Replace a CSV file atomically with the rows of df"""
+    replace_atomic(file_path, lambda f: df.to_csv(f, index=False))
+
+
+# Every CoalescingWriter, flushed at interpreter exit
+_writers = weakref.WeakSet()
+
+
+class CoalescingWriter:
+    """
+    Deferred full-file CSV rewrites, coalesced per file
+
+    Changes are queued as patches (functions from the file's current frame
+    to the new one) and every pending file is rewritten once `delay`
+    seconds after the first change in a burst, so a burst of updates costs
+    one rewrite per file. Each rewrite holds the file's exclusive FileLock,
+    re-reads the file, applies the queued patches in order and swaps the
+    result in with write_csv_atomic, so changes other processes made in the
+    meantime are kept. Code that reads a file calls flush(path) first so it
+    sees its own writes.
+    """
+
+    def __init__(self, delay: float):
+        """Initialize writer (delay <= 0 writes through immediately)"""
+        self.delay = delay
+        self._pending: Dict[Path, List[Tuple[Optional[Callable], Callable]]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # keeps writes of the same file in order
+        self._timer: Optional[threading.Timer] = None
+        _writers.add(self)
+
+    def schedule(self, file_path: Path, patch: Callable[[Optional[pd.DataFrame]], pd.DataFrame],
+                 read: Optional[Callable[[], pd.DataFrame]] = None):
+        """
+        Queue a change of file_path
+
+        Args:
+            patch: Returns the new content given the current frame
+            read: Loads the current frame; None means patch replaces the
+                whole file (it gets None) and earlier changes are dropped
+        """
+        with self._lock:
+            if read is None:
+                self._pending[file_path] = [(None, patch)]
+            else:
+                self._pending.setdefault(file_path, []).append((read, patch))
+            if self.delay > 0 and self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if self.delay <= 0:
+            self.flush(file_path)
+
+    def flush(self, file_path: Optional[Path] = None):
+        """Write pending changes now (of all files, or only file_path's)"""
+        with self._flush_lock:
+            with self._lock:
+                if file_path is None:
+                    items = list(self._pending.items())
+                    self._pending.clear()
+                    if self._timer is not None:
+                        self._timer.cancel()
+                        self._timer = None
+                elif file_path in self._pending:
+                    items = [(file_path, self._pending.pop(file_path))]
+                else:
+                    return
+            for index, (path, patches) in enumerate(items):
+                if not path.parent.exists():
+                    continue  # the store was deleted meanwhile (e.g. a temporary test directory)
+                try:
+                    with FileLock(path).exclusive():
+                        df = None
+                        for read, patch in patches:
+                            if read is not None and df is None:
+                                df = read()
+                            df = patch(df)
+                        write_csv_atomic(path, df)
+                except Exception:
+                    # Keep what couldn't be written for the next flush, ahead of newer changes
+                    with self._lock:
+                        for failed_path, failed_patches in items[index:]:
+                            self._pending[failed_path] = failed_patches + self._pending.get(failed_path, [])
+                    raise
+
+
+def flush_pending_writes():
+    """Write out every coalesced write in the process (runs at exit)"""
+    for writer in list(_writers):
+        writer.flush()
+
+
+atexit.register(flush_pending_writes)
+
+
+def normalize_activity_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse the date column of an activity frame into datetime64"""
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT, errors='coerce')
+    return df
+
+
+def restore_float32(values: pd.Series) -> pd.Series:
+    """
+    Widen float32 values back to float64 without float32 noise
+
+    Rounds to 7 significant digits (float32's precision), so a stored 2.3
+    comes back as 2.3 instead of 2.299999952316284.
+    """
+    wide = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    magnitude = np.abs(wide)
+    safe = np.where((magnitude > 0) & np.isfinite(magnitude), magnitude, 1.0)
+    scale = 10.0 ** (6 - np.floor(np.log10(safe)))
+    return pd.Series(np.round(wide * scale) / scale, index=values.index)
+
+
+def set_where(df: pd.DataFrame, mask: pd.Series, column: str, value: Any):
+    """Set column to value on the masked rows (widening the dtype if the value doesn't fit)"""
+    try:
+        df.loc[mask, column] = value
+    except (TypeError, ValueError):
+        df[column] = df[column].astype(object)
+        df.loc[mask, column] = value
+
+
+def default_achievement_rows() -> List[Dict[str, Any]]:
+    """Initial (all locked) achievement rows for a new user"""
+    return [
+        {
+            "achievement_id": achievement["id"],
+            "unlocked_date": "",
+            "progress": 0,
+            "completed": "no"
+        }
+        for achievement in ACHIEVEMENT_DEFINITIONS
+    ]
+
+
+class StorageBackend(ABC):
+    """
+    Interface implemented by every storage backend
+
+    Activity frames returned by read_activities always have the date column
+    parsed to datetime64; dates passed in as filters are "YYYY-MM-DD" strings.
+    """
+
+    @abstractmethod
+    def initialize(self):
+        """Create the users table/file if it doesn't exist"""
+
+    def flush(self):
+        """Write out deferred writes (no-op for backends that write through)"""
+
+    def lock_activities(self, username: str):
+        """
+        Context manager excluding other writers of a user's activities
+
+        Held around a log so the append and the streak/achievement updates
+        derived from it aren't interleaved with another process's. No-op
+        for backends that lock internally.
+        """
+        return nullcontext()
+
+    # Users
+    @abstractmethod
+    def users_signature(self) -> Hashable:
+        """Value that changes whenever the users table changes"""
+
+    @abstractmethod
+    def load_users(self) -> pd.DataFrame:
+        """Load the full users table"""
+
+    @abstractmethod
+    def insert_users(self, rows: List[Dict[str, Any]], frame: pd.DataFrame):
+        """Persist new user rows (frame is the in-memory table after the insert)"""
+
+    @abstractmethod
+    def update_users(self, updates: Dict[str, Dict[str, Any]], frame: pd.DataFrame):
+        """Persist column updates keyed by username (frame is the updated in-memory table)"""
+
+    @abstractmethod
+    def update_user_row(self, username: str,
+                        compute: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Read-modify-write one user's stored row, written through immediately
+
+        compute gets the row as it is stored right now (other processes'
+        changes included) and returns the column updates to apply; no other
+        writer can change the row in between.
+
+        Returns:
+            The updated row, or None if the user doesn't exist
+        """
+
+    @abstractmethod
+    def create_user_storage(self, username: str):
+        """Create empty activity/reminder/achievement storage for a new user"""
+
+    def create_users_storage(self, usernames: List[str]):
+        """create_user_storage for many new users at once"""
+        for username in usernames:
+            self.create_user_storage(username)
+
+    # Activities
+    @abstractmethod
+    def activities_signature(self, username: str) -> Hashable:
+        """Value that changes whenever a user's activities change"""
+
+    @abstractmethod
+    def append_activities(self, username: str, rows: List[Dict[str, Any]]):
+        """Append activity rows for a user"""
+
+    @abstractmethod
+    def read_activities(self, username: str, start_date: Optional[str] = None,
+                        end_date: Optional[str] = None, tracker_name: Optional[str] = None,
+                        columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read a user's activities, optionally filtered by inclusive date range and tracker"""
+
+    def compact_activities(self, username: str) -> int:
+        """Fold recently appended activities into a read-optimized form (returns rows folded)"""
+        return 0
+
+    def read_all_activities(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Activities of every user in one frame, with a leading username column"""
+        frames = []
+        for username in self.load_users()['username'].astype(str).str.lower():
+            try:
+                df = self.read_activities(username, columns=columns)
+            except FileNotFoundError:
+                continue
+            df.insert(0, 'username', username)
+            frames.append(df)
+        if not frames:
+            return normalize_activity_frame(pd.DataFrame(columns=['username'] + (columns or ACTIVITY_COLUMNS)))
+        return pd.concat(frames, ignore_index=True)
+
+    # Reminders
+    @abstractmethod
+    def read_reminders(self, username: str, date: Optional[str] = None) -> pd.DataFrame:
+        """Read a user's reminders, optionally for a single date"""
+
+    @abstractmethod
+    def add_reminder(self, username: str, reminder: Dict[str, Any]) -> int:
+        """Store a reminder and return its new reminder_id"""
+
+    @abstractmethod
+    def update_reminder_status(self, username: str, reminder_id: int, status: str) -> bool:
+        """Set the status of one reminder"""
+
+    # Achievements
+    @abstractmethod
+    def load_achievements(self, username: str) -> pd.DataFrame:
+        """Load a user's achievement progress"""
+
+    @abstractmethod
+    def save_achievements(self, username: str, df: pd.DataFrame):
+        """Replace a user's achievement progress"""
+
+    # Streaks
+    @abstractmethod
+    def load_streaks(self, username: str) -> Optional[pd.DataFrame]:
+        """Load a user's persisted streak state (None if never stored)"""
+
+    @abstractmethod
+    def save_streaks(self, username: str, df: pd.DataFrame):
+        """Replace a user's persisted streak state"""
+
+    # Bulk import
+    @abstractmethod
+    def import_user_data(self, activities: pd.DataFrame, reminders: pd.DataFrame,
+                         achievements: pd.DataFrame):
+        """
+        Replace the activities, reminders and achievements of many users at once
+
+        Counterpart of read_all_activities: every frame has a leading
+        username column, activity dates are DATE_FORMAT strings. Stored
+        streak state of these users is dropped (it is rebuilt on demand).
+        """
+
+
+class CSVBackend(StorageBackend):
+    """
+    Storage in users_data.csv plus <user>_data/_reminders/_achievements.csv files
+
+    With columnar snapshots enabled (config.COLUMNAR_SNAPSHOTS and pyarrow
+    installed), a user's activity history lives in <user>_data.parquet and
+    <user>_data.csv only holds the rows appended since the last compaction.
+    The snapshot is sorted by date and stores typed columns (date32,
+    dictionary-encoded names, float32 values), so reads fetch just the
+    columns they need and skip row groups outside the requested dates.
+    Compaction runs on a background thread once the tail outgrows
+    config.SNAPSHOT_COMPACT_BYTES, off the logging path.
+    """
+
+    if pa is not None:
+        SNAPSHOT_SCHEMA = pa.schema([
+            ("date", pa.date32()),
+            ("tracker_type", pa.dictionary(pa.int32(), pa.string())),
+            ("tracker_name", pa.dictionary(pa.int32(), pa.string())),
+            ("value", pa.float32()),
+            ("goal", pa.float32()),
+            ("unit", pa.dictionary(pa.int32(), pa.string())),
+            ("notes", pa.string()),
+            ("completed", pa.dictionary(pa.int32(), pa.string())),
+        ])
+
+    def __init__(self, users_file: Path = USERS_DATA_FILE, users_dir: Path = USERS_DIR,
+                 columnar: Optional[bool] = None, write_delay_ms: Optional[int] = None):
+        """
+        Initialize CSV backend rooted at the given users file and directory
+
+        Args:
+            write_delay_ms: Coalescing window for full-file rewrites (users
+                table, reminders, achievements, streaks); default
+                config.CSV_WRITE_COALESCE_MS, 0 writes through
+        """
+        self.users_file = Path(users_file)
+        self.users_dir = Path(users_dir)
+        if columnar is None:
+            columnar = COLUMNAR_SNAPSHOTS
+        self.columnar = bool(columnar) and pq is not None
+        if write_delay_ms is None:
+            write_delay_ms = CSV_WRITE_COALESCE_MS
+        self.writer = CoalescingWriter(write_delay_ms / 1000)
+        self._compactor: Optional[ThreadPoolExecutor] = None
+        self._compactions: Dict[str, Future] = {}
+        self._compaction_lock = threading.Lock()
+
+    def activity_file(self, username: str) -> Path:
+        """Path of a user's activity CSV (the append tail when snapshots are on)"""
+        return self.users_dir / f"{username.lower()}_data.csv"
+
+    def snapshot_file(self, username: str) -> Path:
+        """Path of a user's columnar activity snapshot"""
+        return self.users_dir / f"{username.lower()}_data.parquet"
+
+    def reminders_file(self, username: str) -> Path:
+        """Path of a user's reminders CSV"""
+        return self.users_dir / f"{username.lower()}_reminders.csv"
+
+    def achievements_file(self, username: str) -> Path:
+        """Path of a user's achievements CSV"""
+        return self.users_dir / f"{username.lower()}_achievements.csv"
+
+    def streaks_file(self, username: str) -> Path:
+        """Path of a user's streak state CSV"""
+        return self.users_dir / f"{username.lower()}_streaks.csv"
+
+    def initialize(self):
+        """Create users_data.csv if it doesn't exist"""
+        self.users_dir.mkdir(parents=True, exist_ok=True)
+        if not self.users_file.exists():
+            pd.DataFrame(columns=USER_COLUMNS).to_csv(self.users_file, index=False)
+
+    def flush(self):
+        """Write pending rewrites now and wait for background compactions"""
+        self.writer.flush()
+        with self._compaction_lock:
+            compactions = list(self._compactions.values())
+        wait(compactions)
+
+    def users_signature(self) -> Hashable:
+        """(mtime_ns, size) of users_data.csv, or None if missing"""
+        return self._file_signature(self.users_file)
+
+    @staticmethod
+    def lock(path: Path) -> FileLock:
+        """Cross-process lock of a data file"""
+        return FileLock(path)
+
+    @contextmanager
+    def lock_activities(self, username: str):
+        """Exclusive lock on <user>_data.csv; the user's derived files are written out before release"""
+        with self.lock(self.activity_file(username)).exclusive():
+            yield
+            # The next process to log builds on these, so they can't wait for the coalescing timer
+            self.writer.flush(self.streaks_file(username))
+            self.writer.flush(self.achievements_file(username))
+
+    def load_users(self) -> pd.DataFrame:
+        """Load users_data.csv"""
+        self.writer.flush(self.users_file)
+        if not self.users_file.exists():
+            return pd.DataFrame(columns=USER_COLUMNS)
+        with self.lock(self.users_file).shared():
+            df = self._read_users()
+        record_read(len(df), self.users_file)
+        return df
+
+    def _read_users(self) -> pd.DataFrame:
+        """Parse users_data.csv"""
+        # Phone numbers are identifiers, not numbers (keeps leading zeros)
+        return pd.read_csv(self.users_file, dtype={"phone": str})
+
+    def insert_users(self, rows: List[Dict[str, Any]], frame: pd.DataFrame):
+        """Append new users to users_data.csv"""
+        with self.lock(self.users_file).exclusive():
+            append_csv_rows(self.users_file, rows, USER_COLUMNS)
+
+    def update_users(self, updates: Dict[str, Dict[str, Any]], frame: pd.DataFrame):
+        """Apply the updates to users_data.csv as it is on disk at write time (coalesced, atomic)"""
+        def patch(df: pd.DataFrame) -> pd.DataFrame:
+            usernames = df['username'].astype(str).str.lower()
+            for username, changes in updates.items():
+                mask = usernames == str(username).lower()
+                for key, value in changes.items():
+                    if key in df.columns:
+                        set_where(df, mask, key, value)
+            return df
+
+        self.writer.schedule(self.users_file, patch, read=self._read_users)
+
+    def update_user_row(self, username: str,
+                        compute: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Rewrite users_data.csv with one user's row changed, under the exclusive lock"""
+        self.writer.flush(self.users_file)
+        with self.lock(self.users_file).exclusive():
+            df = self._read_users()
+            mask = df['username'].astype(str).str.lower() == username.lower()
+            if not mask.any():
+                return None
+            changes = compute(df[mask].iloc[0].to_dict())
+            for key, value in changes.items():
+                if key in df.columns:
+                    set_where(df, mask, key, value)
+            if changes:
+                write_csv_atomic(self.users_file, df)
+            return df[mask].iloc[0].to_dict()
+
+    def create_user_storage(self, username: str):
+        """Create the three per-user CSV files"""
+        pd.DataFrame(columns=ACTIVITY_COLUMNS).to_csv(self.activity_file(username), index=False)
+        pd.DataFrame(columns=REMINDER_COLUMNS).to_csv(self.reminders_file(username), index=False)
+        pd.DataFrame(default_achievement_rows()).to_csv(self.achievements_file(username), index=False)
+
+    def create_users_storage(self, usernames: List[str]):
+        """Create the per-user CSV files of many users, written in parallel"""
+        # Every new user gets the same three files: serialize them once
+        templates = [
+            (self.activity_file, pd.DataFrame(columns=ACTIVITY_COLUMNS).to_csv(index=False)),
+            (self.reminders_file, pd.DataFrame(columns=REMINDER_COLUMNS).to_csv(index=False)),
+            (self.achievements_file, pd.DataFrame(default_achievement_rows()).to_csv(index=False))
+        ]
+
+        def write_files(username: str):
+            for file_for, content in templates:
+                with open(file_for(username), 'w', newline='', encoding='utf-8') as f:
+                    f.write(content)
+
+        if not usernames:
+            return
+        with ThreadPoolExecutor(max_workers=min(CSV_WRITE_WORKERS, len(usernames))) as pool:
+            list(pool.map(write_files, usernames))
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[tuple]:
+        """(mtime_ns, size) of a file, or None if missing"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def activities_signature(self, username: str) -> Hashable:
+        """mtime/size of the CSV tail and the snapshot"""
+        return (
+            self._file_signature(self.activity_file(username)),
+            self._file_signature(self.snapshot_file(username))
+        )
+
+    def append_activities(self, username: str, rows: List[Dict[str, Any]]):
+        """Append rows to <user>_data.csv without re-reading history"""
+        data_file = self.activity_file(username)
+        with self.lock(data_file).exclusive():
+            self._finish_swap(username)
+            append_csv_rows(data_file, rows, ACTIVITY_COLUMNS)
+            due = self.columnar and data_file.stat().st_size > SNAPSHOT_COMPACT_BYTES
+        if due:
+            self._schedule_compaction(username)
+
+    def _schedule_compaction(self, username: str):
+        """Queue compact_activities on the background thread (once per user at a time)"""
+        with self._compaction_lock:
+            if username in self._compactions:
+                return
+            if self._compactor is None:
+                self._compactor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compaction")
+            self._compactions[username] = self._compactor.submit(self._compact_in_background, username)
+
+    def _compact_in_background(self, username: str):
+        """Compaction job: errors are reported, the tail simply stays until the next try"""
+        try:
+            if self.activity_file(username).exists():  # the store may be gone (e.g. a temporary directory)
+                self.compact_activities(username)
+        except Exception as e:
+            print(f"Error compacting activities of {username}: {e}")
+        finally:
+            with self._compaction_lock:
+                self._compactions.pop(username, None)
+
+    def read_activities(self, username: str, start_date: Optional[str] = None,
+                        end_date: Optional[str] = None, tracker_name: Optional[str] = None,
+                        columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the snapshot (if any) and the CSV tail, only the needed columns, and filter"""
+        needed = list(columns) if columns is not None else list(ACTIVITY_COLUMNS)
+        if (start_date or end_date) and 'date' not in needed:
+            needed.append('date')
+        if tracker_name and 'tracker_name' not in needed:
+            needed.append('tracker_name')
+
+        # Tail and snapshot must come from the same side of a compaction
+        with self.lock(self.activity_file(username)).shared():
+            data_file, snapshot_file = self._activity_files(username)
+            df = self._read_csv_tail(data_file, None if columns is None else needed)
+            snapshot = None
+            if snapshot_file is not None and snapshot_file.exists():
+                snapshot = self._read_snapshot(snapshot_file, needed, start_date, end_date, tracker_name)
+
+        df = df[self._filter_mask(df, start_date, end_date, tracker_name)]
+        if snapshot is not None:
+            df = snapshot if df.empty else pd.concat([snapshot, df], ignore_index=True)
+
+        if columns is not None:
+            df = df[[column for column in columns if column in df.columns]]
+        return df
+
+    @staticmethod
+    def _read_csv_tail(data_file: Path, needed: Optional[List[str]]) -> pd.DataFrame:
+        """Parse <user>_data.csv, optionally only some columns"""
+        usecols = None if needed is None else (lambda column: column in needed)
+        df = pd.read_csv(data_file, usecols=usecols)
+        record_read(len(df), data_file)
+        return normalize_activity_frame(df)
+
+    def _swap_files(self, username: str) -> Tuple[Tuple[Path, Path], Tuple[Path, Path]]:
+        """(staged, live) paths of the snapshot and of the CSV tail"""
+        snapshot_file, data_file = self.snapshot_file(username), self.activity_file(username)
+        return ((snapshot_file.with_suffix(".parquet.tmp"), snapshot_file),
+                (data_file.with_suffix(".csv.tmp"), data_file))
+
+    def _swap_marker(self, username: str) -> Path:
+        """Marker present while a staged snapshot/tail pair is being swapped in"""
+        data_file = self.activity_file(username)
+        return data_file.with_name(f".{data_file.name}.swap")
+
+    def _swap_activity_files(self, username: str, tail: pd.DataFrame, snapshot: Optional["pa.Table"]):
+        """
+        Replace the CSV tail and the snapshot (None: remove it) as one step
+
+        Both files are staged and synced first, then the marker is written
+        and the two swaps happen. A crash after that point is rolled forward
+        (_finish_swap by the next writer, _activity_files for readers), one
+        before it leaves the old pair: rows never show up in both files, or
+        in neither. Call with the activity file locked exclusively.
+        """
+        (snapshot_tmp, _), (data_tmp, _) = self._swap_files(username)
+        if snapshot is not None:
+            write_synced(snapshot_tmp, binary=True,
+                         write=lambda f: pq.write_table(snapshot, f, row_group_size=SNAPSHOT_ROW_GROUP_SIZE))
+        write_synced(data_tmp, lambda f: tail.to_csv(f, index=False))
+        write_synced(self._swap_marker(username),
+                     lambda f: f.write("snapshot" if snapshot is not None else "no snapshot"))
+        self._finish_swap(username)
+
+    def _finish_swap(self, username: str):
+        """Complete a marked snapshot/tail swap, e.g. one a crash interrupted (activity file locked exclusively)"""
+        marker = self._swap_marker(username)
+        try:
+            mode = marker.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        (snapshot_tmp, snapshot_file), (data_tmp, data_file) = self._swap_files(username)
+        if mode == "no snapshot":
+            snapshot_file.unlink(missing_ok=True)
+        elif snapshot_tmp.exists():
+            os.replace(snapshot_tmp, snapshot_file)
+        if data_tmp.exists():
+            os.replace(data_tmp, data_file)
+        marker.unlink()
+
+    def _activity_files(self, username: str) -> Tuple[Path, Optional[Path]]:
+        """CSV tail and snapshot to read, as they will be once a pending marked swap completes"""
+        (snapshot_tmp, snapshot_file), (data_tmp, data_file) = self._swap_files(username)
+        try:
+            mode = self._swap_marker(username).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return data_file, snapshot_file
+        data_file = data_tmp if data_tmp.exists() else data_file
+        if mode == "no snapshot":
+            return data_file, None
+        return data_file, snapshot_tmp if snapshot_tmp.exists() else snapshot_file
+
+    @staticmethod
+    def _filter_mask(df: pd.DataFrame, start_date: Optional[str], end_date: Optional[str],
+                     tracker_name: Optional[str]) -> pd.Series:
+        """Boolean mask for the date-range / tracker filters"""
+        mask = pd.Series(True, index=df.index)
+        if start_date:
+            mask &= df['date'] >= pd.Timestamp(start_date)
+        if end_date:
+            mask &= df['date'] <= pd.Timestamp(end_date)
+        if tracker_name:
+            mask &= df['tracker_name'] == tracker_name
+        return mask
+
+    def _read_snapshot(self, snapshot_file: Path, needed: List[str], start_date: Optional[str],
+                       end_date: Optional[str], tracker_name: Optional[str]) -> pd.DataFrame:
+        """Read only the needed columns and row groups of a Parquet snapshot"""
+        if pq is None:
+            raise RuntimeError(f"{snapshot_file.name} needs pyarrow to be read (pip install pyarrow)")
+
+        filters = []
+        if start_date:
+            filters.append(("date", ">=", pd.Timestamp(start_date).date()))
+        if end_date:
+            filters.append(("date", "<=", pd.Timestamp(end_date).date()))
+        if tracker_name:
+            filters.append(("tracker_name", "==", tracker_name))
+
+        table = pq.read_table(snapshot_file, columns=needed, filters=filters or None)
+        df = table.to_pandas(date_as_object=False)
+        record_read(len(df), snapshot_file)
+        for column in ("value", "goal"):
+            if column in df.columns:
+                df[column] = restore_float32(df[column])
+        return df
+
+    def compact_activities(self, username: str) -> int:
+        """
+        Fold the CSV append tail into the Parquet snapshot
+
+        Rows whose value isn't numeric (e.g. HH:MM time trackers) can't go
+        into the float32 column and stay in the CSV tail. Both files are
+        replaced together by _swap_activity_files.
+
+        Returns:
+            Number of rows moved into the snapshot
+        """
+        if not self.columnar:
+            return 0
+        with self.lock(self.activity_file(username)).exclusive():
+            return self._compact_activities(username)
+
+    def _compact_activities(self, username: str) -> int:
+        """compact_activities with the activity file locked"""
+        self._finish_swap(username)
+        data_file = self.activity_file(username)
+        raw_tail = pd.read_csv(data_file, dtype={"date": str})
+        if raw_tail.empty:
+            return 0
+
+        tail = normalize_activity_frame(raw_tail.copy())
+        numeric_value = pd.to_numeric(tail['value'], errors='coerce')
+        foldable = tail['date'].notna() & (numeric_value.notna() | tail['value'].isna())
+        if not foldable.any():
+            return 0
+
+        folded = tail[foldable].reindex(columns=ACTIVITY_COLUMNS)
+        folded['value'] = numeric_value[foldable]
+        folded['goal'] = pd.to_numeric(folded['goal'], errors='coerce')
+
+        snapshot_file = self.snapshot_file(username)
+        if snapshot_file.exists():
+            existing = self._read_snapshot(snapshot_file, list(ACTIVITY_COLUMNS), None, None, None)
+            folded = pd.concat([existing, folded], ignore_index=True)
+
+        folded = folded.sort_values('date', kind='stable')
+        self._swap_activity_files(username, raw_tail[~foldable], self._snapshot_table(folded))
+        return int(foldable.sum())
+
+    def _snapshot_table(self, df: pd.DataFrame) -> "pa.Table":
+        """Activity rows (parsed dates, numeric values) as a table in the snapshot schema"""
+        df = df.reindex(columns=ACTIVITY_COLUMNS)
+        for column in ("tracker_type", "tracker_name", "unit", "notes", "completed"):
+            values = df[column]
+            if not pd.api.types.is_string_dtype(values):
+                df[column] = values.astype(str).astype(object).where(values.notna(), None)
+        return pa.Table.from_pandas(df, schema=self.SNAPSHOT_SCHEMA, preserve_index=False)
+
+    @staticmethod
+    def _user_ranges(df: pd.DataFrame) -> Dict[str, tuple]:
+        """(start, stop) row range per username of a frame sorted by username"""
+        names, starts, counts = np.unique(df['username'].to_numpy(dtype=object), return_index=True,
+                                          return_counts=True)
+        return {name: (start, start + count) for name, start, count in zip(names, starts, counts)}
+
+    def import_user_data(self, activities: pd.DataFrame, reminders: pd.DataFrame,
+                         achievements: pd.DataFrame):
+        """Write complete per-user files (Parquet snapshot when enabled), atomically and in parallel"""
+        self.writer.flush()  # a pending rewrite must not land on top of the imported files
+        # Sort once so each user's rows are one contiguous, date-ordered slice
+        activities = activities.sort_values(['username', 'date'], kind='stable', ignore_index=True)
+        reminders = reminders.sort_values('username', kind='stable', ignore_index=True)
+        achievements = achievements.sort_values('username', kind='stable', ignore_index=True)
+        activity_ranges = self._user_ranges(activities)
+        other_files = [
+            (reminders, self._user_ranges(reminders), REMINDER_COLUMNS, self.reminders_file),
+            (achievements, self._user_ranges(achievements), USER_ACHIEVEMENT_COLUMNS, self.achievements_file)
+        ]
+        usernames = list(dict.fromkeys([*activity_ranges, *other_files[0][1], *other_files[1][1]]))
+        if self.columnar:
+            # One conversion for the whole batch, users get zero-copy slices of it
+            table = self._snapshot_table(normalize_activity_frame(activities.copy()))
+            empty_tail = pd.DataFrame(columns=ACTIVITY_COLUMNS)
+
+        def write_files(username: str):
+            # Sessions logging for this user (e.g. the GUI next to a seeding run) wait for the swap
+            start, stop = activity_ranges.get(username, (0, 0))
+            with self.lock(self.activity_file(username)).exclusive():
+                self._finish_swap(username)
+                if self.columnar:
+                    self._swap_activity_files(username, empty_tail, table.slice(start, stop - start))
+                else:
+                    self._swap_activity_files(
+                        username, activities.iloc[start:stop].reindex(columns=ACTIVITY_COLUMNS), None)
+                # Streak state is derived from the replaced history
+                with self.lock(self.streaks_file(username)).exclusive():
+                    self.streaks_file(username).unlink(missing_ok=True)
+            for frame, ranges, columns, file_for in other_files:
+                start, stop = ranges.get(username, (0, 0))
+                with self.lock(file_for(username)).exclusive():
+                    write_csv_atomic(file_for(username), frame.iloc[start:stop].reindex(columns=columns))
+
+        if not usernames:
+            return
+        with ThreadPoolExecutor(max_workers=min(CSV_WRITE_WORKERS, len(usernames))) as pool:
+            list(pool.map(write_files, usernames))
+
+    def read_reminders(self, username: str, date: Optional[str] = None) -> pd.DataFrame:
+        """Read <user>_reminders.csv"""
+        self.writer.flush(self.reminders_file(username))
+        with self.lock(self.reminders_file(username)).shared():
+            df = pd.read_csv(self.reminders_file(username))
+        record_read(len(df), self.reminders_file(username))
+        if date is not None:
+            df = df[df['date'] == date]
+        return df
+
+    def add_reminder(self, username: str, reminder: Dict[str, Any]) -> int:
+        """Append a reminder with the next free reminder_id"""
+        reminders_file = self.reminders_file(username)
+        with self.lock(reminders_file).exclusive():
+            ids = pd.read_csv(reminders_file, usecols=['reminder_id'])['reminder_id']
+            reminder_id = 1 if ids.empty else int(ids.max()) + 1
+            append_csv_rows(reminders_file, [{**reminder, "reminder_id": reminder_id}], REMINDER_COLUMNS)
+        return reminder_id
+
+    def update_reminder_status(self, username: str, reminder_id: int, status: str) -> bool:
+        """Rewrite <user>_reminders.csv with one status changed (coalesced, atomic)"""
+        reminders_file = self.reminders_file(username)
+
+        def patch(df: pd.DataFrame) -> pd.DataFrame:
+            set_where(df, df['reminder_id'] == reminder_id, 'status', status)
+            return df
+
+        self.writer.schedule(reminders_file, patch, read=lambda: pd.read_csv(reminders_file))
+        return True
+
+    def load_achievements(self, username: str) -> pd.DataFrame:
+        """Read <user>_achievements.csv"""
+        self.writer.flush(self.achievements_file(username))
+        with self.lock(self.achievements_file(username)).shared():
+            df = pd.read_csv(self.achievements_file(username))
+        record_read(len(df), self.achievements_file(username))
+        return df
+
+    def save_achievements(self, username: str, df: pd.DataFrame):
+        """Write <user>_achievements.csv (coalesced, atomic)"""
+        df = df.copy()
+        self.writer.schedule(self.achievements_file(username), lambda _: df)
+
+    def load_streaks(self, username: str) -> Optional[pd.DataFrame]:
+        """Read <user>_streaks.csv"""
+        streaks_file = self.streaks_file(username)
+        self.writer.flush(streaks_file)
+        if not streaks_file.exists():
+            return None
+        with self.lock(streaks_file).shared():
+            df = pd.read_csv(streaks_file, dtype={"tracker_name": str, "last_active_date": str,
+                                                  "history_signature": str})
+        record_read(len(df), streaks_file)
+        return df
+
+    def save_streaks(self, username: str, df: pd.DataFrame):
+        """Write <user>_streaks.csv (coalesced, atomic)"""
+        df = df.reindex(columns=STREAK_COLUMNS)
+        self.writer.schedule(self.streaks_file(username), lambda _: df)
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Storage in a single SQLite database (stdlib sqlite3, WAL journal)
+
+    Activities are indexed on (username, date, tracker_name) and
+    (username, tracker_name, date), reminders on (username, date), so
+    per-user date-range and per-tracker queries are index lookups.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            username TEXT PRIMARY KEY COLLATE NOCASE,
+            password_hash TEXT, first_name TEXT, last_name TEXT,
+            email TEXT, phone TEXT, date_of_birth TEXT, role TEXT, gender TEXT,
+            created_date TEXT, last_login TEXT, timezone TEXT, preferred_units TEXT,
+            notification_enabled, notification_sound, quiet_hours_start TEXT,
+            quiet_hours_end TEXT, theme TEXT, failed_login_attempts INTEGER DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS activities (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            date TEXT NOT NULL,
+            tracker_type TEXT,
+            tracker_name TEXT NOT NULL,
+            value NUMERIC,
+            goal REAL,
+            unit TEXT,
+            notes TEXT,
+            completed TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_activities_date_tracker
+            ON activities (username, date, tracker_name);
+        CREATE INDEX IF NOT EXISTS idx_activities_tracker_date
+            ON activities (username, tracker_name, date);
+        CREATE TABLE IF NOT EXISTS reminders (
+            username TEXT NOT NULL,
+            reminder_id INTEGER NOT NULL,
+            title TEXT, description TEXT, date TEXT, time TEXT,
+            recurrence TEXT, category TEXT, priority TEXT, tracker_link TEXT, status TEXT,
+            PRIMARY KEY (username, reminder_id)
+        );
+        CREATE INDEX IF NOT EXISTS idx_reminders_date ON reminders (username, date);
+        CREATE TABLE IF NOT EXISTS user_achievements (
+            username TEXT NOT NULL,
+            achievement_id INTEGER NOT NULL,
+            unlocked_date TEXT,
+            progress REAL,
+            completed TEXT,
+            PRIMARY KEY (username, achievement_id)
+        );
+        CREATE TABLE IF NOT EXISTS streaks (
+            username TEXT NOT NULL,
+            tracker_name TEXT NOT NULL,
+            current_streak INTEGER,
+            longest_streak INTEGER,
+            last_active_date TEXT,
+            history_signature TEXT,
+            PRIMARY KEY (username, tracker_name)
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO meta (key, value) VALUES ('users_version', 0);
+    """
+
+    BOOLEAN_USER_COLUMNS = ("notification_enabled", "notification_sound")
+
+    def __init__(self, db_path: Path = SQLITE_DB_FILE):
+        """Initialize SQLite backend and create the schema if needed"""
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self.initialize()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections can't be shared across threads)"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.db_path), timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _records(rows: List[Dict[str, Any]], columns: List[str]) -> List[tuple]:
+        """Convert dict rows to tuples in column order with NaN mapped to NULL"""
+        records = []
+        for row in rows:
+            record = []
+            for column in columns:
+                value = row.get(column)
+                if value is not None and not isinstance(value, str) and pd.isna(value):
+                    value = None
+                elif hasattr(value, "item"):
+                    value = value.item()  # numpy scalar -> Python scalar
+                record.append(value)
+            records.append(tuple(record))
+        return records
+
+    @staticmethod
+    def _frame_records(df: pd.DataFrame, columns: List[str]) -> List[tuple]:
+        """Frame rows as tuples in column order with NaN mapped to NULL (vectorized _records)"""
+        values = df.reindex(columns=columns).astype(object)
+        return list(values.where(values.notna(), None).itertuples(index=False, name=None))
+
+    def _insert_rows(self, connection: sqlite3.Connection, table: str,
+                     columns: List[str], rows: List[Dict[str, Any]]):
+        """executemany INSERT of dict rows (caller owns the transaction)"""
+        connection.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+            self._records(rows, columns)
+        )
+
+    def _query(self, sql: str, params: tuple = ()) -> pd.DataFrame:
+        """Run a SELECT and return the result as a DataFrame"""
+        cursor = self._connection().execute(sql, params)
+        columns = [description[0] for description in cursor.description]
+        rows = cursor.fetchall()
+        record_read(len(rows))  # rows only: page reads aren't visible from here
+        return pd.DataFrame(rows, columns=columns)
+
+    def _bump_users_version(self, connection: sqlite3.Connection):
+        """Mark the users table as changed for other processes' registries"""
+        connection.execute("UPDATE meta SET value = value + 1 WHERE key = 'users_version'")
+
+    def initialize(self):
+        """Create tables and indexes"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connection()
+        with connection:
+            connection.executescript(self.SCHEMA)
+            # Databases created before streak state recorded its history
+            streak_columns = {row[1] for row in connection.execute("PRAGMA table_info(streaks)")}
+            if "history_signature" not in streak_columns:
+                connection.execute("ALTER TABLE streaks ADD COLUMN history_signature TEXT")
+
+    def users_signature(self) -> Hashable:
+        """Version counter bumped on every users write"""
+        row = self._connection().execute(
+            "SELECT value FROM meta WHERE key = 'users_version'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def load_users(self) -> pd.DataFrame:
+        """Load the users table"""
+        df = self._query(f"SELECT {', '.join(USER_COLUMNS)} FROM users ORDER BY rowid")
+        for column in self.BOOLEAN_USER_COLUMNS:
+            df[column] = df[column].astype(bool)
+        return df
+
+    def insert_users(self, rows: List[Dict[str, Any]], frame: pd.DataFrame):
+        """Insert new users"""
+        connection = self._connection()
+        with connection:
+            self._insert_rows(connection, "users", USER_COLUMNS, rows)
+            self._bump_users_version(connection)
+
+    def update_users(self, updates: Dict[str, Dict[str, Any]], frame: pd.DataFrame):
+        """Update only the changed columns of the changed users"""
+        connection = self._connection()
+        with connection:
+            for username, changes in updates.items():
+                columns = [column for column in changes if column in USER_COLUMNS]
+                if not columns:
+                    continue
+                assignments = ", ".join(f"{column} = ?" for column in columns)
+                values = self._records([changes], columns)[0]
+                connection.execute(
+                    f"UPDATE users SET {assignments} WHERE username = ?",
+                    values + (username,)
+                )
+            self._bump_users_version(connection)
+
+    def update_user_row(self, username: str,
+                        compute: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """SELECT and UPDATE one user inside an IMMEDIATE (write-locked) transaction"""
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            record = connection.execute(
+                f"SELECT {', '.join(USER_COLUMNS)} FROM users WHERE username = ?", (username,)
+            ).fetchone()
+            if record is None:
+                return None
+            row = dict(zip(USER_COLUMNS, record))
+            changes = {column: value for column, value in compute(row).items() if column in USER_COLUMNS}
+            if changes:
+                assignments = ", ".join(f"{column} = ?" for column in changes)
+                values = self._records([changes], list(changes))[0]
+                connection.execute(f"UPDATE users SET {assignments} WHERE username = ?", values + (username,))
+                self._bump_users_version(connection)
+            row.update(changes)
+            return row
+
+    def create_user_storage(self, username: str):
+        """Seed the user's (locked) achievement rows"""
+        rows = [{"username": username.lower(), **row} for row in default_achievement_rows()]
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM user_achievements WHERE username = ?", (username.lower(),))
+            self._insert_rows(connection, "user_achievements", ["username"] + USER_ACHIEVEMENT_COLUMNS, rows)
+
+    def create_users_storage(self, usernames: List[str]):
+        """Seed the achievement rows of many users in one transaction"""
+        usernames = [username.lower() for username in usernames]
+        defaults = default_achievement_rows()
+        rows = [{"username": username, **row} for username in usernames for row in defaults]
+        connection = self._connection()
+        with connection:
+            connection.executemany("DELETE FROM user_achievements WHERE username = ?",
+                                   [(username,) for username in usernames])
+            self._insert_rows(connection, "user_achievements", ["username"] + USER_ACHIEVEMENT_COLUMNS, rows)
+
+    def activities_signature(self, username: str) -> Hashable:
+        """Row count and newest id of the user's activities (the table is append-only)"""
+        return self._connection().execute(
+            "SELECT COUNT(*), MAX(id) FROM activities WHERE username = ?",
+            (username.lower(),)
+        ).fetchone()
+
+    def append_activities(self, username: str, rows: List[Dict[str, Any]]):
+        """Insert activity rows"""
+        rows = [
+            {**row, "username": username.lower(), "date": pd.Timestamp(row["date"]).strftime(DATE_FORMAT)}
+            for row in rows
+        ]
+        connection = self._connection()
+        with connection:
+            self._insert_rows(connection, "activities", ["username"] + ACTIVITY_COLUMNS, rows)
+
+    def read_activities(self, username: str, start_date: Optional[str] = None,
+                        end_date: Optional[str] = None, tracker_name: Optional[str] = None,
+                        columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Indexed SELECT of a user's activities"""
+        selected = [column for column in (columns or ACTIVITY_COLUMNS) if column in ACTIVITY_COLUMNS]
+        conditions = ["username = ?"]
+        params = [username.lower()]
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date)
+        if end_date:
+            conditions.append("date <= ?")
+            params.append(end_date)
+        if tracker_name:
+            conditions.append("tracker_name = ?")
+            params.append(tracker_name)
+
+        df = self._query(
+            f"SELECT {', '.join(selected)} FROM activities WHERE {' AND '.join(conditions)} ORDER BY id",
+            tuple(params)
+        )
+        return normalize_activity_frame(df)
+
+    def read_all_activities(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Single SELECT over every user's activities"""
+        selected = [column for column in (columns or ACTIVITY_COLUMNS) if column in ACTIVITY_COLUMNS]
+        df = self._query(f"SELECT username, {', '.join(selected)} FROM activities ORDER BY username, id")
+        return normalize_activity_frame(df)
+
+    def read_reminders(self, username: str, date: Optional[str] = None) -> pd.DataFrame:
+        """SELECT a user's reminders"""
+        sql = f"SELECT {', '.join(REMINDER_COLUMNS)} FROM reminders WHERE username = ?"
+        params = [username.lower()]
+        if date is not None:
+            sql += " AND date = ?"
+            params.append(date)
+        return self._query(sql + " ORDER BY reminder_id", tuple(params))
+
+    def add_reminder(self, username: str, reminder: Dict[str, Any]) -> int:
+        """Insert a reminder with the next free reminder_id"""
+        connection = self._connection()
+        with connection:
+            row = connection.execute(
+                "SELECT COALESCE(MAX(reminder_id), 0) + 1 FROM reminders WHERE username = ?",
+                (username.lower(),)
+            ).fetchone()
+            reminder_id = row[0]
+            record = {**reminder, "username": username.lower(), "reminder_id": reminder_id}
+            self._insert_rows(connection, "reminders", ["username"] + REMINDER_COLUMNS, [record])
+        return reminder_id
+
+    def insert_reminders(self, username: str, reminders: pd.DataFrame) -> int:
+        """Insert reminders as they are, keeping their reminder_ids (bulk copy, returns rows inserted)"""
+        rows = [{**row, "username": username.lower()} for row in reminders.to_dict('records')]
+        connection = self._connection()
+        with connection:
+            self._insert_rows(connection, "reminders", ["username"] + REMINDER_COLUMNS, rows)
+        return len(rows)
+
+    def update_reminder_status(self, username: str, reminder_id: int, status: str) -> bool:
+        """UPDATE one reminder's status"""
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                "UPDATE reminders SET status = ? WHERE username = ? AND reminder_id = ?",
+                (status, username.lower(), int(reminder_id))
+            )
+        return True
+
+    def load_achievements(self, username: str) -> pd.DataFrame:
+        """SELECT a user's achievement progress"""
+        return self._query(
+            f"SELECT {', '.join(USER_ACHIEVEMENT_COLUMNS)} FROM user_achievements "
+            "WHERE username = ? ORDER BY achievement_id",
+            (username.lower(),)
+        )
+
+    def save_achievements(self, username: str, df: pd.DataFrame):
+        """Replace a user's achievement progress"""
+        rows = [{**row, "username": username.lower()} for row in df.to_dict('records')]
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM user_achievements WHERE username = ?", (username.lower(),))
+            self._insert_rows(connection, "user_achievements", ["username"] + USER_ACHIEVEMENT_COLUMNS, rows)
+
+    def load_streaks(self, username: str) -> Optional[pd.DataFrame]:
+        """SELECT a user's streak state (None if no rows are stored)"""
+        df = self._query(
+            f"SELECT {', '.join(STREAK_COLUMNS)} FROM streaks WHERE username = ?",
+            (username.lower(),)
+        )
+        return None if df.empty else df
+
+    def save_streaks(self, username: str, df: pd.DataFrame):
+        """Replace a user's streak state"""
+        rows = [{**row, "username": username.lower()} for row in df.reindex(columns=STREAK_COLUMNS).to_dict('records')]
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM streaks WHERE username = ?", (username.lower(),))
+            self._insert_rows(connection, "streaks", ["username"] + STREAK_COLUMNS, rows)
+
+    def import_user_data(self, activities: pd.DataFrame, reminders: pd.DataFrame,
+                         achievements: pd.DataFrame):
+        """Replace the users' rows in every per-user table within one transaction"""
+        usernames = pd.concat([activities['username'], reminders['username'], achievements['username']])
+        usernames = [(username,) for username in usernames.str.lower().unique()]
+        tables = [
+            ("activities", ACTIVITY_COLUMNS, activities),
+            ("reminders", REMINDER_COLUMNS, reminders),
+            ("user_achievements", USER_ACHIEVEMENT_COLUMNS, achievements)
+        ]
+        connection = self._connection()
+        with connection:
+            for table in ("activities", "reminders", "user_achievements", "streaks"):
+                connection.executemany(f"DELETE FROM {table} WHERE username = ?", usernames)
+            for table, columns, frame in tables:
+                columns = ["username"] + columns
+                connection.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+                    self._frame_records(frame.assign(username=frame['username'].str.lower()), columns)
+                )
+
+
+_default_backend: Optional[StorageBackend] = None
+_default_backend_lock = threading.Lock()
+
+
+def get_storage_backend() -> StorageBackend:
+    """Get the process-wide backend selected by config.STORAGE_BACKEND"""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            if STORAGE_BACKEND == "sqlite":
+                _default_backend = SQLiteBackend(SQLITE_DB_FILE)
+            else:
+                _default_backend = CSVBackend(USERS_DATA_FILE, USERS_DIR)
+        return _default_backend
+
+
+def migrate_csv_to_sqlite(source: Optional[CSVBackend] = None,
+                          target: Optional[SQLiteBackend] = None) -> Dict[str, int]:
+    """
+    Copy every user, activity, reminder and achievement from the CSV layout
+    into a SQLite database
+
+    Args:
+        source: CSV backend to read from (default: configured CSV paths)
+        target: SQLite backend to write to (default: config.SQLITE_DB_FILE)
+
+    Returns:
+        Number of rows migrated per table
+
+    Raises:
+        ValueError: If the target database already contains users
+    """
+    source = source or CSVBackend(USERS_DATA_FILE, USERS_DIR)
+    target = target or SQLiteBackend(SQLITE_DB_FILE)
+
+    if not target.load_users().empty:
+        raise ValueError(f"{target.db_path} already contains users; refusing to migrate twice")
+
+    counts = {"users": 0, "activities": 0, "reminders": 0, "achievements": 0}
+    users = source.load_users()
+    if users.empty:
+        return counts
+
+    target.insert_users(users.to_dict('records'), users)
+    counts["users"] = len(users)
+
+    for username in users['username'].astype(str).str.lower():
+        if source.activity_file(username).exists():
+            activities = source.read_activities(username)
+            activities = activities.dropna(subset=['date'])
+            target.append_activities(username, activities.to_dict('records'))
+            counts["activities"] += len(activities)
+
+        if source.reminders_file(username).exists():
+            counts["reminders"] += target.insert_reminders(username, source.read_reminders(username))
+
+        if source.achievements_file(username).exists():
+            achievements = source.load_achievements(username)
+            target.save_achievements(username, achievements)
+            counts["achievements"] += len(achievements)
+
+    return counts
+
+
+def compact_all_users(backend: Optional[StorageBackend] = None) -> Dict[str, int]:
+    """Run activity compaction for every user (returns rows folded per user)"""
+    backend = backend or get_storage_backend()
+    usernames = backend.load_users()['username'].astype(str).str.lower()
+    return {username: backend.compact_activities(username) for username in usernames}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Storage maintenance")
+    parser.add_argument("command", choices=["migrate", "compact"],
+                        help="migrate: copy CSV data into SQLite; compact: fold CSV tails into Parquet snapshots")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        migrated = migrate_csv_to_sqlite()
+        print("Migrated to SQLite:")
+        for table, count in migrated.items():
+            print(f"  {table}: {count}")
+        print(f"Set STORAGE_BACKEND = \"sqlite\" in config.py to use {SQLITE_DB_FILE}")
+    else:
+        folded = compact_all_users(CSVBackend(USERS_DATA_FILE, USERS_DIR))
+        for username, count in folded.items():
+            print(f"  @{username}: {count} rows folded into snapshot")
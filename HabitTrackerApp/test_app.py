@@ -9,15 +9,39 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from data_handler import UserDataManager, TrackerDataManager
+from data_handler import UserDataManager, TrackerDataManager, UserRegistry, AchievementEngine
+from storage import CSVBackend, SQLiteBackend, StorageBackend, migrate_csv_to_sqlite
 from trackers.student_trackers import get_student_trackers
 from trackers.adult_trackers import get_adult_trackers
 from trackers.senior_trackers import get_senior_trackers
-from utils import Validators, DateTimeHelper, StatisticsCalculator, PasswordHasher
-from datetime import datetime
+from trackers.base_tracker import BaseTracker, RatingTracker
+from trackers.registry import get_role_trackers, get_tracker_index, find_tracker, validate_activity, validate_activities
+from utils import Validators, DateTimeHelper, StatisticsCalculator, PasswordHasher, StreakState
+from datetime import datetime, timedelta
+import operator
+import os
+import random
+import tempfile
+import threading
 import pandas as pd
 
 
+def _report(checks):
+    """Print each (description, passed) check and fail if any didn't pass"""
+    for description, passed in checks:
+        print(f"  {'✅' if passed else '❌'} {description}")
+    assert all(passed for _, passed in checks)
+
+
+def _raises(exception_type, func, *args) -> bool:
+    """Check that func(*args) raises exception_type"""
+    try:
+        func(*args)
+    except exception_type:
+        return True
+    return False
+
+
 def test_user_authentication():
     """Test user login and data retrieval"""
     print("\n🔐 Testing User Authentication...")
@@ -53,6 +77,460 @@ def test_user_authentication():
         print(f"  ❌ ERROR testing invalid password: {e}")
 
 
+def test_user_registry():
+    """Test indexed user lookups and reload on file change"""
+    print("\n🗂️  Testing User Registry...")
+    print("-" * 40)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        users_file = Path(tmp_dir) / "users_data.csv"
+        pd.DataFrame([
+            {"username": "alice", "email": "Alice@Example.com", "phone": "0123456789"},
+            {"username": "bob", "email": "bob@example.com", "phone": "+1-555-0102"},
+        ]).to_csv(users_file, index=False)
+        
+        registry = UserRegistry(CSVBackend(users_file, Path(tmp_dir)))
+        checks = [
+            ("username lookup is case-insensitive", registry.contains("username", "ALICE")),
+            ("email lookup is case-insensitive", registry.contains("email", "alice@example.com")),
+            ("phone keeps leading zero", registry.get("phone", "0123456789") is not None),
+            ("unknown user not found", registry.get("username", "carol") is None),
+        ]
+        
+        # External write with a new mtime/size must be picked up
+        pd.DataFrame([
+            {"username": "carol", "email": "carol@example.com", "phone": "5550103"},
+        ]).to_csv(users_file, mode="a", header=False, index=False)
+        stat = users_file.stat()
+        os.utime(users_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        checks.append(("reloads after file change", registry.contains("username", "carol")))
+        
+        registry.update("bob", {"theme": "dark", "email": "robert@example.com"})
+        checks.append(("email index follows updates", registry.contains("email", "robert@example.com")))
+        
+        users = registry.frame()
+        users.loc[:, "username"] = "mallory"
+        checks.append(("frame() callers get a copy", registry.contains("username", "bob")
+                       and "mallory" not in registry.frame()["username"].tolist()))
+        
+        _report(checks)
+
+
+def test_bulk_user_creation():
+    """Test bulk user provisioning with one users table write"""
+    print("\n👥 Testing Bulk User Creation...")
+    print("-" * 40)
+    
+    import utils
+    from config import ACHIEVEMENT_DEFINITIONS
+    
+    def make_user(i, **overrides):
+        return {
+            "username": f"bulkuser{i}", "password": f"Secret{i}!", "first_name": "Bulk",
+            "last_name": "User", "email": f"bulk{i}@example.com", "phone": f"0170000{i:04d}",
+            "date_of_birth": "01/01/2000", "role": "student", **overrides
+        }
+    
+    users = [make_user(i) for i in range(40)]
+    users += [
+        make_user(40, username="BULKUSER3"),         # duplicate username in batch
+        make_user(41, email="bulk5@example.com"),    # duplicate email in batch
+        make_user(42, username="existing"),          # already registered
+        {"username": "incomplete"},                  # missing fields
+    ]
+    
+    original_rounds = utils.BCRYPT_ROUNDS
+    utils.BCRYPT_ROUNDS = 4  # keep hashing cheap in tests
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir))
+            manager = UserDataManager(backend=backend)
+            manager.create_user(make_user(99, username="existing"))
+            
+            results = manager.create_users(users)
+            table = backend.load_users()
+            sqlite_backend = SQLiteBackend(Path(tmp_dir) / "habit_tracker.db")
+            sqlite_results = UserDataManager(backend=sqlite_backend).create_users(users[:5])
+            
+            checks = [
+                ("valid users created", results[:40] == [True] * 40),
+                ("duplicates and incomplete rows skipped", results[40:] == [False] * 4),
+                ("users table has every account once", len(table) == 41 and table['username'].is_unique),
+                ("per-user files created", all(backend.activity_file(f"bulkuser{i}").exists()
+                                               and backend.achievements_file(f"bulkuser{i}").exists() for i in range(40))),
+                ("passwords verify", manager.authenticate_user("bulkuser7", "Secret7!") is not None),
+                ("sqlite bulk create", sqlite_results == [True] * 5
+                 and len(sqlite_backend.load_achievements("bulkuser0")) == len(ACHIEVEMENT_DEFINITIONS)),
+                ("process pool hashes in order", all(
+                    PasswordHasher.verify_password(f"pw{i}", hashed) for i, hashed in
+                    enumerate(PasswordHasher.hash_passwords([f"pw{i}" for i in range(10)], rounds=4, processes=2)))),
+            ]
+    finally:
+        utils.BCRYPT_ROUNDS = original_rounds
+    
+    _report(checks)
+
+
+def test_password_hasher_async():
+    """Test worker-pool password hashing with completion callbacks"""
+    print("\n🔑 Testing Async Password Hasher...")
+    print("-" * 40)
+    
+    from config import BCRYPT_ROUNDS
+    
+    callback_results = []
+    done = threading.Event()
+    
+    def on_hashed(hashed):
+        callback_results.append((hashed, threading.current_thread().name))
+        done.set()
+    
+    hash_future = PasswordHasher.hash_password_async("Secret123!", callback=on_hashed)
+    hashed = hash_future.result(timeout=30)
+    done.wait(timeout=30)
+    verify_ok = PasswordHasher.verify_password_async("Secret123!", hashed).result(timeout=30)
+    verify_bad = PasswordHasher.verify_password_async("wrong", hashed).result(timeout=30)
+    
+    checks = [
+        ("configured work factor", hashed.startswith(f"$2b${BCRYPT_ROUNDS:02d}$")),
+        ("callback got the hash on a worker", callback_results
+         and callback_results[0][0] == hashed and callback_results[0][1].startswith("password-hasher")),
+        ("async verify", verify_ok and not verify_bad),
+        ("explicit rounds", PasswordHasher.hash_password("x", rounds=4).startswith("$2b$04$")),
+    ]
+    
+    _report(checks)
+
+
+def test_password_rehash_on_login():
+    """Test cost detection, benchmark helper and hash upgrade on login"""
+    print("\n♻️  Testing Password Rehash on Login...")
+    print("-" * 40)
+    
+    from config import BCRYPT_ROUNDS
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        users_file = Path(tmp_dir) / "users_data.csv"
+        old_hash = PasswordHasher.hash_password("Secret123!", rounds=4)
+        pd.DataFrame([
+            {"username": "legacy", "password_hash": old_hash, "failed_login_attempts": 0},
+        ]).to_csv(users_file, index=False)
+        
+        user_manager = UserDataManager(backend=CSVBackend(users_file, Path(tmp_dir)))
+        failed = user_manager.authenticate_user("legacy", "wrong")
+        user_manager.backend.flush()  # rewrites are coalesced; read the file as written
+        hash_after_failure = pd.read_csv(users_file)['password_hash'].iloc[0]
+        user_data = user_manager.authenticate_user("legacy", "Secret123!")
+        user_manager.backend.flush()
+        stored_hash = pd.read_csv(users_file)['password_hash'].iloc[0]
+        
+        checks = [
+            ("cost parsed from hash", PasswordHasher.get_cost(old_hash) == 4),
+            ("old cost needs rehash", PasswordHasher.needs_rehash(old_hash)),
+            ("stronger cost never downgraded",
+             not PasswordHasher.needs_rehash(PasswordHasher.hash_password("Secret123!", rounds=5), rounds=4)),
+            ("failed login keeps hash", failed is None and hash_after_failure == old_hash),
+            ("successful login upgrades hash", user_data is not None
+             and PasswordHasher.get_cost(stored_hash) == BCRYPT_ROUNDS
+             and user_data['password_hash'] == stored_hash),
+            ("upgraded hash still verifies", PasswordHasher.verify_password("Secret123!", stored_hash)),
+            ("benchmark respects bounds", PasswordHasher.benchmark_cost(target_ms=10_000, max_rounds=5) == 5
+             and PasswordHasher.benchmark_cost(target_ms=0, min_rounds=4) == 4),
+        ]
+        
+        _report(checks)
+
+
+def test_session_preload():
+    """Test the post-login session preload handed to the main window"""
+    print("\n🧳 Testing Session Preload...")
+    print("-" * 40)
+    
+    from app_core import preload_session
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir))
+        backend.initialize()
+        backend.create_user_storage("preloader")
+        today = datetime.now().strftime("%Y-%m-%d")
+        TrackerDataManager("preloader", backend).log_activities([
+            {"date": today, "tracker_type": "numeric", "tracker_name": "Water", "value": 8, "goal": 8, "unit": "glasses"},
+            {"date": today, "tracker_type": "duration", "tracker_name": "Study", "value": 1, "goal": 2, "unit": "hours"},
+        ])
+        
+        preload = preload_session({"username": "preloader", "role": "student"}, backend)
+        manager = preload["tracker_manager"]
+        cached = manager._frame
+        expected = StatisticsCalculator.summarize_activities(manager.get_activities_by_date_range(today, today))
+        
+        empty = preload_session({"username": "nobody", "role": "adult"}, backend)
+    
+    checks = [
+        ("history parsed into the cache", cached is not None and len(cached) == 2),
+        ("cache reused afterwards", manager._frame is cached),
+        ("streak computed", preload["streak"] == 1),
+        ("today's summary", preload["today_summary"][0] == today
+         and {k: v for k, v in preload["today_summary"][1].items() if k != "by_tracker"}
+         == {k: v for k, v in expected.items() if k != "by_tracker"}
+         and preload["today_summary"][1]["by_tracker"].equals(expected["by_tracker"])),
+        ("role trackers", preload["available_trackers"] == list(get_role_trackers("student"))),
+        ("user store opened", isinstance(preload["user_manager"], UserDataManager)),
+        ("new user preloads empty", empty["streak"] == 0 and empty["today_summary"] == (today, None)),
+    ]
+    
+    _report(checks)
+
+
+def test_atomic_coalesced_writes():
+    """Test atomic file swaps and coalescing of full-file rewrites"""
+    print("\n💾 Testing Atomic, Coalesced CSV Writes...")
+    print("-" * 40)
+    
+    import time
+    import storage
+    
+    writes = []
+    original_write = storage.write_csv_atomic
+    
+    def counting_write(file_path, df):
+        writes.append(file_path.name)
+        original_write(file_path, df)
+    
+    storage.write_csv_atomic = counting_write
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir), write_delay_ms=60_000)
+            backend.initialize()
+            backend.create_user_storage("writer")
+            registry = UserRegistry.for_backend(backend)
+            registry.append([{"username": "writer", "first_name": "Old", "failed_login_attempts": 0}])
+            
+            for attempt in range(1, 51):
+                registry.update("writer", {"failed_login_attempts": attempt})
+            on_disk = pd.read_csv(backend.users_file)['failed_login_attempts'].iloc[0]
+            read_back = backend.load_users()['failed_login_attempts'].iloc[0]
+            burst_writes = list(writes)
+            
+            for title in ("Walk", "Read", "Sleep"):
+                backend.add_reminder("writer", {"title": title, "date": "2025-01-01", "status": "pending"})
+            for reminder_id in (1, 2, 3):
+                backend.update_reminder_status("writer", reminder_id, "done")
+            statuses = backend.read_reminders("writer")['status'].tolist()
+            reminder_writes = writes.count("writer_reminders.csv")
+            
+            # A failed write leaves the old file whole, no temp file, and the frame still pending
+            registry.update("writer", {"first_name": "New"})
+            def failing_fsync(fd):
+                raise OSError("disk full")
+            
+            original_fsync = os.fsync
+            os.fsync = failing_fsync
+            try:
+                failed_flush = _raises(OSError, backend.flush)
+            finally:
+                os.fsync = original_fsync
+            survived = pd.read_csv(backend.users_file)['first_name'].iloc[0]
+            leftovers = list(Path(tmp_dir).glob(".*.tmp"))
+            backend.flush()
+            retried = pd.read_csv(backend.users_file)['first_name'].iloc[0]
+            
+            timed_backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir), write_delay_ms=20)
+            timed_backend.save_achievements("writer", pd.DataFrame([{"achievement_id": 1, "progress": 42}]))
+            time.sleep(0.5)
+            timer_flushed = pd.read_csv(timed_backend.achievements_file("writer"))['progress'].iloc[0] == 42
+            
+            direct = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir), write_delay_ms=0)
+            direct.save_streaks("writer", pd.DataFrame([{"tracker_name": "Walk", "current_streak": 3,
+                                                         "longest_streak": 3, "last_active_date": "2025-01-01"}]))
+            written_through = pd.read_csv(direct.streaks_file("writer"))['current_streak'].iloc[0] == 3
+            
+            registry.update("writer", {"first_name": "Exit"})
+            storage.flush_pending_writes()
+            exit_flushed = pd.read_csv(backend.users_file)['first_name'].iloc[0] == "Exit"
+            
+            # Credentials and the lockout counter skip the window
+            registry.update("writer", {"theme": "dark", "failed_login_attempts": 0})
+            user_manager = UserDataManager(backend=backend)
+            user_manager.update_password("writer", "N3w-Passw0rd!")
+            user_manager.authenticate_user("writer", "wrong")
+            stored = pd.read_csv(backend.users_file).iloc[0]
+            credentials_written = (PasswordHasher.verify_password("N3w-Passw0rd!", stored['password_hash'])
+                                   and stored['failed_login_attempts'] == 1 and stored['theme'] == "dark")
+    finally:
+        storage.write_csv_atomic = original_write
+    
+    checks = [
+        ("burst not written yet", on_disk == 0),
+        ("reads see pending writes", read_back == 50),
+        ("burst coalesced into one rewrite", burst_writes == ["users_data.csv"]),
+        ("reminder updates coalesced", statuses == ["done"] * 3 and reminder_writes == 1),
+        ("failed write keeps old file", failed_flush and survived == "Old" and not leftovers),
+        ("failed write retried", retried == "New"),
+        ("timer flushes the window", timer_flushed),
+        ("zero window writes through", written_through),
+        ("exit flush writes everything", exit_flushed),
+        ("password and failed logins written through", credentials_written),
+    ]
+    
+    _report(checks)
+
+
+def _file_lock_worker(tmp_dir, worker, rounds, barrier):
+    """One process of test_multiprocess_file_locks: log, log in, guess and update a profile"""
+    import storage
+    import utils
+    storage.SNAPSHOT_COMPACT_BYTES = 2048  # compact the shared tail several times
+    utils.BCRYPT_ROUNDS = 4
+    backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir), columnar=True, write_delay_ms=5)
+    user_manager = UserDataManager(backend=backend)
+    own = f"worker{worker}"
+    sessions = [TrackerDataManager("shared", backend), TrackerDataManager(own, backend)]
+    start = datetime(2025, 1, 1)
+    # Every process guesses at the shared account at once; None = counted failure, dict = locked out
+    barrier.wait()
+    guesses = sum(user_manager.authenticate_user("shared", "wrong") is None for _ in range(3))
+    logins = 0
+    for i in range(rounds):
+        day = (start + timedelta(days=i)).strftime("%Y-%m-%d")
+        for session in sessions:
+            session.log_activity({"date": day, "tracker_type": "numeric", "tracker_name": "Steps",
+                                  "value": worker * 1000 + i, "goal": 5, "unit": "steps"})
+        if i % 5 == 0:
+            user_manager.authenticate_user(own, "wrong")
+            logins += user_manager.authenticate_user(own, "Passw0rd!") is not None
+        user_manager.update_user_profile(own, {"theme": f"theme-{i}"})
+    backend.flush()
+    return logins, guesses
+
+
+def test_multiprocess_file_locks():
+    """Test concurrent logging, logins and profile updates from several processes"""
+    print("\n🔒 Testing Multi-Process File Locks...")
+    print("-" * 40)
+    
+    import multiprocessing
+    import time
+    import utils
+    from config import MAX_LOGIN_ATTEMPTS
+    from file_lock import FileLock, LockTimeout
+    from storage import pq
+    
+    workers, rounds = 4, 25
+    original_rounds = utils.BCRYPT_ROUNDS
+    utils.BCRYPT_ROUNDS = 4  # keep hashing cheap in tests
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir), write_delay_ms=0)
+            user_manager = UserDataManager(backend=backend)
+            usernames = ["shared"] + [f"worker{worker}" for worker in range(workers)]
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            user_manager.registry.append([
+                UserDataManager.build_user_row({
+                    "username": username, "first_name": username, "last_name": "Test",
+                    "email": f"{username}@example.com", "phone": f"0170000000{index}",
+                    "date_of_birth": "2000-01-01", "role": "Adult"
+                }, PasswordHasher.hash_password("Passw0rd!"), timestamp)
+                for index, username in enumerate(usernames)
+            ])
+            backend.create_users_storage(usernames)
+            
+            context = multiprocessing.get_context("spawn")
+            with context.Manager() as manager, context.Pool(workers) as pool:
+                barrier = manager.Barrier(workers)
+                results = pool.starmap(_file_lock_worker,
+                                       [(tmp_dir, worker, rounds, barrier) for worker in range(workers)])
+            logins = [worker_logins for worker_logins, _ in results]
+            guesses = sum(worker_guesses for _, worker_guesses in results)
+            
+            reader = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir), columnar=True)
+            shared = reader.read_activities("shared")
+            compacted = reader.snapshot_file("shared").exists()
+            own_rows = [len(reader.read_activities(f"worker{worker}")) for worker in range(workers)]
+            users = reader.load_users()
+            themes = users.set_index('username')['theme'].to_dict()
+            attempts = users.set_index('username')['failed_login_attempts'].to_dict()
+            locked_out = UserDataManager(backend=reader).authenticate_user("shared", "Passw0rd!")
+            
+            fresh = TrackerDataManager("shared", reader)
+            rebuilt = {name: (state.current, state.longest, state.last_active)
+                       for name, state in fresh._rebuild_streaks().items()}
+            stored = {name: (state.current, state.longest, state.last_active)
+                      for name, state in fresh._parse_streaks(reader.load_streaks("shared")).items()}
+            leftovers = list(Path(tmp_dir).glob("*.tmp")) + list(Path(tmp_dir).glob(".*.tmp"))
+            
+            # A coalesced rewrite merges into the file as it is at flush time
+            slow = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir), write_delay_ms=60_000)
+            slow.update_users({"worker0": {"theme": "slow"}}, users)
+            backend.update_users({"worker1": {"theme": "direct"}}, users)
+            slow.flush()
+            merged = reader.load_users().set_index('username')['theme'].to_dict()
+            
+            # Reader/writer semantics, re-entry and the bounded wait
+            lock = FileLock(backend.users_file, timeout=0.2)
+            with lock.exclusive():
+                with lock.shared():
+                    reentrant = True
+            with lock.shared():
+                upgrade_refused = _raises(RuntimeError, lambda: lock.exclusive().__enter__())
+            
+            holding, release = threading.Event(), threading.Event()
+            
+            def hold(exclusive):
+                with (lock.exclusive() if exclusive else lock.shared()):
+                    holding.set()
+                    release.wait(5)
+            
+            def contended(exclusive, mode):
+                holding.clear()
+                release.clear()
+                holder = threading.Thread(target=hold, args=(exclusive,))
+                holder.start()
+                holding.wait(5)
+                started = time.perf_counter()
+                try:
+                    with mode():
+                        granted = True
+                except LockTimeout:
+                    granted = False
+                elapsed = time.perf_counter() - started
+                release.set()
+                holder.join()
+                return granted, elapsed
+            
+            readers_share, _ = contended(False, lock.shared)
+            writer_waits, waited = contended(False, lock.exclusive)
+            reader_waits, _ = contended(True, lock.shared)
+    finally:
+        utils.BCRYPT_ROUNDS = original_rounds
+    
+    checks = [
+        ("no shared-user rows lost", len(shared) == workers * rounds),
+        ("no shared-user rows duplicated", shared[['tracker_name', 'value']].duplicated().sum() == 0),
+        ("own-user rows complete", own_rows == [rounds] * workers),
+        ("users table intact", sorted(users['username']) == sorted(usernames)),
+        ("every login succeeded", logins == [rounds // 5] * workers),
+        ("failed attempts reset", all(attempts[f"worker{worker}"] == 0 for worker in range(workers))),
+        ("no failed attempt lost", attempts["shared"] == guesses and guesses >= MAX_LOGIN_ATTEMPTS),
+        ("concurrent guessing locks the account", isinstance(locked_out, dict) and 'error' in locked_out),
+        ("last profile update kept", all(themes[f"worker{worker}"] == f"theme-{rounds - 1}" for worker in range(workers))),
+        ("stored streaks match history", stored == rebuilt and rebuilt[TrackerDataManager.OVERALL_STREAK][0] == rounds),
+        ("no temp files left", not leftovers),
+        ("pending rewrite keeps other writers' changes", merged["worker0"] == "slow" and merged["worker1"] == "direct"),
+        ("lock is re-entrant", reentrant),
+        ("shared to exclusive upgrade refused", upgrade_refused),
+        ("readers share the lock", readers_share),
+        ("writer times out behind a reader", not writer_waits and 0.15 < waited < 1.0),
+        ("reader times out behind a writer", not reader_waits),
+    ]
+    
+    if pq is not None:
+        checks.append(("shared tail was compacted", compacted))
+    else:
+        print("  ⚠️  pyarrow not installed, snapshot compaction not exercised")
+    
+    _report(checks)
+
+
 def test_tracker_data_retrieval():
     """Test tracker data operations"""
     print("\n📊 Testing Tracker Data Retrieval...")
@@ -90,6 +568,501 @@ def test_tracker_data_retrieval():
             traceback.print_exc()
 
 
+def test_log_activity_append():
+    """Test that logging appends rows without rewriting history"""
+    print("\n📝 Testing Append-Only Activity Logging...")
+    print("-" * 40)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir))
+        tracker_manager = TrackerDataManager("appendtest", backend=backend)
+        data_file = backend.activity_file("appendtest")
+        
+        entry = {'date': '2026-01-01', 'tracker_type': 'counter', 'tracker_name': 'Water Intake',
+                 'value': 6, 'goal': 8, 'unit': 'glasses'}
+        tracker_manager.log_activity(entry)
+        original_bytes = data_file.read_bytes()
+        tracker_manager.log_activity({**entry, 'date': '2026-01-02', 'value': 9, 'completed': 'yes'})
+        
+        df = pd.read_csv(data_file)
+        checks = [
+            ("header written once", list(df.columns) == ['date', 'tracker_type', 'tracker_name', 'value',
+                                                         'goal', 'unit', 'notes', 'completed']),
+            ("both rows present", len(df) == 2),
+            ("existing bytes untouched", data_file.read_bytes().startswith(original_bytes)),
+        ]
+        
+        _report(checks)
+
+
+def test_log_activities_bulk():
+    """Test bulk activity logging with per-row results"""
+    print("\n📦 Testing Bulk Activity Logging...")
+    print("-" * 40)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir))
+        tracker_manager = TrackerDataManager("bulktest", backend=backend)
+        
+        entries = [
+            {'date': '2026-01-01', 'tracker_type': 'duration', 'tracker_name': 'Study Hours', 'value': 2.5, 'goal': 4},
+            {'date': '2026-01-01', 'tracker_type': 'counter', 'tracker_name': 'Water Intake', 'value': 'lots', 'goal': 8},
+            {'date': '2026-01-01', 'tracker_name': 'Mood', 'value': 4},
+            {'date': '2026-01-01', 'tracker_type': 'checkbox', 'tracker_name': 'Made Bed', 'value': 1, 'goal': 1},
+        ]
+        results = tracker_manager.log_activities(entries)
+        df = pd.read_csv(backend.activity_file("bulktest"))
+        
+        checks = [
+            ("per-row results reported", results == [True, False, False, True]),
+            ("only valid rows written", df['tracker_name'].tolist() == ['Study Hours', 'Made Bed']),
+        ]
+        
+        _report(checks)
+
+
+def test_sqlite_backend_migration():
+    """Test CSV -> SQLite migration gives the same query results"""
+    print("\n🗄️  Testing SQLite Backend Migration...")
+    print("-" * 40)
+    
+    from config import USERS_DATA_FILE, USERS_DIR
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_backend = CSVBackend(USERS_DATA_FILE, USERS_DIR)
+        sqlite_backend = SQLiteBackend(Path(tmp_dir) / "habit_tracker.db")
+        counts = migrate_csv_to_sqlite(csv_backend, sqlite_backend)
+        print(f"  Migrated: {counts}")
+        
+        csv_manager = TrackerDataManager("alice2005", backend=csv_backend)
+        sqlite_manager = TrackerDataManager("alice2005", backend=sqlite_backend)
+        
+        names = csv_manager.get_all_tracker_names()
+        start, end = "2026-01-01", "2026-01-31"
+        csv_range = csv_manager.get_activities_by_date_range(start, end)
+        sqlite_range = sqlite_manager.get_activities_by_date_range(start, end)
+        
+        checks = [
+            ("user count matches", counts["users"] == len(pd.read_csv(USERS_DATA_FILE))),
+            ("tracker names match", sorted(names) == sorted(sqlite_manager.get_all_tracker_names())),
+            ("date range rows match", len(csv_range) == len(sqlite_range)),
+            ("per-tracker history matches",
+             len(csv_manager.backend.read_activities("alice2005", tracker_name=names[0]))
+             == len(sqlite_backend.read_activities("alice2005", tracker_name=names[0]))),
+            ("users readable", UserDataManager(backend=sqlite_backend).username_exists("ALICE2005")),
+            ("second migration refused", _raises(ValueError, migrate_csv_to_sqlite, csv_backend, sqlite_backend)),
+            ("reminders keep their ids",
+             csv_backend.read_reminders("alice2005")["reminder_id"].tolist()
+             == sqlite_backend.read_reminders("alice2005")["reminder_id"].tolist()),
+            ("interface is abstract", _raises(TypeError, StorageBackend)),
+        ]
+        
+        _report(checks)
+
+
+def test_columnar_snapshot():
+    """Test Parquet snapshot compaction keeps query results identical"""
+    print("\n🧊 Testing Columnar Activity Snapshots...")
+    print("-" * 40)
+    
+    from storage import pq
+    if pq is None:
+        print("  ⚠️  pyarrow not installed, snapshots disabled")
+        return
+    
+    entries = [
+        {'date': f'2026-01-{day:02d}', 'tracker_type': 'duration', 'tracker_name': name,
+         'value': round(day * 0.7, 1), 'goal': 2.3, 'unit': 'hours'}
+        for day in range(1, 29) for name in ('Study Hours', 'Screen Time')
+    ]
+    entries.append({'date': '2026-01-05', 'tracker_type': 'time', 'tracker_name': 'Bedtime', 'value': '22:30'})
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        plain = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir) / "plain", columnar=False)
+        columnar = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir) / "columnar", columnar=True)
+        for backend in (plain, columnar):
+            backend.users_dir.mkdir()
+            TrackerDataManager("snaptest", backend=backend).log_activities(entries[:40])
+        folded = columnar.compact_activities("snaptest")
+        for backend in (plain, columnar):
+            TrackerDataManager("snaptest", backend=backend).log_activities(entries[40:])
+        
+        def same(**query):
+            a = plain.read_activities("snaptest", **query)
+            b = columnar.read_activities("snaptest", **query)
+            order = [column for column in ('date', 'tracker_name', 'value') if column in a.columns]
+            a, b = a.sort_values(order), b.sort_values(order)
+            return (len(a) == len(b)
+                    and list(a.columns) == list(b.columns)
+                    and a['value'].astype(str).tolist() == b['value'].astype(str).tolist())
+        
+        checks = [
+            ("rows folded into snapshot", folded == 40 and columnar.snapshot_file("snaptest").exists()),
+            ("full history matches", same()),
+            ("date range matches", same(start_date='2026-01-10', end_date='2026-01-25')),
+            ("tracker filter matches", same(tracker_name='Screen Time', columns=['date', 'value'])),
+            ("time values stay in CSV tail",
+             columnar.compact_activities("snaptest") == 16
+             and len(pd.read_csv(columnar.activity_file("snaptest"))) == 1),
+            ("full history matches after second compaction", same()),
+        ]
+        
+        # A crash between the two file swaps: readers and the next writer roll the marked swap forward
+        more = [{'date': f'2026-02-{day:02d}', 'tracker_type': 'duration', 'tracker_name': 'Study Hours',
+                 'value': day + 0.5, 'goal': 2.5} for day in range(1, 6)]
+        for backend in (plain, columnar):
+            TrackerDataManager("snaptest", backend=backend).log_activities(more)
+        swapped = []
+        original_replace = os.replace
+        
+        def crashing_replace(source, target):
+            swapped.append(target)
+            if len(swapped) == 2:
+                raise OSError("simulated crash")
+            original_replace(source, target)
+        
+        os.replace = crashing_replace
+        try:
+            interrupted = _raises(OSError, columnar.compact_activities, "snaptest")
+        finally:
+            os.replace = original_replace
+        marker_seen = columnar._swap_marker("snaptest").exists()
+        checks.append(("interrupted swap read as completed", interrupted and marker_seen and same()))
+        
+        for backend in (plain, columnar):
+            TrackerDataManager("snaptest", backend=backend).log_activity({**more[0], 'date': '2026-02-10'})
+        recovered = (not columnar._swap_marker("snaptest").exists()
+                     and not list(columnar.users_dir.glob("*.tmp")))
+        checks.append(("next write completes the swap", recovered and same()))
+        
+        import storage
+        original_threshold = storage.SNAPSHOT_COMPACT_BYTES
+        storage.SNAPSHOT_COMPACT_BYTES = 1
+        try:
+            background = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir) / "background", columnar=True)
+            background.users_dir.mkdir()
+            compaction_threads = []
+            compact = background.compact_activities
+            
+            def recording_compact(username):
+                compaction_threads.append(threading.current_thread().name)
+                return compact(username)
+            
+            background.compact_activities = recording_compact
+            TrackerDataManager("snaptest", backend=background).log_activities(entries[:10])
+            background.flush()
+            background_snapshot = background.snapshot_file("snaptest").exists()
+        finally:
+            storage.SNAPSHOT_COMPACT_BYTES = original_threshold
+        checks.append(("compaction runs off the logging thread", background_snapshot and compaction_threads
+                       and all(name.startswith("compaction") for name in compaction_threads)))
+        
+        _report(checks)
+
+
+def test_synthetic_dataset():
+    """Test the seeded load-test data generator"""
+    print("\n🏭 Testing Synthetic Dataset Generator...")
+    print("-" * 40)
+    
+    import seed_data
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_backend = seed_data.make_backend("csv", Path(tmp_dir) / "csv")
+        sqlite_backend = seed_data.make_backend("sqlite", Path(tmp_dir) / "sqlite")
+        counts = seed_data.generate_dataset(25, days=30, trackers_per_day=4, seed=7, backend=csv_backend, chunk_size=10)
+        sqlite_counts = seed_data.generate_dataset(25, days=30, trackers_per_day=4, seed=7, backend=sqlite_backend, chunk_size=10)
+        rerun = seed_data.generate_dataset(25, days=30, trackers_per_day=4, seed=7, backend=csv_backend)
+        
+        users = csv_backend.load_users()
+        history = csv_backend.read_all_activities()
+        per_day = history.groupby(['username', 'date']).size()
+        user = users.iloc[3]
+        sqlite_history = sqlite_backend.read_activities(user['username'])
+        csv_history = csv_backend.read_activities(user['username'])
+        merged = csv_history.merge(sqlite_history, on=['date', 'tracker_name'], suffixes=('_csv', '_sqlite'))
+        valid = all(
+            validate_activities(role, history[history['username'].isin(users.loc[users['role'] == role, 'username'])]).all()
+            for role in users['role'].unique()
+        )
+        leftovers = list((Path(tmp_dir) / "csv").rglob("*.tmp"))
+        
+        checks = [
+            ("users and rows written", counts["users"] == 25 and len(users) == 25
+             and counts["activities"] == len(history) > 0),
+            ("trackers per active day", per_day.max() == 4 and history['date'].nunique() <= 30),
+            ("values within tracker bounds", valid),
+            ("reminders per user", 2 * 25 <= counts["reminders"] <= 4 * 25
+             and 2 <= len(csv_backend.read_reminders(user['username'])) <= 4),
+            ("achievements match history", not any(AchievementEngine.evaluate_all_users(csv_backend).values())),
+            ("same seed, same data", sqlite_counts == counts and len(merged) == len(csv_history) == len(sqlite_history)
+             and (merged['value_csv'] == merged['value_sqlite']).all()),
+            ("existing users skipped", rerun["users"] == 0 and len(csv_backend.load_users()) == 25),
+            ("imported files swapped in whole", not leftovers),
+            ("generated login works", UserDataManager(backend=csv_backend).authenticate_user(
+                user['username'], seed_data.GENERATED_PASSWORD) is not None),
+        ]
+    
+    _report(checks)
+
+
+def test_activity_cache():
+    """Test cached activity frame: no re-reads, write-through, external changes"""
+    print("\n⚡ Testing Activity Frame Cache...")
+    print("-" * 40)
+    
+    class CountingBackend(CSVBackend):
+        reads = 0
+        
+        def read_activities(self, *args, **kwargs):
+            CountingBackend.reads += 1
+            return super().read_activities(*args, **kwargs)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = CountingBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir), columnar=False)
+        tracker_manager = TrackerDataManager("cachetest", backend=backend)
+        entry = {'tracker_type': 'counter', 'tracker_name': 'Water Intake', 'value': 6, 'goal': 8}
+        tracker_manager.log_activities([{**entry, 'date': '2026-01-02'}, {**entry, 'date': '2026-01-03'}])
+        
+        tracker_manager.get_activities_by_date('2026-01-02')
+        tracker_manager.get_activities_by_date_range('2026-01-01', '2026-01-31')
+        tracker_manager.calculate_streak()
+        reads_after_first_render = CountingBackend.reads
+        
+        # Own write (out of order) patches the frame instead of reloading
+        tracker_manager.log_activity({**entry, 'date': '2026-01-01'})
+        own_write_range = tracker_manager.get_activities_by_date_range('2026-01-01', '2026-01-31')
+        reads_after_own_write = CountingBackend.reads
+        
+        # Another writer (e.g. a second app instance) invalidates the cache
+        TrackerDataManager("cachetest", backend=CSVBackend(backend.users_file, backend.users_dir)).log_activity(
+            {**entry, 'date': '2026-01-04'}
+        )
+        external_range = tracker_manager.get_activities_by_date_range('2026-01-01', '2026-01-31')
+        
+        checks = [
+            ("one parse for repeated reads", reads_after_first_render == 1),
+            ("own write needs no re-read", reads_after_own_write == 1),
+            ("own write visible and sorted",
+             own_write_range['date'].dt.strftime('%Y-%m-%d').tolist() == ['2026-01-01', '2026-01-02', '2026-01-03']),
+            ("external write picked up", len(external_range) == 4 and CountingBackend.reads == 2),
+        ]
+        
+        _report(checks)
+
+
+def test_incremental_streaks():
+    """Test persisted streak state: O(1) updates, back-dated rebuilds, no history reads"""
+    print("\n🔥 Testing Incremental Streaks...")
+    print("-" * 40)
+    
+    today = datetime.now().date()
+    
+    def day(offset: int) -> str:
+        return (today - timedelta(days=offset)).strftime('%Y-%m-%d')
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir))
+        tracker_manager = TrackerDataManager("streaktest", backend=backend)
+        water = {'tracker_type': 'counter', 'tracker_name': 'Water Intake', 'value': 6, 'goal': 8}
+        sleep = {'tracker_type': 'duration', 'tracker_name': 'Sleep', 'value': 7, 'goal': 8}
+        
+        tracker_manager.log_activities([{**water, 'date': day(n)} for n in (3, 2, 1)] +
+                                       [{**sleep, 'date': day(6)}])
+        after_log = (tracker_manager.calculate_streak('Water Intake'),
+                     tracker_manager.calculate_streak('Sleep'),
+                     tracker_manager.calculate_streak())
+        
+        # A fresh manager answers from the stored state without loading history
+        fresh_manager = TrackerDataManager("streaktest", backend=backend)
+        fresh_streak = fresh_manager.calculate_streak('Water Intake')
+        history_loaded = fresh_manager._frame is not None
+        
+        # Back-dated entry joins two runs: 4 (gap at 5) ... 1 → rebuild
+        tracker_manager.log_activities([{**water, 'date': day(5)}, {**water, 'date': day(4)}])
+        after_backfill = (tracker_manager.calculate_streak('Water Intake'),
+                          tracker_manager.get_longest_streak('Water Intake'))
+        
+        tracker_manager.log_activity({**water, 'date': day(0)})
+        
+        # A row written around the manager makes the stored state stale: rebuilt, and reads don't write
+        backend.append_activities("streaktest", [TrackerDataManager._build_activity_entry({**sleep, 'date': day(0)})])
+        backend.flush()
+        stored_before = backend.streaks_file("streaktest").read_bytes()
+        outside_streak = TrackerDataManager("streaktest", backend=backend).calculate_streak('Sleep')
+        backend.flush()
+        read_only = backend.streaks_file("streaktest").read_bytes() == stored_before
+        
+        checks = [
+            ("streaks after bulk log", after_log == (3, 0, 3)),
+            ("state persisted", backend.streaks_file("streaktest").exists()),
+            ("stored state read without history", fresh_streak == 3 and not history_loaded),
+            ("back-dated rows rebuild", after_backfill == (5, 5)),
+            ("today extends streak", tracker_manager.calculate_streak('Water Intake') == 6),
+            ("other manager sees update", fresh_manager.calculate_streak('Water Intake') == 6),
+            ("stale stored state rebuilt", outside_streak == 1),
+            ("reads don't write streak state", read_only),
+            ("list-based calculator agrees",
+             StatisticsCalculator.calculate_streak([datetime.now() - timedelta(days=n) for n in (0, 1, 1, 2)]) == 3),
+        ]
+        
+        _report(checks)
+
+
+def test_all_streaks_vectorized():
+    """Test calculate_all_streaks / compute_streaks against the per-tracker loop"""
+    print("\n📊 Testing Vectorized Streaks...")
+    print("-" * 40)
+    
+    today = datetime.now().date()
+    rng = random.Random(7)
+    entries = []
+    for tracker_name in ('Water Intake', 'Sleep', 'Exercise', 'Reading'):
+        for offset in range(60):
+            if rng.random() < 0.7:
+                entries.append({'tracker_type': 'counter', 'tracker_name': tracker_name, 'value': 1, 'goal': 1,
+                                'date': (today - timedelta(days=offset)).strftime('%Y-%m-%d')})
+    rng.shuffle(entries)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir))
+        tracker_manager = TrackerDataManager("vectortest", backend=backend)
+        tracker_manager.log_activities(entries)
+        
+        history = tracker_manager._activities()
+        table = TrackerDataManager.compute_streaks(history)
+        all_streaks = tracker_manager.calculate_all_streaks()
+        
+        loop_results = {}
+        for tracker_name in history['tracker_name'].unique():
+            state = StreakState.from_dates(history.loc[history['tracker_name'] == tracker_name, 'date'].dt.date)
+            loop_results[tracker_name] = {"current": state.current_as_of(today), "longest": state.longest}
+        
+        checks = [
+            ("one entry per tracker", sorted(all_streaks) == sorted(loop_results)),
+            ("matches per-tracker loop", all_streaks == loop_results),
+            ("matches calculate_streak",
+             all(all_streaks[name]["current"] == tracker_manager.calculate_streak(name) for name in all_streaks)),
+            ("longest streaks from one pass",
+             table['longest_streak'].to_dict() == {name: r["longest"] for name, r in loop_results.items()}),
+            ("empty history", TrackerDataManager.compute_streaks(history.iloc[:0]).empty),
+        ]
+        
+        _report(checks)
+
+
+def test_achievement_engine():
+    """Test incremental achievement counters, unlocks and bulk re-evaluation"""
+    print("\n🏆 Testing Achievement Engine...")
+    print("-" * 40)
+    
+    today = datetime.now().date()
+    
+    def day(offset: int) -> str:
+        return (today - timedelta(days=offset)).strftime('%Y-%m-%d')
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir))
+        backend.initialize()
+        backend.insert_users([{"username": "achievetest"}], pd.DataFrame([{"username": "achievetest"}]))
+        backend.create_user_storage("achievetest")
+        tracker_manager = TrackerDataManager("achievetest", backend=backend)
+        study = {'tracker_type': 'duration', 'tracker_name': 'Study Hours', 'goal': 4}
+        water = {'tracker_type': 'counter', 'tracker_name': 'Water Intake', 'value': 4, 'goal': 8}
+        
+        tracker_manager.log_activity({**study, 'value': 2, 'date': day(2)})
+        first_unlock = [a["name"] for a in tracker_manager.achievements.last_unlocked]
+        
+        tracker_manager.log_activities([{**study, 'value': 40, 'date': day(1)}, {**water, 'date': day(1)}])
+        tracker_manager.log_activities([{**study, 'value': 60, 'date': day(0)}])
+        second_unlock = sorted(a["name"] for a in tracker_manager.achievements.last_unlocked)
+        
+        achievements = tracker_manager.achievements.get_achievements().set_index("name")
+        progress = achievements["progress"].to_dict()
+        
+        # Bulk pass over all users must agree with the incremental counters
+        backend.save_achievements("achievetest", AchievementEngine.apply_counters(
+            backend.load_achievements("achievetest").iloc[:0], {})[0])
+        bulk_unlocked = AchievementEngine.evaluate_all_users(backend)
+        bulk_progress = tracker_manager.achievements.get_achievements().set_index("name")["progress"].to_dict()
+        
+        # An exception mid-call clears the previous unlocks instead of re-reporting them
+        def broken_load(backend, username):
+            raise OSError("disk gone")
+        
+        engine = tracker_manager.achievements
+        engine.last_unlocked = [{"name": "First Steps"}]
+        engine._load = broken_load
+        failed_call = _raises(OSError, engine.record_activities, [{**study, 'value': 1, 'date': day(0)}])
+        del engine._load
+        
+        checks = [
+            ("first log unlocks First Steps", first_unlock == ["First Steps"]),
+            ("streak, perfect day and hours unlock",
+             second_unlock == ["3-Day Streak", "Century Club", "Perfect Day"]),
+            ("unlock timestamp stored", achievements.loc["First Steps", "unlocked_date"].startswith(day(0))),
+            ("running counters",
+             (progress["First Steps"], progress["Century Club"], progress["Dedication"], progress["3-Day Streak"])
+             == (4, 102, 3, 3)),
+            ("locked achievements stay locked", achievements.loc["Week Warrior", "completed"] == "no"),
+            ("bulk re-evaluation matches", bulk_progress == progress and len(bulk_unlocked["achievetest"]) == 4),
+            ("failed call clears stale unlocks", failed_call and engine.last_unlocked == []),
+        ]
+        
+        _report(checks)
+
+
+def test_background_runner():
+    """Test BackgroundTaskRunner delivery on the polling thread and stale-result cancellation"""
+    print("\n🧵 Testing Background Task Runner...")
+    print("-" * 40)
+    
+    from background import BackgroundTaskRunner
+    
+    class FakeRoot:
+        """Stands in for Tk: after() callbacks run when the test pumps them"""
+        def __init__(self):
+            self.callbacks = []
+        
+        def after(self, _ms, callback):
+            self.callbacks.append(callback)
+        
+        def pump(self):
+            while self.callbacks:
+                self.callbacks.pop(0)()
+    
+    root = FakeRoot()
+    runner = BackgroundTaskRunner(root, max_workers=1)
+    delivered = []
+    errors = []
+    release = threading.Event()
+    page = {"token": 1}
+    
+    runner.submit(release.wait, on_done=lambda _: delivered.append("blocker"))
+    runner.submit(lambda: threading.current_thread().name,
+                  on_done=lambda name: delivered.append(("worker", name, threading.current_thread().name)))
+    stale = runner.submit(lambda: "old page", on_done=delivered.append,
+                          is_current=lambda token=page["token"]: token == page["token"])
+    runner.submit(lambda: 1 / 0, on_done=delivered.append, on_error=errors.append)
+    
+    page["token"] += 1
+    runner.cancel_stale()
+    release.set()
+    runner.executor.shutdown(wait=True)
+    root.pump()
+    
+    worker = next(item for item in delivered if isinstance(item, tuple))
+    checks = [
+        ("results delivered", delivered[0] == "blocker"),
+        ("work ran off the polling thread", worker[1].startswith("habit-tracker-bg") and worker[2] == "MainThread"),
+        ("stale task cancelled before running", stale.cancelled() and "old page" not in delivered),
+        ("errors routed to on_error", len(errors) == 1 and isinstance(errors[0], ZeroDivisionError)),
+        ("nothing left pending", runner._pending == []),
+    ]
+    
+    _report(checks)
+
+
 def test_tracker_definitions():
     """Test tracker class definitions"""
     print("\n📋 Testing Tracker Definitions...")
@@ -121,6 +1094,66 @@ def test_tracker_definitions():
             traceback.print_exc()
 
 
+def test_tracker_registry():
+    """Test shared role tracker catalogs and name lookup"""
+    print("\n🗂️ Testing Tracker Registry...")
+    print("-" * 40)
+    
+    student = get_student_trackers()
+    catalog = get_role_trackers("student")
+    index = get_tracker_index("student")
+    sleep = find_tracker("student", "Sleep Duration")
+    custom_sleep = sleep.copy()
+    custom_sleep.goal = 9.0
+    
+    checks = [
+        ("catalog built once", get_role_trackers("student") is catalog),
+        ("catalog matches definitions", [t.to_dict() for t in catalog] == [t.to_dict() for t in student]),
+        ("catalog is immutable", isinstance(catalog, tuple) and _raises(AttributeError, setattr, catalog[0], "goal", 99)),
+        ("index is read-only", _raises(TypeError, operator.setitem, index, "x", sleep)),
+        ("lookup by name", sleep is not None and sleep.name == "Sleep Duration" and index["Sleep Duration"] is sleep),
+        ("unknown name/role", find_tracker("student", "Nope") is None and get_role_trackers("custom") == ()),
+        ("copy is modifiable", custom_sleep.goal == 9.0 and sleep.goal == 8.0),
+        ("validate logged value", validate_activity("student", "Sleep Duration", 7.5)
+         and not validate_activity("student", "Sleep Duration", -1)
+         and not validate_activity("student", "Nope", 1)),
+        ("factories still return fresh trackers", get_student_trackers()[0] is not student[0]),
+    ]
+    
+    _report(checks)
+
+
+def test_tracker_value_validation():
+    """Test slot-based trackers and vectorized value validation"""
+    print("\n🔢 Testing Tracker Value Validation...")
+    print("-" * 40)
+    
+    rating = RatingTracker("Mood", max_rating=10, goal=7)
+    candidates = ["3", "abc", None, 11, float("nan"), 0, 10, "7.5"]
+    expected = [rating.validate_value(value) for value in candidates]
+    mask = BaseTracker.validate_values(candidates, rating.min_value, rating.max_value)
+    
+    rows = pd.DataFrame({
+        "tracker_name": ["Sleep Duration", "Sleep Duration", "Nope", "Study Hours"],
+        "value": [7.5, 30, 1, "x"]
+    })
+    big = pd.DataFrame({"tracker_name": ["Sleep Duration"] * 10000, "value": range(10000)})
+    big_mask = validate_activities("student", big)
+    sleep = find_tracker("student", "Sleep Duration")
+    
+    checks = [
+        ("no per-instance dict", not hasattr(rating, "__dict__") and _raises(AttributeError, setattr, rating, "extra", 1)),
+        ("mask matches validate_value", mask.dtype == bool and list(mask) == expected),
+        ("non-numeric values invalid", expected == [True, False, False, False, False, False, True, True]),
+        ("per-row bounds", list(BaseTracker.validate_values([5, 5], [0, 6], [10, 10])) == [True, False]),
+        ("role rows validated", list(validate_activities("student", rows)) == [True, False, False, False]),
+        ("bulk rows validated", int(big_mask.sum()) == int(sleep.max_value) + 1
+         and bool(big_mask[int(sleep.max_value)]) and not big_mask[int(sleep.max_value) + 1]),
+    ]
+    
+    _report(checks)
+
+
 def test_validators():
     """Test input validators"""
     print("\n✅ Testing Validators...")
@@ -201,6 +1234,42 @@ def test_statistics_calculator():
         traceback.print_exc()
 
 
+def test_activity_summary():
+    """Test vectorized completion summary against the per-row loop"""
+    print("\n🧮 Testing Activity Summary...")
+    print("-" * 40)
+    
+    activities = pd.DataFrame([
+        {'tracker_name': 'Sleep', 'value': 7.0, 'goal': 8.0, 'unit': 'hours', 'completed': 'no'},
+        {'tracker_name': 'Water Intake', 'value': 10, 'goal': 8, 'unit': 'glasses', 'completed': 'yes'},
+        {'tracker_name': 'Water Intake', 'value': 2, 'goal': 8, 'unit': 'glasses', 'completed': 'no'},
+        {'tracker_name': 'Meditation', 'value': 1, 'goal': 0, 'unit': 'boolean', 'completed': 'yes'},
+        {'tracker_name': 'Bedtime', 'value': '22:30', 'goal': 1, 'unit': 'time', 'completed': 'no'},
+    ])
+    
+    # Reference: the dashboard's original per-row loop (numeric rows only)
+    expected_avg = sum(
+        min(100, float(row['value']) / float(row['goal']) * 100)
+        for _, row in activities.iloc[:4].iterrows() if row['goal'] > 0
+    ) / len(activities)
+    
+    summary = StatisticsCalculator.summarize_activities(activities)
+    by_tracker = summary["by_tracker"]
+    empty = StatisticsCalculator.summarize_activities(activities.iloc[:0])
+    
+    checks = [
+        ("totals", (summary["total"], summary["completed"]) == (5, 2)),
+        ("completion rate", summary["completion_rate"] == 40.0),
+        ("average completion matches loop", abs(summary["avg_completion"] - expected_avg) < 1e-9),
+        ("per-tracker breakdown",
+         by_tracker.loc['Water Intake', ['entries', 'completed', 'avg_completion', 'value']].tolist() == [2, 1, 62.5, 2]),
+        ("tracker order kept", by_tracker.index.tolist() == ['Sleep', 'Water Intake', 'Meditation', 'Bedtime']),
+        ("empty input", (empty["total"], empty["completion_rate"], len(empty["by_tracker"])) == (0, 0.0, 0)),
+    ]
+    
+    _report(checks)
+
+
 def test_date_time_helper():
     """Test date/time utilities"""
     print("\n🕐 Testing DateTimeHelper...")
@@ -266,6 +1335,169 @@ def test_data_integrity():
         traceback.print_exc()
 
 
+def test_benchmark_harness():
+    """Test benchmark statistics, JSON results and run comparison"""
+    print("\n⏱️  Testing Benchmark Harness...")
+    print("-" * 40)
+    
+    import benchmark
+    import utils
+    
+    original_rounds = utils.BCRYPT_ROUNDS
+    utils.BCRYPT_ROUNDS = 4  # keep hashing cheap in tests
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            report = benchmark.run_benchmarks(sizes=[6], days=10, trackers_per_day=3, iterations=8,
+                                              auth_iterations=2, backend_kind="csv")
+            output = benchmark.save_results(report, Path(tmp_dir) / "run.json")
+            saved = benchmark.load_results(output)
+            
+            slower = benchmark.load_results(output)
+            for entry in slower["results"]:
+                if entry["operation"] == "calculate_streak":
+                    entry["p50_ms"] = entry["p50_ms"] * 2 + 1
+                    entry["ops_per_sec"] /= 3
+            benchmark.save_results(slower, Path(tmp_dir) / "slower.json")
+            same = benchmark.compare_results(saved, saved)
+            latency = benchmark.compare_results(saved, slower, "p50_ms", 0.10)
+            throughput = benchmark.compare_results(saved, slower, "ops_per_sec", 0.10)
+            exit_codes = [benchmark.main(["compare", str(output), str(output)]),
+                          benchmark.main(["compare", str(output), str(Path(tmp_dir) / "slower.json")])]
+    finally:
+        utils.BCRYPT_ROUNDS = original_rounds
+    
+    results = {entry["operation"]: entry for entry in report["results"]}
+    required = ["log_activity", "get_activities_by_date", "get_activities_by_date_range",
+                "calculate_streak", "authenticate_user", "username_exists"]
+    
+    checks = [
+        ("all hot paths measured", all(name in results for name in required)),
+        ("percentiles ordered", all(e["min_ms"] <= e["p50_ms"] <= e["p95_ms"] <= e["p99_ms"] <= e["max_ms"]
+                                    for e in report["results"])),
+        ("throughput reported", all(e["ops_per_sec"] > 0 for e in report["results"])),
+        ("login iterations capped", results["authenticate_user"]["iterations"] == 2
+         and results["username_exists"]["iterations"] == 8),
+        ("JSON round trip", saved == report),
+        ("identical runs pass", not any(row["regressed"] for row in same)),
+        ("slower latency flagged", [row["operation"] for row in latency if row["regressed"]] == ["calculate_streak"]),
+        ("lower throughput flagged", [row["operation"] for row in throughput if row["regressed"]] == ["calculate_streak"]),
+        ("compare exit code", exit_codes == [0, 1]),
+    ]
+    
+    _report(checks)
+
+
+def test_instrumentation():
+    """Test opt-in call/IO metrics and their JSON dump"""
+    print("\n🔬 Testing Instrumentation...")
+    print("-" * 40)
+    
+    import json
+    import instrumentation
+    
+    @instrumentation.timed("test.failing")
+    def failing():
+        raise ValueError("boom")
+    
+    was_enabled = instrumentation.is_enabled()
+    original = UserDataManager.__dict__["username_exists"]
+    instrumentation.enable()
+    instrumentation.registry.reset()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            backend = CSVBackend(Path(tmp_dir) / "users_data.csv", Path(tmp_dir))
+            backend.initialize()
+            backend.create_user_storage("metrics")
+            manager = TrackerDataManager("metrics", backend)
+            today = datetime.now().strftime("%Y-%m-%d")
+            for value in (1, 2, 3):
+                manager.log_activity({"date": today, "tracker_type": "numeric", "tracker_name": "Water",
+                                      "value": value, "goal": 8, "unit": "glasses"})
+            rows = len(TrackerDataManager("metrics", backend).get_activities_by_date(today))
+            UserDataManager(backend=backend).username_exists("metrics")
+            _raises(ValueError, failing)
+            with instrumentation.span("test.block"):
+                pass
+            metrics = instrumentation.snapshot()["metrics"]
+            dumped = json.loads(instrumentation.dump(Path(tmp_dir) / "metrics.json").read_text(encoding="utf-8"))
+    finally:
+        instrumentation.enable(was_enabled)
+    
+    instrumentation.registry.reset()
+    manager_is_plain = UserDataManager.__dict__["username_exists"] is original
+    _raises(ValueError, failing)
+    
+    log = metrics.get("TrackerDataManager.log_activity", {})
+    read = metrics.get("TrackerDataManager.get_activities_by_date", {})
+    
+    checks = [
+        ("calls counted", log.get("calls") == 3 and metrics.get("UserDataManager.username_exists", {}).get("calls") == 1),
+        ("wall time recorded", log.get("total_ms", 0) > 0 and log["max_ms"] <= log["total_ms"]),
+        ("bytes written attributed", log.get("bytes_written", 0) > 0),
+        ("rows and bytes read attributed", rows == 3 and read.get("rows_read") == 3 and read.get("bytes_read", 0) > 0),
+        ("nested calls inclusive", metrics.get("TrackerDataManager.log_activities", {}).get("calls") == 3),
+        ("errors counted", metrics.get("test.failing", {}).get("errors") == 1),
+        ("context manager span", metrics.get("test.block", {}).get("calls") == 1),
+        ("JSON dump", dumped["metrics"].keys() == metrics.keys()),
+        ("disabled restores plain methods", was_enabled or manager_is_plain),
+        ("nothing recorded while disabled", was_enabled or not instrumentation.snapshot()["metrics"]),
+    ]
+    
+    _report(checks)
+
+
+def test_lazy_startup_imports():
+    """Test that the login window's imports leave the data layer for later"""
+    print("\n🚀 Testing Lazy Startup Imports...")
+    print("-" * 40)
+    
+    import subprocess
+    
+    probe = (
+        "import sys, main; "
+        "print(','.join(main.EAGER_MODULES)); "
+        "print(','.join(name for name in ('pandas', 'numpy', 'bcrypt', 'pyarrow') if name in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], cwd=str(project_root),
+                            capture_output=True, text=True, timeout=60)
+    eager, heavy = (result.stdout.split("\n") + ["?", "?"])[:2]
+    
+    import auth
+    from config import ensure_directories
+    ensure_directories()  # idempotent
+    
+    # Handlers check the background import instead of blocking on or re-raising it
+    from concurrent.futures import Future
+    from types import SimpleNamespace
+    
+    class Label:
+        text = ""
+        
+        def configure(self, text, **options):
+            self.text = text
+    
+    def ready(future):
+        label = Label()
+        app = SimpleNamespace(data_layer=future, palette={"error": "red"})
+        return auth.AuthenticationApp.data_layer_ready(app, label), label.text
+    
+    loading, failed, loaded = Future(), Future(), Future()
+    failed.set_exception(ImportError("no pandas"))
+    loaded.set_result(None)
+    
+    checks = [
+        ("main imports cleanly", result.returncode == 0),
+        ("no deferred module imported eagerly", eager == ""),
+        ("pandas/numpy/bcrypt not loaded", heavy == ""),
+        ("background loader opens the user store", isinstance(auth.load_data_layer(), UserDataManager)),
+        ("still loading is reported, not waited for", ready(loading) == (False, "Still loading, please try again in a moment...")),
+        ("failed import shown in the status", ready(failed) == (False, "Couldn't load user data: no pandas")),
+        ("finished import lets handlers run", ready(loaded)[0]),
+    ]
+    
+    _report(checks)
+
+
 def run_all_tests():
     """Run all automated tests"""
     print("=" * 60)
@@ -273,12 +1505,35 @@ def run_all_tests():
     print("=" * 60)
     
     test_user_authentication()
+    test_user_registry()
+    test_bulk_user_creation()
+    test_password_hasher_async()
+    test_password_rehash_on_login()
+    test_session_preload()
+    test_atomic_coalesced_writes()
+    test_multiprocess_file_locks()
     test_tracker_data_retrieval()
+    test_log_activity_append()
+    test_log_activities_bulk()
+    test_sqlite_backend_migration()
+    test_columnar_snapshot()
+    test_synthetic_dataset()
+    test_activity_cache()
+    test_incremental_streaks()
+    test_all_streaks_vectorized()
+    test_achievement_engine()
+    test_background_runner()
     test_tracker_definitions()
+    test_tracker_registry()
+    test_tracker_value_validation()
     test_validators()
     test_statistics_calculator()
+    test_activity_summary()
     test_date_time_helper()
     test_data_integrity()
+    test_benchmark_harness()
+    test_instrumentation()
+    test_lazy_startup_imports()
     
     print()
     print("=" * 60)
@@ -4,11 +4,19 @@ All specific trackers inherit from this base class
 """
 from typing import Dict, Any, Optional
 from datetime import datetime
+import numpy as np
+import pandas as pd
 
 
 class BaseTracker:
     """Base class for all tracker types"""
     
+    # Fixed attribute set (no per-instance __dict__), subclasses add no slots
+    __slots__ = (
+        "name", "tracker_type", "unit", "goal", "description", "icon",
+        "category", "customizable", "min_value", "max_value", "_frozen"
+    )
+    
     def __init__(self, name: str, tracker_type: str, unit: str, goal: float = 0, description: str = ""):
         """
         Initialize base tracker
@@ -31,6 +39,25 @@ class BaseTracker:
         self.min_value = 0
         self.max_value = 100
     
+    def __setattr__(self, name: str, value: Any):
+        """Refuse changes once frozen (catalog trackers are shared between callers)"""
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Tracker '{self.name}' is a shared catalog definition, use copy() to modify it")
+        super().__setattr__(name, value)
+    
+    def freeze(self) -> "BaseTracker":
+        """Make the tracker read-only and return it"""
+        self._frozen = True
+        return self
+    
+    def copy(self) -> "BaseTracker":
+        """Get a modifiable copy (e.g. to customize a catalog tracker)"""
+        clone = object.__new__(type(self))
+        for slot in BaseTracker.__slots__:
+            if slot != "_frozen" and hasattr(self, slot):
+                object.__setattr__(clone, slot, getattr(self, slot))
+        return clone
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert tracker to dictionary"""
         return {
@@ -50,14 +77,33 @@ class BaseTracker:
         """Validate if a value is acceptable for this tracker"""
         try:
             num_value = float(value)
-            return self.min_value <= num_value <= self.max_value
-        except:
+        except (TypeError, ValueError):
             return False
+        return self.min_value <= num_value <= self.max_value
+    
+    @classmethod
+    def validate_values(cls, values, min_value, max_value) -> np.ndarray:
+        """
+        Vectorized validate_value for a whole column of values
+        
+        Args:
+            values: Candidate values (Series/array/list, non-numeric ones are invalid)
+            min_value: Lower bound, a scalar or an array aligned with values
+            max_value: Upper bound, a scalar or an array aligned with values
+            
+        Returns:
+            Boolean mask, True where the value is a number within its bounds
+        """
+        numbers = pd.to_numeric(pd.Series(values, copy=False), errors="coerce").to_numpy(dtype=float)
+        with np.errstate(invalid="ignore"):
+            return (numbers >= np.asarray(min_value, dtype=float)) & (numbers <= np.asarray(max_value, dtype=float))
 
 
 class DurationTracker(BaseTracker):
     """Tracker for time duration (hours, minutes)"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, goal: float = 0, description: str = ""):
         super().__init__(name, "duration", "hours", goal, description)
         self.min_value = 0
@@ -67,6 +113,8 @@ class DurationTracker(BaseTracker):
 class CounterTracker(BaseTracker):
     """Tracker for counting items (glasses, meals, etc.)"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, unit: str, goal: float = 0, description: str = ""):
         super().__init__(name, "counter", unit, goal, description)
         self.min_value = 0
@@ -76,6 +124,8 @@ class CounterTracker(BaseTracker):
 class RatingTracker(BaseTracker):
     """Tracker for rating/scale (1-5 stars, 1-10 scale)"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, max_rating: int = 5, goal: float = 5, description: str = ""):
         super().__init__(name, "rating", "stars", goal, description)
         self.min_value = 1
@@ -85,6 +135,8 @@ class RatingTracker(BaseTracker):
 class CheckboxTracker(BaseTracker):
     """Tracker for yes/no or completed/not completed"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, description: str = ""):
         super().__init__(name, "checkbox", "boolean", 1, description)
         self.min_value = 0
@@ -94,6 +146,8 @@ class CheckboxTracker(BaseTracker):
 class NumericTracker(BaseTracker):
     """Tracker for numeric values (weight, blood pressure, etc.)"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, unit: str, goal: float = 0, min_val: float = 0, max_val: float = 1000, description: str = ""):
         super().__init__(name, "numeric", unit, goal, description)
         self.min_value = min_val
@@ -103,5 +157,7 @@ class NumericTracker(BaseTracker):
 class TimeTracker(BaseTracker):
     """Tracker for specific times (bedtime, meal time)"""
     
+    __slots__ = ()
+    
     def __init__(self, name: str, description: str = ""):
         super().__init__(name, "time", "HH:MM", 0, description)
@@ -0,0 +1,87 @@
+"""
+Tracker Registry
+Role-keyed tracker catalogs, built once and shared by every caller
+"""
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from trackers.base_tracker import BaseTracker
+from trackers.student_trackers import get_student_trackers
+from trackers.adult_trackers import get_adult_trackers
+from trackers.senior_trackers import get_senior_trackers
+
+
+# Catalog builders per role (roles without one, e.g. custom, have no preset trackers)
+ROLE_CATALOGS = {
+    "student": get_student_trackers,
+    "adult": get_adult_trackers,
+    "senior": get_senior_trackers
+}
+
+
+@lru_cache(maxsize=None)
+def get_role_trackers(role: str) -> Tuple[BaseTracker, ...]:
+    """
+    Get the preset trackers for a role
+
+    The catalog is built on first use and the same frozen tracker objects
+    are returned afterwards; call tracker.copy() to get a modifiable one.
+    """
+    build = ROLE_CATALOGS.get(role)
+    if build is None:
+        return ()
+    return tuple(tracker.freeze() for tracker in build())
+
+
+@lru_cache(maxsize=None)
+def get_tracker_index(role: str) -> Mapping[str, BaseTracker]:
+    """Read-only tracker name -> tracker mapping for a role"""
+    return MappingProxyType({tracker.name: tracker for tracker in get_role_trackers(role)})
+
+
+def find_tracker(role: str, name: str) -> Optional[BaseTracker]:
+    """Look up a role's tracker by name (None if the role has no such tracker)"""
+    return get_tracker_index(role).get(name)
+
+
+def validate_activity(role: str, tracker_name: str, value: Any) -> bool:
+    """Check a logged value against the role's tracker definition"""
+    tracker = find_tracker(role, tracker_name)
+    return tracker is not None and tracker.validate_value(value)
+
+
+@lru_cache(maxsize=None)
+def _tracker_bounds(role: str) -> pd.DataFrame:
+    """min_value/max_value per tracker name for a role"""
+    trackers = get_role_trackers(role)
+    return pd.DataFrame(
+        {
+            "min_value": [tracker.min_value for tracker in trackers],
+            "max_value": [tracker.max_value for tracker in trackers]
+        },
+        index=pd.Index([tracker.name for tracker in trackers], name="tracker_name"),
+        dtype=float
+    )
+
+
+def validate_activities(role: str, activities: pd.DataFrame) -> np.ndarray:
+    """
+    Vectorized validate_activity for many logged rows
+
+    Args:
+        activities: Rows with tracker_name and value columns
+
+    Returns:
+        Boolean mask in row order (rows of unknown trackers are invalid)
+    """
+    bounds = _tracker_bounds(role)
+    names = activities["tracker_name"]
+    return BaseTracker.validate_values(
+        activities["value"],
+        names.map(bounds["min_value"]).to_numpy(dtype=float),
+        names.map(bounds["max_value"]).to_numpy(dtype=float)
+    )
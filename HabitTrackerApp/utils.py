@@ -6,24 +6,69 @@ Utility Functions for Habit Tracker Application
 - Statistics calculations
 """
 import bcrypt
+import os
 import re
+import threading
+import time
 import validators
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from itertools import repeat
+from datetime import datetime, date, timedelta
+from typing import Optional, Dict, List, Tuple, Iterable, Callable, Any
 import pytz
-from config import VALIDATION
+from instrumentation import instrumented
+from config import (
+    VALIDATION, BCRYPT_ROUNDS, BCRYPT_TARGET_LATENCY_MS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_PROCESSES
+)
 
 
+@instrumented
 class PasswordHasher:
-    """Handle password hashing and verification using bcrypt"""
+    """
+    Handle password hashing and verification using bcrypt
+    
+    The *_async variants run on a shared worker pool (bcrypt releases the
+    GIL while hashing) and return a Future, so GUI code can keep its event
+    loop running and pick the result up with a completion callback.
+    """
+    
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
+    # Below this many passwords, starting worker processes costs more than it saves
+    PROCESS_POOL_MIN_BATCH = 8
     
     @staticmethod
-    def hash_password(password: str) -> str:
-        """Hash a password using bcrypt"""
-        salt = bcrypt.gensalt()
+    def hash_password(password: str, rounds: Optional[int] = None) -> str:
+        """Hash a password using bcrypt (work factor: config.BCRYPT_ROUNDS)"""
+        salt = bcrypt.gensalt(rounds=rounds or BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
     
+    @classmethod
+    def hash_passwords(cls, passwords: Iterable[str], rounds: Optional[int] = None,
+                       processes: Optional[int] = None) -> List[str]:
+        """
+        Hash many passwords on a process pool (bulk user creation)
+        
+        Args:
+            processes: Worker processes (default: config.PASSWORD_HASH_PROCESSES or CPU count)
+            
+        Returns:
+            Hashes in input order
+        """
+        passwords = list(passwords)
+        rounds = rounds or BCRYPT_ROUNDS
+        processes = processes or PASSWORD_HASH_PROCESSES or os.cpu_count() or 1
+        if processes <= 1 or len(passwords) < cls.PROCESS_POOL_MIN_BATCH:
+            return [cls.hash_password(password, rounds) for password in passwords]
+        
+        processes = min(processes, len(passwords))
+        chunksize = max(1, len(passwords) // (processes * 4))
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            return list(pool.map(cls.hash_password, passwords, repeat(rounds), chunksize=chunksize))
+    
     @staticmethod
     def verify_password(password: str, hashed: str) -> bool:
         """Verify a password against its hash"""
@@ -31,6 +76,77 @@ class PasswordHasher:
             return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
         except Exception:
             return False
+    
+    @staticmethod
+    def get_cost(hashed: str) -> Optional[int]:
+        """Work factor stored in a bcrypt hash ("$2b$12$..." -> 12)"""
+        match = re.match(r'^\$2[abxy]?\$(\d{2})\$', hashed or '')
+        return int(match.group(1)) if match else None
+    
+    @staticmethod
+    def needs_rehash(hashed: str, rounds: Optional[int] = None) -> bool:
+        """Check if a stored hash uses a lower cost than the target (stronger hashes are kept)"""
+        cost = PasswordHasher.get_cost(hashed)
+        return cost is None or cost < (rounds or BCRYPT_ROUNDS)
+    
+    @staticmethod
+    def benchmark_cost(target_ms: float = BCRYPT_TARGET_LATENCY_MS, min_rounds: int = 4,
+                       max_rounds: int = 16) -> int:
+        """
+        Find the highest bcrypt cost whose hash time stays under target_ms here
+        
+        Costs are timed from min_rounds upwards, stopping at the first one
+        over the target (each step doubles the time, so this stays cheap).
+        
+        Returns:
+            Suggested value for config.BCRYPT_ROUNDS (at least min_rounds)
+        """
+        best = min_rounds
+        for rounds in range(min_rounds, max_rounds + 1):
+            salt = bcrypt.gensalt(rounds=rounds)
+            start = time.perf_counter()
+            bcrypt.hashpw(b"benchmark-password", salt)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if elapsed_ms > target_ms:
+                break
+            best = rounds
+        return best
+    
+    @classmethod
+    def executor(cls) -> ThreadPoolExecutor:
+        """Shared worker pool for password hashing (created on first use)"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hasher"
+                )
+            return cls._executor
+    
+    @classmethod
+    def run_async(cls, func: Callable, *args, callback: Optional[Callable[[Any], None]] = None) -> Future:
+        """
+        Run a hashing call (or anything that hashes, e.g. authenticate_user) on the pool
+        
+        Args:
+            callback: Called with the result when done. It runs on the worker
+                thread; Tk code should hand the Future to
+                background.BackgroundTaskRunner.watch instead.
+        """
+        future = cls.executor().submit(func, *args)
+        if callback is not None:
+            future.add_done_callback(lambda done: callback(done.result()))
+        return future
+    
+    @classmethod
+    def hash_password_async(cls, password: str, callback: Optional[Callable[[str], None]] = None) -> Future:
+        """hash_password on the worker pool"""
+        return cls.run_async(cls.hash_password, password, callback=callback)
+    
+    @classmethod
+    def verify_password_async(cls, password: str, hashed: str,
+                              callback: Optional[Callable[[bool], None]] = None) -> Future:
+        """verify_password on the worker pool"""
+        return cls.run_async(cls.verify_password, password, hashed, callback=callback)
 
 
 class Validators:
@@ -224,6 +340,56 @@ class DateTimeHelper:
             return now >= start or now <= end
 
 
+class StreakState:
+    """
+    Running streak for one tracker (or overall), updated one logged day at a time
+    
+    current: length of the run of consecutive days ending at last_active
+    longest: longest run seen so far
+    """
+    
+    def __init__(self, current: int = 0, longest: int = 0, last_active: Optional[date] = None):
+        self.current = current
+        self.longest = longest
+        self.last_active = last_active
+    
+    def advance(self, day: date) -> bool:
+        """
+        Fold in a newly logged day
+        
+        Returns:
+            False if the day is older than last_active (state must be rebuilt
+            from history), True otherwise
+        """
+        if self.last_active is not None:
+            if day == self.last_active:
+                return True
+            if day < self.last_active:
+                return False
+        
+        if self.last_active is not None and day - self.last_active == timedelta(days=1):
+            self.current += 1
+        else:
+            self.current = 1
+        self.longest = max(self.longest, self.current)
+        self.last_active = day
+        return True
+    
+    def current_as_of(self, today: date) -> int:
+        """Current streak, or 0 if the run ended before yesterday"""
+        if self.last_active is None or today - self.last_active > timedelta(days=1):
+            return 0
+        return self.current
+    
+    @classmethod
+    def from_dates(cls, dates: Iterable[date]) -> "StreakState":
+        """Build state from any collection of logged days"""
+        state = cls()
+        for day in sorted(set(dates)):
+            state.advance(day)
+        return state
+
+
 class StatisticsCalculator:
     """Calculate statistics from tracking data"""
     
@@ -234,6 +400,52 @@ class StatisticsCalculator:
             return 100.0 if actual > 0 else 0.0
         return min(100.0, (actual / goal) * 100)
     
+    @staticmethod
+    def completion_percentages(activities: pd.DataFrame) -> pd.Series:
+        """Per-row goal completion % (capped at 100; 0 without a goal or numeric value)"""
+        values = pd.to_numeric(activities['value'], errors='coerce')
+        goals = pd.to_numeric(activities['goal'], errors='coerce')
+        return (values / goals * 100).clip(upper=100).where(goals > 0, 0).fillna(0)
+    
+    @staticmethod
+    def summarize_activities(activities: pd.DataFrame) -> Dict:
+        """
+        Completion summary of activity rows in one vectorized aggregation
+        
+        Returns:
+            Dict with total (rows), completed (rows marked completed),
+            completion_rate (% of rows completed), avg_completion (mean goal
+            completion %) and by_tracker (DataFrame indexed by tracker_name
+            with entries, completed, avg_completion and the latest
+            value/goal/unit)
+        """
+        rows = pd.DataFrame({
+            "tracker_name": activities['tracker_name'],
+            "completed": activities['completed'] == 'yes',
+            "completion": StatisticsCalculator.completion_percentages(activities),
+            "value": activities['value'],
+            "goal": activities['goal'],
+            "unit": activities['unit'] if 'unit' in activities.columns else None,
+        })
+        by_tracker = rows.groupby('tracker_name', sort=False).agg(
+            entries=('completed', 'size'),
+            completed=('completed', 'sum'),
+            avg_completion=('completion', 'mean'),
+            value=('value', 'last'),
+            goal=('goal', 'last'),
+            unit=('unit', 'last'),
+        )
+        
+        total = len(rows)
+        completed = int(rows['completed'].sum())
+        return {
+            "total": total,
+            "completed": completed,
+            "completion_rate": completed / total * 100 if total else 0.0,
+            "avg_completion": float(rows['completion'].mean()) if total else 0.0,
+            "by_tracker": by_tracker,
+        }
+    
     @staticmethod
     def calculate_average(values: List[float]) -> float:
         """Calculate average of values"""
@@ -247,26 +459,8 @@ class StatisticsCalculator:
         if not dates:
             return 0
         
-        # Sort dates in descending order
-        sorted_dates = sorted(dates, reverse=True)
-        
-        # Check if today is in the list
-        today = datetime.now().date()
-        yesterday = today - timedelta(days=1)
-        
-        if sorted_dates[0].date() != today and sorted_dates[0].date() != yesterday:
-            return 0
-        
-        # Count consecutive days
-        streak = 1
-        for i in range(1, len(sorted_dates)):
-            expected_date = sorted_dates[i-1].date() - timedelta(days=1)
-            if sorted_dates[i].date() == expected_date:
-                streak += 1
-            else:
-                break
-        
-        return streak
+        state = StreakState.from_dates(d.date() for d in dates)
+        return state.current_as_of(datetime.now().date())
     
     @staticmethod
     def get_progress_category(percentage: float) -> str:
@@ -0,0 +1,175 @@
+"""
+Virtualized Card List
+- Fixed-height rows on a canvas, only rows in/near the viewport get widgets
+- Card widgets are pooled per kind and rebound to other rows on scroll
+"""
+import sys
+import tkinter as tk
+import customtkinter as ctk
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class VirtualCardList(ctk.CTkFrame):
+    """
+    Scrollable list that keeps widgets only for the visible rows
+
+    The list never owns row state: create_card(parent, kind) builds an empty
+    card, bind_card(card, index) fills it for a row (e.g. points its inputs
+    at that row's Tk variables). When a row scrolls out of view its card goes
+    back to the pool of its kind and is reused for the next row of that kind.
+    """
+
+    HIDDEN_Y = -10000
+    WHEEL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+    def __init__(self, master, row_height: int, create_card: Callable[[Any, str], Any],
+                 bind_card: Callable[[Any, int], None], kind_of: Callable[[int], str],
+                 overscan: int = 2, padx: int = 20, gap: int = 20, **kwargs):
+        """
+        Initialize list
+
+        Args:
+            row_height: Height of one row including the gap between cards
+            create_card: Builds a card of a kind as a child of the given canvas
+            bind_card: Shows row index in a card
+            kind_of: Card kind for row index (cards are only reused within a kind)
+            overscan: Rows kept rendered above and below the viewport
+        """
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(master, **kwargs)
+        self.row_height = row_height
+        self.create_card = create_card
+        self.bind_card = bind_card
+        self.kind_of = kind_of
+        self.overscan = overscan
+        self.padx = padx
+        self.gap = gap
+        self.count = 0
+        self._width = 1
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0,
+                                yscrollincrement=max(1, row_height // 5))
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_view_change)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        # row index -> (kind, card, canvas item); kind -> parked (card, item)
+        self._bound: Dict[int, Tuple[str, Any, int]] = {}
+        self._free: Dict[str, List[Tuple[Any, int]]] = {}
+
+        # Wheel events reach the list through a bind tag on the canvas and its cards only
+        self._wheel_tag = f"VirtualCardList{id(self)}"
+        for sequence in self.WHEEL_SEQUENCES:
+            self.canvas.bind_class(self._wheel_tag, sequence, self._on_mousewheel)
+        self._add_wheel_tag(self.canvas)
+
+        self.canvas.bind("<Configure>", self._on_resize)
+
+    def destroy(self):
+        """Drop the wheel bindings of this list's bind tag"""
+        for sequence in self.WHEEL_SEQUENCES:
+            self.canvas.unbind_class(self._wheel_tag, sequence)
+        super().destroy()
+
+    def set_count(self, count: int):
+        """Set the number of rows and rebind every visible card"""
+        for index in list(self._bound):
+            self._release(index)
+        self.count = count
+        self.canvas.configure(scrollregion=(0, 0, self._width, count * self.row_height))
+        self._render()
+
+    def refresh(self):
+        """Rebind the visible cards (after the rows' data changed)"""
+        for index, (_, card, _) in self._bound.items():
+            self.bind_card(card, index)
+
+    def visible_cards(self) -> List[Any]:
+        """Cards currently bound to a row"""
+        return [card for _, card, _ in self._bound.values()]
+
+    def pool_size(self) -> int:
+        """Number of card widgets created so far"""
+        return len(self._bound) + sum(len(cards) for cards in self._free.values())
+
+    def _visible_range(self) -> range:
+        """Rows in the viewport plus overscan"""
+        height = self.canvas.winfo_height()
+        top = self.canvas.canvasy(0)
+        first = max(0, int(top // self.row_height) - self.overscan)
+        last = min(self.count, int((top + height) // self.row_height) + 1 + self.overscan)
+        return range(first, last)
+
+    def _render(self):
+        """Release cards that left the viewport and bind cards for rows that entered it"""
+        if self.canvas.winfo_height() <= 1:
+            return  # not mapped yet, <Configure> renders
+        visible = self._visible_range()
+        for index in [index for index in self._bound if index not in visible]:
+            self._release(index)
+        for index in visible:
+            if index not in self._bound:
+                self._place(index)
+
+    def _place(self, index: int):
+        """Show row index in a pooled (or new) card"""
+        kind = self.kind_of(index)
+        pool = self._free.setdefault(kind, [])
+        if pool:
+            card, item = pool.pop()
+        else:
+            card = self.create_card(self.canvas, kind)
+            item = self.canvas.create_window(self.padx, self.HIDDEN_Y, window=card, anchor="nw",
+                                             width=self._card_width(), height=self.row_height - self.gap)
+        self.bind_card(card, index)
+        self._add_wheel_tag(card)  # bind_card may have added widgets
+        self.canvas.coords(item, self.padx, index * self.row_height + self.gap // 2)
+        self._bound[index] = (kind, card, item)
+
+    def _release(self, index: int):
+        """Park the card of row index off-screen for reuse"""
+        kind, card, item = self._bound.pop(index)
+        self.canvas.coords(item, self.padx, self.HIDDEN_Y)
+        self._free.setdefault(kind, []).append((card, item))
+
+    def _add_wheel_tag(self, widget):
+        """Scroll the list with the wheel over widget and its descendants"""
+        tags = tk.Misc.bindtags(widget)
+        if self._wheel_tag not in tags:
+            tk.Misc.bindtags(widget, (self._wheel_tag,) + tags)
+        for child in tk.Misc.winfo_children(widget):
+            self._add_wheel_tag(child)
+
+    def _card_width(self) -> int:
+        """Card width for the current canvas width"""
+        return max(1, self._width - 2 * self.padx)
+
+    def _on_resize(self, event):
+        """Stretch cards to the canvas width and fill a taller viewport"""
+        self._width = event.width
+        width = self._card_width()
+        for _, _, item in self._bound.values():
+            self.canvas.itemconfigure(item, width=width)
+        for cards in self._free.values():
+            for _, item in cards:
+                self.canvas.itemconfigure(item, width=width)
+        self.canvas.configure(scrollregion=(0, 0, self._width, self.count * self.row_height))
+        self._render()
+
+    def _on_view_change(self, first, last):
+        """Canvas scrolled: update the scrollbar and the rendered rows"""
+        self.scrollbar.set(first, last)
+        self._render()
+
+    def _on_mousewheel(self, event):
+        """Scroll with the wheel while the pointer is over the list"""
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        elif sys.platform == "darwin":
+            step = -event.delta
+        else:
+            step = -int(event.delta / 120)
+        self.canvas.yview_scroll(step, "units")